@@ -16,6 +16,7 @@ from ssz.utils import (
 
 NUM_CHUNKS = 1000000
 NUM_UPDATES = 100
+NUM_APPENDED_CHUNKS = 10000
 
 
 def get_random_chunk():
@@ -34,6 +35,7 @@ if __name__ == "__main__":
     with benchmark(f"Preparing {NUM_CHUNKS} chunks"):
         chunks = [get_random_chunk() for _ in range(NUM_CHUNKS)]
         update_indices = random.sample(list(range(NUM_CHUNKS)), NUM_UPDATES)
+        appended_chunks = [get_random_chunk() for _ in range(NUM_APPENDED_CHUNKS)]
 
     print()
     print("-- Merkleize --")
@@ -66,3 +68,7 @@ if __name__ == "__main__":
 
         updated_hash_tree = hash_tree.mset(*updates)
         updated_hash_tree.root
+
+    with benchmark(f"Extend by {NUM_APPENDED_CHUNKS} chunks and root access"):
+        extended_hash_tree = hash_tree.extend(appended_chunks)
+        extended_hash_tree.root
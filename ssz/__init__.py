@@ -8,12 +8,17 @@ from .cache import (
 from .codec import (
     decode,
     encode,
+    encode_into,
+    encode_to,
 )
 from .exceptions import (
     DeserializationError,
     SerializationError,
     SSZException,
 )
+from .lazy import (
+    decode_lazy,
+)
 from .sedes import (
     BaseSedes,
     BasicSedes,
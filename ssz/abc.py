@@ -5,6 +5,7 @@ from abc import (
 from collections.abc import (
     Iterable,
     Iterator,
+    Sequence,
 )
 from typing import (
     Any,
@@ -38,6 +39,8 @@ class HashableStructureAPI(ABC, Generic[TElement]):
         iterable: Iterable[TElement],
         sedes: BaseProperCompositeSedes,
         max_length: int | None,
+        lazy: bool = False,
+        chunks_only: bool = False,
     ):
         ...
 
@@ -110,6 +113,19 @@ class HashableStructureAPI(ABC, Generic[TElement]):
     ) -> "HashableStructureEvolverAPI[TStructure, TElement]":
         ...
 
+    #
+    # Bulk updates
+    #
+    @abstractmethod
+    def apply_updates(
+        self: TStructure, indices: Sequence[int], values: Sequence[TElement]
+    ) -> TStructure:
+        ...
+
+    @abstractmethod
+    def replace_all(self: TStructure, values: Sequence[TElement]) -> TStructure:
+        ...
+
 
 class ResizableHashableStructureAPI(HashableStructureAPI[TElement]):
     @abstractmethod
@@ -128,6 +144,18 @@ class ResizableHashableStructureAPI(HashableStructureAPI[TElement]):
     def __mul__(self: TStructure, times: int) -> TStructure:
         ...
 
+    @abstractmethod
+    def truncate(self: TStructure, length: int) -> TStructure:
+        ...
+
+    @abstractmethod
+    def delete(self: TStructure, index: int, stop: int | None = None) -> TStructure:
+        ...
+
+    @abstractmethod
+    def remove(self: TStructure, value: TElement) -> TStructure:
+        ...
+
     @abstractmethod
     def evolver(
         self: TStructure,
@@ -175,3 +203,19 @@ class ResizableHashableStructureEvolverAPI(
     @abstractmethod
     def extend(self, iterable: Iterable[TElement]) -> None:
         ...
+
+    @abstractmethod
+    def truncate(self, length: int) -> None:
+        ...
+
+    @abstractmethod
+    def pop(self) -> TElement:
+        ...
+
+    @abstractmethod
+    def delete(self, index: int, stop: int | None = None) -> None:
+        ...
+
+    @abstractmethod
+    def __delitem__(self, index: int) -> None:
+        ...
@@ -0,0 +1,174 @@
+from collections.abc import (
+    Iterable,
+    Iterator,
+    Sequence,
+)
+from typing import (
+    Any,
+)
+
+
+class Bitfield(Sequence[bool]):
+    """
+    An immutable sequence of bits, as (de)serialized by
+    :class:`ssz.sedes.Bitlist` and :class:`ssz.sedes.Bitvector`.
+
+    The bits are stored in a single integer, bit `i` of the sequence being bit `i` of
+    the integer. Serialization, merging with `|` and `&`, counting the set bits and
+    subset checks therefore operate on all bits at once instead of one bool at a time.
+
+    Bitfields compare equal to and hash like tuples of the same bools, so they can be
+    used wherever such tuples were used before.
+
+    .. doctest::
+
+        >>> from ssz.bitfield import Bitfield
+        >>> bitfield = Bitfield.from_bools((True, False, True))
+        >>> bitfield | Bitfield.from_bools((False, True, False))
+        Bitfield(bits=0b111, length=3)
+        >>> bitfield.bit_count()
+        2
+        >>> bitfield.to_bytes()
+        b'\\x05'
+    """
+
+    __slots__ = ("_bits", "_length", "_hash")
+
+    def __init__(self, bits: int, length: int) -> None:
+        if length < 0:
+            raise ValueError(f"Bitfield length cannot be negative, got {length}")
+        if not 0 <= bits < 1 << length:
+            raise ValueError(f"Bits {bits:#b} do not fit into {length} bits")
+
+        self._bits = bits
+        self._length = length
+        self._hash: int | None = None
+
+    @classmethod
+    def from_bools(cls, values: Iterable[bool]) -> "Bitfield":
+        values = tuple(values)
+        bits = int(
+            "".join("1" if value else "0" for value in reversed(values)) or "0", 2
+        )
+        return cls(bits, len(values))
+
+    @classmethod
+    def from_bytes(cls, data: bytes, length: int) -> "Bitfield":
+        """
+        Read `length` bits from little endian `data`, ignoring any bits beyond them.
+        """
+        if len(data) * 8 < length:
+            raise ValueError(f"Cannot read {length} bits from {len(data)} bytes")
+        bits = int.from_bytes(data, "little") & ((1 << length) - 1)
+        return cls(bits, length)
+
+    @property
+    def bits(self) -> int:
+        """The bits of the sequence as an integer."""
+        return self._bits
+
+    def to_bytes(self) -> bytes:
+        """The bits packed into little endian bytes, padded with zero bits."""
+        return self._bits.to_bytes((self._length + 7) // 8, "little")
+
+    #
+    # Sequence interface
+    #
+    def __len__(self) -> int:
+        return self._length
+
+    def __getitem__(self, index):
+        if isinstance(index, slice):
+            start, stop, step = index.indices(self._length)
+            if step != 1:
+                return Bitfield.from_bools(tuple(self)[index])
+            length = max(stop - start, 0)
+            return Bitfield((self._bits >> start) & ((1 << length) - 1), length)
+
+        if index < 0:
+            index += self._length
+        if not 0 <= index < self._length:
+            raise IndexError(f"Index out of bounds: {index}")
+        return bool(self._bits >> index & 1)
+
+    def __iter__(self) -> Iterator[bool]:
+        binary = format(self._bits, f"0{self._length}b") if self._length else ""
+        return (digit == "1" for digit in reversed(binary))
+
+    def set(self, index: int, value: bool = True) -> "Bitfield":
+        """Return a copy with the bit at `index` set to `value`."""
+        if index < 0:
+            index += self._length
+        if not 0 <= index < self._length:
+            raise IndexError(f"Index out of bounds: {index}")
+
+        if value:
+            return Bitfield(self._bits | 1 << index, self._length)
+        else:
+            return Bitfield(self._bits & ~(1 << index), self._length)
+
+    #
+    # Bitwise operations
+    #
+    def bit_count(self) -> int:
+        """The number of set bits."""
+        return self._bits.bit_count()
+
+    def __or__(self, other: "Bitfield") -> "Bitfield":
+        self._validate_same_length(other)
+        return Bitfield(self._bits | other._bits, self._length)
+
+    def __and__(self, other: "Bitfield") -> "Bitfield":
+        self._validate_same_length(other)
+        return Bitfield(self._bits & other._bits, self._length)
+
+    def __xor__(self, other: "Bitfield") -> "Bitfield":
+        self._validate_same_length(other)
+        return Bitfield(self._bits ^ other._bits, self._length)
+
+    def issubset(self, other: "Bitfield") -> bool:
+        """Whether all bits set in this bitfield are set in `other` as well."""
+        self._validate_same_length(other)
+        return self._bits & ~other._bits == 0
+
+    def isdisjoint(self, other: "Bitfield") -> bool:
+        """Whether no bit is set in both bitfields."""
+        self._validate_same_length(other)
+        return self._bits & other._bits == 0
+
+    def _validate_same_length(self, other: "Bitfield") -> None:
+        if not isinstance(other, Bitfield):
+            raise TypeError(f"Expected a Bitfield, got {type(other)}")
+        if other._length != self._length:
+            raise ValueError(
+                f"Bitfields have different lengths: {self._length} and {other._length}"
+            )
+
+    #
+    # Equality and hashing
+    #
+    def __eq__(self, other: Any) -> bool:
+        if isinstance(other, Bitfield):
+            return self._length == other._length and self._bits == other._bits
+        elif isinstance(other, Sequence) and not isinstance(other, (str, bytes)):
+            return len(other) == self._length and tuple(other) == tuple(self)
+        else:
+            return NotImplemented
+
+    def __hash__(self) -> int:
+        # consistent with the hash of an equal tuple of bools
+        if self._hash is None:
+            self._hash = hash(tuple(self))
+        return self._hash
+
+    def __repr__(self) -> str:
+        return f"{self.__class__.__name__}(bits={self._bits:#b}, length={self._length})"
+
+    def __reduce__(self) -> tuple[Any, ...]:
+        return (self.__class__, (self._bits, self._length))
+
+    def __copy__(self) -> "Bitfield":
+        return self
+
+    def __deepcopy__(self, memo: dict[int, Any]) -> "Bitfield":
+        return self
@@ -1,3 +1,10 @@
 from .cache import (
+    MerkleCache,
     SSZCache,
+    get_shared_merkle_cache,
+    set_shared_merkle_cache,
+)
+from .memo import (
+    BoundedMemo,
+    MemoStats,
 )
@@ -55,3 +55,89 @@ class SSZCache(MM):
     @property
     def cache_size(self) -> int:
         return self._cache_size
+
+
+DEFAULT_MERKLE_CACHE_MAX_BYTES = 2**26
+MERKLE_CACHE_INITIAL_BYTES = 2**16
+# a merkle node is cached under the 64 byte concatenation of its children
+MERKLE_NODE_ENTRY_SIZE = 96
+# the parents of pairs of chunks are rarely hashed twice, so they are not cached
+DEFAULT_MERKLE_CACHE_MIN_HEIGHT = 2
+
+
+class MerkleCache(LRU):
+    """
+    A least recently used cache of merkle nodes with a memory budget.
+
+    The budget is accounted in entries of :data:`MERKLE_NODE_ENTRY_SIZE` bytes. It
+    starts small and grows to fit the largest tree merkleized with the cache (see
+    :meth:`reserve`), up to ``max_bytes``. Nodes lower than ``min_height`` in their
+    tree are not admitted, as the pairs of chunks close to the leaves are rarely
+    hashed twice. By default, the nodes directly above the chunks, at height 1, are
+    left out. Lookups with :meth:`get` are counted in :attr:`hits` and
+    :attr:`misses`.
+    """
+
+    def __init__(
+        self,
+        max_bytes: int = DEFAULT_MERKLE_CACHE_MAX_BYTES,
+        min_height: int = DEFAULT_MERKLE_CACHE_MIN_HEIGHT,
+    ) -> None:
+        if max_bytes < MERKLE_NODE_ENTRY_SIZE:
+            raise ValueError(
+                f"Cache budget must fit at least one node, got {max_bytes} bytes"
+            )
+        if min_height < 1:
+            raise ValueError(f"Minimum node height must be positive, got {min_height}")
+        super().__init__(
+            min(MERKLE_CACHE_INITIAL_BYTES, max_bytes) // MERKLE_NODE_ENTRY_SIZE
+        )
+        self.max_bytes = max_bytes
+        self.min_height = min_height
+
+    def reserve(self, chunk_count: int) -> None:
+        """
+        Grow the budget to fit all nodes of a tree with the given number of chunks.
+        """
+        max_size = self.max_bytes // MERKLE_NODE_ENTRY_SIZE
+        size = min(max(self.get_size(), 2 * chunk_count), max_size)
+        if size != self.get_size():
+            self.set_size(size)
+
+    def __reduce__(self) -> tuple[type["MerkleCache"], tuple[int, int]]:
+        # the cached nodes can be recomputed, so only the configuration is pickled
+        return self.__class__, (self.max_bytes, self.min_height)
+
+    @property
+    def budget(self) -> int:
+        return self.get_size() * MERKLE_NODE_ENTRY_SIZE
+
+    @property
+    def hits(self) -> int:
+        return self.get_stats()[0]
+
+    @property
+    def misses(self) -> int:
+        return self.get_stats()[1]
+
+
+_shared_merkle_cache: MerkleCache | None = None
+
+
+def set_shared_merkle_cache(cache: MerkleCache | None) -> None:
+    """
+    Share `cache` among all serializable values that were not given a cache of
+    their own.
+
+    Cached nodes are keyed by their content, so they can be reused across values,
+    and the budget of `cache` bounds the memory used for all of them together.
+    Passing `None` gives each value its own cache again, allocated the first time the
+    value is hashed, which is the default.
+    """
+    global _shared_merkle_cache
+    _shared_merkle_cache = cache
+
+
+def get_shared_merkle_cache() -> MerkleCache | None:
+    """Return the cache set with :func:`set_shared_merkle_cache`, if any."""
+    return _shared_merkle_cache
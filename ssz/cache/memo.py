@@ -0,0 +1,200 @@
+from collections.abc import (
+    Callable,
+    Hashable,
+)
+import functools
+import threading
+from typing import (
+    Any,
+    Generic,
+    NamedTuple,
+    TypeVar,
+)
+
+from lru import (
+    LRU,
+)
+
+DEFAULT_MEMO_MAX_BYTES = 2**24
+DEFAULT_MEMO_MAX_ENTRY_BYTES = 2**16
+# rough size of a Python object without its data, e.g. of a bytes object
+OBJECT_OVERHEAD = 64
+
+TArg = TypeVar("TArg", bound=Hashable)
+TResult = TypeVar("TResult")
+
+
+class MemoStats(NamedTuple):
+    hits: int
+    misses: int
+    evictions: int
+    # calls with arguments too large to be memoized
+    bypasses: int
+    entries: int
+    size: int
+    max_size: int
+
+
+def get_bytes_size(data: bytes) -> int:
+    """Estimate the memory used by a byte string."""
+    return len(data) + OBJECT_OVERHEAD
+
+
+def get_bytes_sequence_size(values: tuple[bytes, ...]) -> int:
+    """Estimate the memory used by a tuple of byte strings."""
+    return sum(len(value) for value in values) + (len(values) + 1) * OBJECT_OVERHEAD
+
+
+def get_tuple_size(values: tuple[Any, ...]) -> int:
+    """Estimate the memory used by a tuple of shared objects, such as bools."""
+    return 8 * len(values) + OBJECT_OVERHEAD
+
+
+class BoundedMemo(Generic[TArg, TResult]):
+    """
+    Memoize a function of one argument in a least recently used cache that is bounded
+    by the estimated memory of the arguments and results it holds, instead of by
+    their number.
+
+    Calls with an argument larger than `max_entry_bytes` bypass the cache, they are
+    neither looked up nor stored. The cache can be disabled, cleared and resized at
+    runtime.
+
+    The memo can be shared between threads. Its entries are guarded by a lock, but
+    the function itself is called without holding it, so a value missing in several
+    threads at once may be computed more than once.
+    """
+
+    def __init__(
+        self,
+        function: Callable[[TArg], TResult],
+        get_arg_size: Callable[[TArg], int],
+        get_result_size: Callable[[TResult], int],
+        max_bytes: int = DEFAULT_MEMO_MAX_BYTES,
+        max_entry_bytes: int = DEFAULT_MEMO_MAX_ENTRY_BYTES,
+    ) -> None:
+        validate_memo_size(max_bytes, max_entry_bytes)
+
+        functools.update_wrapper(self, function)
+        self._function = function
+        self._get_arg_size = get_arg_size
+        self._get_result_size = get_result_size
+        self._max_bytes = max_bytes
+        self._max_entry_bytes = max_entry_bytes
+        self._enabled = True
+
+        self._lock = threading.Lock()
+        self._entries = LRU(get_max_entry_count(max_bytes))
+        self._size = 0
+        self._evictions = 0
+        self._bypasses = 0
+
+    def __call__(self, arg: TArg) -> TResult:
+        if not self._enabled:
+            return self._function(arg)
+
+        arg_size = self._get_arg_size(arg)
+        if arg_size > self._max_entry_bytes:
+            with self._lock:
+                self._bypasses += 1
+            return self._function(arg)
+
+        with self._lock:
+            entry = self._entries.get(arg)
+        if entry is not None:
+            return entry[0]
+
+        result = self._function(arg)
+        # every entry counts as at least one byte, see `get_max_entry_count`
+        entry_size = max(arg_size + self._get_result_size(result), 1)
+        with self._lock:
+            if entry_size <= self._max_entry_bytes and arg not in self._entries:
+                self._entries[arg] = (result, entry_size)
+                self._size += entry_size
+                self._evict(self._max_bytes)
+        return result
+
+    def _evict(self, max_bytes: int) -> None:
+        # must be called with the lock held
+        while self._size > max_bytes and len(self._entries) > 0:
+            _, (_, entry_size) = self._entries.popitem(least_recent=True)
+            self._size -= entry_size
+            self._evictions += 1
+
+    #
+    # Configuration
+    #
+    @property
+    def enabled(self) -> bool:
+        return self._enabled
+
+    def enable(self) -> None:
+        self._enabled = True
+
+    def disable(self) -> None:
+        """Stop memoizing and drop all entries."""
+        self._enabled = False
+        self.clear()
+
+    def resize(self, max_bytes: int, max_entry_bytes: int | None = None) -> None:
+        """Change the budget, evicting the least recently used entries if needed."""
+        if max_entry_bytes is None:
+            max_entry_bytes = min(self._max_entry_bytes, max_bytes)
+        validate_memo_size(max_bytes, max_entry_bytes)
+
+        with self._lock:
+            self._max_bytes = max_bytes
+            self._max_entry_bytes = max_entry_bytes
+            self._evict(max_bytes)
+            self._entries.set_size(get_max_entry_count(max_bytes))
+
+    def clear(self) -> None:
+        with self._lock:
+            self._entries.clear()
+            self._size = 0
+
+    @property
+    def stats(self) -> MemoStats:
+        with self._lock:
+            hits, misses = self._entries.get_stats()
+            return MemoStats(
+                hits=hits,
+                misses=misses,
+                evictions=self._evictions,
+                bypasses=self._bypasses,
+                entries=len(self._entries),
+                size=self._size,
+                max_size=self._max_bytes,
+            )
+
+
+def get_max_entry_count(max_bytes: int) -> int:
+    # as entries take at least one byte, the byte budget is always exhausted before
+    # the entry count of the underlying cache
+    return max(max_bytes, 1)
+
+
+def validate_memo_size(max_bytes: int, max_entry_bytes: int) -> None:
+    if max_bytes < 0:
+        raise ValueError(f"Memo size cannot be negative, got {max_bytes}")
+    if not 0 <= max_entry_bytes <= max_bytes:
+        raise ValueError(
+            f"Maximum entry size must be between 0 and the memo size {max_bytes}, "
+            f"got {max_entry_bytes}"
+        )
+
+
+def bounded_memo(
+    get_arg_size: Callable[[Any], int],
+    get_result_size: Callable[[Any], int],
+    max_bytes: int = DEFAULT_MEMO_MAX_BYTES,
+    max_entry_bytes: int = DEFAULT_MEMO_MAX_ENTRY_BYTES,
+) -> Callable[[Callable[[TArg], TResult]], BoundedMemo[TArg, TResult]]:
+    """Decorate a function of one argument with a :class:`BoundedMemo`."""
+
+    def decorator(function: Callable[[TArg], TResult]) -> BoundedMemo[TArg, TResult]:
+        return BoundedMemo(
+            function, get_arg_size, get_result_size, max_bytes, max_entry_bytes
+        )
+
+    return decorator
@@ -1,7 +1,7 @@
 from collections.abc import (
     Iterable,
 )
-import functools
+import hashlib
 from typing import (
     Any,
 )
@@ -13,6 +13,16 @@ from eth_utils import (
     to_tuple,
 )
 
+from ssz.hash import (
+    HASH_SIZE,
+)
+from ssz.hashable_structure import (
+    BaseHashableStructure,
+)
+from ssz.parallel import (
+    compute_element_roots,
+    resolve_executor,
+)
 from ssz.sedes.base import (
     TSedes,
 )
@@ -20,17 +30,33 @@ from ssz.typing import (
     CacheObj,
 )
 
+# prefixes which keep the different kinds of keys apart, e.g. a short serialization
+# from the digest of a longer one, or from the root of a hashable structure
+RAW_KEY_PREFIX = "r:"
+DIGEST_KEY_PREFIX = "d:"
+ROOT_KEY_PREFIX = "h:"
+
 
 def get_key(sedes, value: Any) -> str:
-    key = get_base_key(sedes, value).hex()
-    if len(key) == 0:
-        key = ""
-    return f"{sedes.get_sedes_id()}{key}"
+    if isinstance(value, BaseHashableStructure) and value.sedes is sedes:
+        # the root of a hashable structure is kept up to date by its hash tree and
+        # identifies the value without serializing it
+        return f"{sedes.get_sedes_id()}{ROOT_KEY_PREFIX}{value.hash_tree_root.hex()}"
+    return f"{sedes.get_sedes_id()}{get_digest_key(sedes.serialize(value))}"
 
 
-@functools.lru_cache(maxsize=2**12)
-def get_base_key(sedes: TSedes, value: Any) -> bytes:
-    return sedes.serialize(value)
+def get_digest_key(serialized: bytes) -> str:
+    """
+    Return a key of bounded size identifying a serialized value.
+
+    Serializations that are not longer than a hash are used as they are, longer ones
+    are replaced by their SHA-256 digest, so that keys do not grow with the values.
+    Both kinds of keys are prefixed differently, so that they never collide.
+    """
+    if len(serialized) <= HASH_SIZE:
+        return f"{RAW_KEY_PREFIX}{serialized.hex()}"
+    else:
+        return f"{DIGEST_KEY_PREFIX}{hashlib.sha256(serialized).hexdigest()}"
 
 
 @to_tuple
@@ -41,18 +67,49 @@ def get_merkle_leaves_without_cache(
         yield element_sedes.get_hash_tree_root(element)
 
 
-@to_tuple
 def get_merkle_leaves_with_cache(
     value: Any, element_sedes: TSedes, cache: CacheObj
-) -> Iterable[Hash32]:
+) -> tuple[Hash32, ...]:
     """
     Generate the merkle leaves for every element in `value`, from the cache.
 
+    If an executor is configured with :func:`ssz.parallel.set_executor`, the roots of
+    enough missing elements are computed with it.
+
     NOTE: cache will be mutated when any new merkle leaves are generated.
     """
-    for element in value:
-        key = element_sedes.get_key(element)
-        if key not in cache:
-            root, cache = element_sedes.get_hash_tree_root_and_leaves(element, cache)
-            cache[key] = root
-        yield cache[key]
+    keys = tuple(element_sedes.get_key(element) for element in value)
+    merkle_leaves = [cache.get(key) for key in keys]
+    missing_indices = tuple(
+        index for index, leaf in enumerate(merkle_leaves) if leaf is None
+    )
+
+    executor = resolve_executor(len(missing_indices))
+    if executor is not None:
+        # equal elements share their key, so each of them is only sent once
+        missing_keys = {keys[index]: index for index in reversed(missing_indices)}
+        elements = tuple(value)
+        missing_roots = compute_element_roots(
+            (elements[index] for index in missing_keys.values()),
+            element_sedes,
+            executor,
+        )
+        computed_roots = dict(zip(missing_keys, missing_roots))
+        cache.update(computed_roots)
+        for index in missing_indices:
+            merkle_leaves[index] = computed_roots[keys[index]]
+    else:
+        for index, element in enumerate(value):
+            if merkle_leaves[index] is not None:
+                continue
+            key = keys[index]
+            if key in cache:
+                # an equal element earlier in the sequence
+                merkle_leaves[index] = cache[key]
+            else:
+                root, cache = element_sedes.get_hash_tree_root_and_leaves(
+                    element, cache
+                )
+                cache[key] = merkle_leaves[index] = root
+
+    return tuple(merkle_leaves)
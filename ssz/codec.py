@@ -9,15 +9,16 @@ from ssz.sedes import (
 from ssz.sedes.base import (
     BaseSedes,
 )
+from ssz.sedes.basic import (
+    deserialize_element,
+)
 
 
-def encode(value, sedes=None):
+def resolve_sedes(value, sedes=None):
     """
-    Encode object in SSZ format.
-    `sedes` needs to be explicitly mentioned for encode/decode
-    of integers(as of now).
-    `sedes` parameter could be given as a string or as the
-    actual sedes object itself.
+    Get the sedes object to encode a value with.
+    `sedes` can be given as a string, as the sedes object itself, or be
+    omitted, in which case it is inferred from the value.
     """
     if sedes is not None:
         if sedes in sedes_by_name:
@@ -32,15 +33,75 @@ def encode(value, sedes=None):
     else:
         sedes_obj = infer_sedes(value)
 
-    return sedes_obj.serialize(value)
+    return sedes_obj
+
+
+def encode(value, sedes=None):
+    """
+    Encode object in SSZ format.
+    `sedes` needs to be explicitly mentioned for encode/decode
+    of integers(as of now).
+    `sedes` parameter could be given as a string or as the
+    actual sedes object itself.
+    """
+    return resolve_sedes(value, sedes).serialize(value)
+
+
+def encode_into(value, sedes, buffer, offset=0):
+    """
+    Encode object in SSZ format directly into a writable buffer, starting at
+    `offset`, and return the number of bytes written.
+    The size of the encoding is computed first and the buffer must be large
+    enough to hold it. The encoding is written piece by piece, so no complete
+    copy of it is created in the process.
+    """
+    sedes_obj = resolve_sedes(value, sedes)
+    size = sedes_obj.get_serialized_size(value)
+
+    view = memoryview(buffer).cast("B")
+    if view.readonly:
+        raise TypeError("Cannot encode into read only buffer")
+    if not 0 <= offset <= len(view) - size:
+        raise ValueError(
+            f"Encoding of {size} bytes does not fit into buffer of {len(view)} bytes "
+            f"at offset {offset}"
+        )
+
+    position = offset
+    for part in sedes_obj.serialize_parts(value):
+        view[position : position + len(part)] = part
+        position += len(part)
+
+    if position != offset + size:
+        raise Exception("Invariant: Encoding has the precomputed size")
+    return size
+
+
+def encode_to(value, sedes, writable):
+    """
+    Encode object in SSZ format and write it piece by piece to a file-like
+    object, returning the number of bytes written.
+    The complete encoding is never held in memory. As many small pieces may be
+    written, `writable` should be buffered.
+    """
+    sedes_obj = resolve_sedes(value, sedes)
+
+    size = 0
+    for part in sedes_obj.serialize_parts(value):
+        writable.write(part)
+        size += len(part)
+    return size
 
 
-def decode(ssz, sedes):
+def decode(ssz, sedes, hashable=True):
     """
     Decode a SSZ encoded object.
+    Lists and vectors are decoded to hashable structures, unless `hashable` is
+    false. Then they are decoded to plain tuples and no hash trees are created.
+    `ssz` may also be a memoryview, which is decoded without copying it first.
     """
-    if not is_bytes(ssz):
+    if not is_bytes(ssz) and not isinstance(ssz, memoryview):
         raise TypeError(f"Can only decode SSZ bytes, got type {type(ssz).__name__}")
 
-    value = sedes.deserialize(ssz)
+    value = deserialize_element(sedes, ssz, hashable)
     return value
@@ -1,12 +1,26 @@
-import functools
+from collections.abc import (
+    Callable,
+)
 import hashlib
 
 from eth_typing import (
     Hash32,
 )
 
+from ssz.cache.memo import (
+    bounded_memo,
+    get_bytes_size,
+)
+
+HASH_SIZE = 32
+PAIR_SIZE = 2 * HASH_SIZE
+
+HashPairsFn = Callable[[bytes], bytes]
+
 
-@functools.lru_cache(maxsize=2**12)
+@bounded_memo(
+    get_bytes_size, get_bytes_size, max_bytes=2**20, max_entry_bytes=2**12
+)
 def hash_eth2(data: bytes) -> Hash32:
     """
     Return SHA-256 hashed result.
@@ -14,3 +28,84 @@ def hash_eth2(data: bytes) -> Hash32:
     in a future Ethereum 2.0 deployment phase.
     """
     return Hash32(hashlib.sha256(data).digest())
+
+
+def hashlib_hash_pairs(data: bytes) -> bytes:
+    """
+    Hash each 64 byte pair in `data` with SHA-256 using :mod:`hashlib`.
+
+    This is the default backend of :func:`hash_pairs`.
+    """
+    view = memoryview(data)
+    sha256 = hashlib.sha256
+    return b"".join(
+        sha256(view[start : start + PAIR_SIZE]).digest()
+        for start in range(0, len(view), PAIR_SIZE)
+    )
+
+
+DEFAULT_HASH_BACKEND = "hashlib"
+
+_hash_backends: dict[str, HashPairsFn] = {DEFAULT_HASH_BACKEND: hashlib_hash_pairs}
+_active_hash_pairs: HashPairsFn = hashlib_hash_pairs
+_active_hash_backend = DEFAULT_HASH_BACKEND
+
+
+def register_hash_backend(name: str, hash_pairs_fn: HashPairsFn) -> None:
+    """
+    Make a batch hash implementation available under the given name.
+
+    `hash_pairs_fn` receives a buffer of N * 64 bytes and has to return the N
+    concatenated 32 byte SHA-256 digests of the pairs. Registering a backend does not
+    activate it, use :func:`set_hash_backend` for that.
+    """
+    if name in _hash_backends:
+        raise ValueError(f"Hash backend {name} is already registered")
+    _hash_backends[name] = hash_pairs_fn
+
+
+def set_hash_backend(name: str) -> None:
+    """Select the registered backend used by :func:`hash_pairs`."""
+    global _active_hash_pairs, _active_hash_backend
+
+    try:
+        hash_pairs_fn = _hash_backends[name]
+    except KeyError:
+        raise ValueError(
+            f"Unknown hash backend {name}, available backends are: "
+            f"{', '.join(sorted(_hash_backends))}"
+        )
+
+    _active_hash_pairs = hash_pairs_fn
+    _active_hash_backend = name
+
+
+def get_hash_backend() -> str:
+    """Return the name of the backend currently used by :func:`hash_pairs`."""
+    return _active_hash_backend
+
+
+def get_hash_backends() -> tuple[str, ...]:
+    """Return the names of all registered backends."""
+    return tuple(sorted(_hash_backends))
+
+
+def hash_pairs(data: bytes) -> bytes:
+    """
+    Hash a contiguous buffer of 64 byte pairs at once.
+
+    The result is the concatenation of the 32 byte SHA-256 digest of every pair, in
+    order. The length of `data` must be a multiple of 64.
+
+    .. doctest::
+
+        >>> from ssz.hash import hash_eth2, hash_pairs
+        >>> pairs = b"\\x00" * 64 + b"\\x01" * 64
+        >>> hash_pairs(pairs) == hash_eth2(pairs[:64]) + hash_eth2(pairs[64:])
+        True
+    """
+    if len(data) % PAIR_SIZE != 0:
+        raise ValueError(
+            f"Data length must be a multiple of {PAIR_SIZE}, got {len(data)}"
+        )
+    return _active_hash_pairs(data)
@@ -1,6 +1,9 @@
 from collections.abc import (
+    Callable,
     Generator,
     Iterable,
+    Mapping,
+    Sequence,
 )
 from functools import (
     partial,
@@ -11,6 +14,7 @@ from numbers import (
 )
 from typing import (
     Any,
+    Union,
 )
 
 # `transform` comes from a non-public API which is considered stable, but future changes
@@ -21,11 +25,8 @@ from eth_typing import (
     Hash32,
 )
 from eth_utils.toolz import (
-    drop,
-    iterate,
     partition,
     pipe,
-    take,
 )
 from pyrsistent import (
     pmap,
@@ -43,14 +44,19 @@ from ssz.constants import (
     ZERO_HASHES,
 )
 from ssz.hash import (
-    hash_eth2,
+    HASH_SIZE,
+    hash_pairs,
+)
+from ssz.hash_tree_layer import (
+    FlatLayer,
 )
 from ssz.utils import (
     get_next_power_of_two,
 )
 
-RawHashTreeLayer = PVector[Hash32]
+RawHashTreeLayer = Union[PVector[Hash32], FlatLayer]
 RawHashTree = PVector[RawHashTreeLayer]
+RawHashTreeUpdate = Callable[[RawHashTree], RawHashTree]
 
 
 def validate_chunk_count(chunk_count: int | None) -> None:
@@ -59,21 +65,27 @@ def validate_chunk_count(chunk_count: int | None) -> None:
             raise ValueError(f"Chunk count is not positive: {chunk_count}")
 
 
-def validate_raw_hash_tree(
-    raw_hash_tree: RawHashTree, chunk_count: int | None = None
+def validate_chunk_layer(
+    chunks: RawHashTreeLayer, chunk_count: int | None = None
 ) -> None:
-    if len(raw_hash_tree) == 0:
-        raise ValueError("Hash tree is empty")
-
-    if len(raw_hash_tree[0]) == 0:
+    if len(chunks) == 0:
         raise ValueError("Hash tree contains zero chunks")
 
-    if chunk_count is not None and len(raw_hash_tree[0]) > chunk_count:
+    if chunk_count is not None and len(chunks) > chunk_count:
         raise ValueError(
-            f"Hash tree contains {len(raw_hash_tree[0])} chunks which exceeds chunk "
+            f"Hash tree contains {len(chunks)} chunks which exceeds chunk "
             f"count {chunk_count}"
         )
 
+
+def validate_raw_hash_tree(
+    raw_hash_tree: RawHashTree, chunk_count: int | None = None
+) -> None:
+    if len(raw_hash_tree) == 0:
+        raise ValueError("Hash tree is empty")
+
+    validate_chunk_layer(raw_hash_tree[0], chunk_count)
+
     if len(raw_hash_tree[-1]) != 1:
         raise ValueError(
             f"Hash tree root layer contains {len(raw_hash_tree[-1])} items instead of 1"
@@ -88,29 +100,143 @@ class HashTree(PVector[Hash32]):
         validate_raw_hash_tree(raw_hash_tree, chunk_count)
 
         self.chunk_count = chunk_count
-        self.raw_hash_tree = raw_hash_tree
+        self.is_lazy = False
+        self._chunks = raw_hash_tree[0]
+        self._raw_hash_tree: RawHashTree | None = raw_hash_tree
+        self._base_raw_hash_tree: RawHashTree | None = None
+        self._pending_updates: tuple[RawHashTreeUpdate, ...] = ()
+
+    @classmethod
+    def create_lazy(
+        cls,
+        chunks: RawHashTreeLayer,
+        chunk_count: int | None = None,
+        base_raw_hash_tree: RawHashTree | None = None,
+        pending_updates: Iterable[RawHashTreeUpdate] = (),
+    ) -> "HashTree":
+        """
+        Create a hash tree of which only the chunks are known so far.
+
+        The remaining layers are computed on first access, either by applying the
+        pending updates to the given base tree or, if there is none, from scratch.
+        """
+        validate_chunk_count(chunk_count)
+        validate_chunk_layer(chunks, chunk_count)
+
+        hash_tree = cls.__new__(cls)
+        hash_tree.chunk_count = chunk_count
+        hash_tree.is_lazy = True
+        hash_tree._chunks = chunks
+        hash_tree._raw_hash_tree = None
+        hash_tree._base_raw_hash_tree = base_raw_hash_tree
+        hash_tree._pending_updates = tuple(pending_updates)
+        return hash_tree
 
     @classmethod
     def compute(
-        cls, chunks: Iterable[Hash32], chunk_count: int | None = None
+        cls,
+        chunks: Iterable[Hash32],
+        chunk_count: int | None = None,
+        flat: bool = False,
+        lazy: bool = False,
     ) -> "HashTree":
-        raw_hash_tree = compute_hash_tree(chunks, chunk_count)
-        return cls(raw_hash_tree, chunk_count)
+        """
+        Compute the hash tree for the given chunks.
+
+        If `flat` is set (or the chunks are already given as a :class:`FlatLayer`),
+        all layers of the tree are stored as flat layers. Trees derived from such a
+        tree via updates keep this storage mode.
+
+        If `lazy` is set, no hashes are computed until the root or one of the layers
+        above the chunks is accessed. Updates of a lazy tree are recorded and applied
+        at that point as well, and trees derived from it are lazy too.
+        """
+        if lazy:
+            return cls.create_lazy(make_chunk_layer(chunks, flat), chunk_count)
+        else:
+            raw_hash_tree = compute_hash_tree(chunks, chunk_count, flat=flat)
+            return cls(raw_hash_tree, chunk_count)
+
+    @property
+    def raw_hash_tree(self) -> RawHashTree:
+        if self._raw_hash_tree is None:
+            if self._base_raw_hash_tree is None:
+                raw_hash_tree = compute_hash_tree(self._chunks, self.chunk_count)
+            else:
+                raw_hash_tree = pipe(self._base_raw_hash_tree, *self._pending_updates)
+
+            self._raw_hash_tree = raw_hash_tree
+            self._chunks = raw_hash_tree[0]
+            self._base_raw_hash_tree = None
+            self._pending_updates = ()
+
+        return self._raw_hash_tree
+
+    @property
+    def is_materialized(self) -> bool:
+        """Whether all layers of the tree have been computed."""
+        return self._raw_hash_tree is not None
 
     @property
     def chunks(self) -> RawHashTreeLayer:
-        return self.raw_hash_tree[0]
+        return self._chunks
 
     @property
     def root(self) -> Hash32:
         return self.raw_hash_tree[-1][0]
 
+    @property
+    def is_flat(self) -> bool:
+        return isinstance(self.chunks, FlatLayer)
+
+    def get_layer_buffer(self, layer_index: int) -> memoryview:
+        """
+        Return the hashes of a layer as one contiguous, read only buffer.
+
+        The buffer is a copy of the layer, it does not share memory with the tree.
+        Layer 0 contains the chunks, the last layer the root.
+        """
+        return memoryview(get_layer_bytes(self.raw_hash_tree[layer_index]))
+
     def transform(self, *transformations):
         return transform(self, transformations)
 
     def evolver(self):
         return HashTreeEvolver(self)
 
+    def derive(
+        self,
+        update_chunk_layer: Callable[[RawHashTreeLayer], RawHashTreeLayer],
+        update_raw_hash_tree: RawHashTreeUpdate,
+    ) -> "HashTree":
+        """
+        Create a new tree by applying an update to this one.
+
+        `update_chunk_layer` has to compute the new chunks from the current ones and
+        `update_raw_hash_tree` the whole new tree from the current one. For eager trees,
+        only the latter is called. Lazy trees only compute the new chunks and record the
+        update, unless the tree has not been hashed yet. In that case, the new tree is
+        computed from its chunks directly once needed.
+        """
+        if not self.is_lazy:
+            raw_hash_tree = update_raw_hash_tree(self.raw_hash_tree)
+            return self.__class__(raw_hash_tree, self.chunk_count)
+
+        chunks = update_chunk_layer(self.chunks)
+        if self._raw_hash_tree is not None:
+            base_raw_hash_tree = self._raw_hash_tree
+            pending_updates: tuple[RawHashTreeUpdate, ...] = (update_raw_hash_tree,)
+        elif self._base_raw_hash_tree is not None:
+            base_raw_hash_tree = self._base_raw_hash_tree
+            pending_updates = self._pending_updates + (update_raw_hash_tree,)
+        else:
+            base_raw_hash_tree = None
+            pending_updates = ()
+
+        return self.__class__.create_lazy(
+            chunks, self.chunk_count, base_raw_hash_tree, pending_updates
+        )
+
     #
     # Comparison
     #
@@ -180,18 +306,66 @@ class HashTree(PVector[Hash32]):
     def set(self, index: int, value: Hash32) -> "HashTree":
         return self.mset(index, value)
 
+    def update_chunks(self, updated_chunks: Mapping[int, Hash32]) -> "HashTree":
+        """
+        Replace the chunks at the indices of the given mapping.
+
+        Equivalent to :meth:`mset`, but without going through an evolver, which is
+        faster for many updates. Every affected layer is rehashed once.
+        """
+        if not updated_chunks:
+            return self
+
+        num_chunks = len(self)
+        for index in updated_chunks.keys():
+            if not 0 <= index < num_chunks:
+                raise IndexError(f"Index out of bounds: {index}")
+
+        return self.derive(
+            lambda chunks: chunks.mset(
+                *itertools.chain.from_iterable(updated_chunks.items())
+            ),
+            partial(update_chunks_in_tree, updated_chunks=updated_chunks),
+        )
+
     #
     # Removal of chunks
     #
+    def truncate(self, num_chunks: int) -> "HashTree":
+        """
+        Keep only the first `num_chunks` chunks.
+
+        Only the hashes on the new right edge of the tree are recomputed.
+        """
+        if not 1 <= num_chunks <= len(self):
+            raise ValueError(
+                f"Cannot truncate hash tree with {len(self)} chunks to {num_chunks}"
+            )
+        return self.derive(
+            lambda chunks: chunks[:num_chunks],
+            partial(truncate_tree, num_chunks=num_chunks, chunk_count=self.chunk_count),
+        )
+
     def delete(self, index: int, stop: int | None = None) -> "HashTree":
-        if stop is None:
-            stop = index + 1
-        chunks = self.chunks.delete(index, stop)
-        return self.__class__.compute(chunks, self.chunk_count)
+        """
+        Delete the chunk at `index` or, if given, all chunks in `[index, stop)`.
+
+        The part of the tree left of the deleted range is kept, only the hashes that
+        depend on the shifted chunks to the right of it are recomputed.
+        """
+        start, stop = normalize_deletion_range(index, stop, len(self))
+        if start == 0:
+            return self.__class__.compute(
+                self.chunks[stop:],
+                self.chunk_count,
+                flat=self.is_flat,
+                lazy=self.is_lazy,
+            )
+        else:
+            return self.truncate(start).extend(self.chunks[stop:])
 
     def remove(self, value: Hash32) -> "HashTree":
-        chunks = self.chunks.remove(value)
-        return self.__class__.compute(chunks, self.chunk_count)
+        return self.delete(self.index(value))
 
 
 class HashTreeEvolver:
@@ -259,16 +433,54 @@ class HashTreeEvolver:
             raise ValueError(f"Hash tree exceeds size chunk count {chunk_count}")
 
     #
-    # Not implemented
+    # Removal of chunks
     #
-    def delete(self, index, stop=None):
-        raise NotImplementedError()
+    def truncate(self, num_chunks: int) -> None:
+        num_original_chunks = len(self.original_hash_tree)
+        if not 1 <= num_chunks <= len(self):
+            raise ValueError(
+                f"Cannot truncate hash tree with {len(self)} chunks to {num_chunks}"
+            )
+
+        if num_chunks >= num_original_chunks:
+            self.appended_chunks = self.appended_chunks[
+                : num_chunks - num_original_chunks
+            ]
+        else:
+            # pending updates of the remaining chunks can be applied to the
+            # truncated tree, so there is no need to persist them first
+            self.appended_chunks = pvector()
+            self.updated_chunks = pmap(
+                (index, chunk)
+                for index, chunk in self.updated_chunks.items()
+                if index < num_chunks
+            )
+            self.original_hash_tree = self.original_hash_tree.truncate(num_chunks)
 
-    def __delitem__(self, index):
-        raise NotImplementedError()
+    def delete(self, index: int, stop: int | None = None) -> None:
+        start, stop = normalize_deletion_range(index, stop, len(self))
+        num_original_chunks = len(self.original_hash_tree)
 
-    def remove(self, value):
-        raise NotImplementedError()
+        if start >= num_original_chunks:
+            self.appended_chunks = self.appended_chunks.delete(
+                start - num_original_chunks, stop - num_original_chunks
+            )
+        elif stop == len(self):
+            self.truncate(start)
+        else:
+            self.original_hash_tree = self.persistent().delete(start, stop)
+            self.updated_chunks = pmap()
+            self.appended_chunks = pvector()
+
+    def __delitem__(self, index: int) -> None:
+        self.delete(index)
+
+    def remove(self, value: Hash32) -> None:
+        for index in range(len(self)):
+            if self[index] == value:
+                self.delete(index)
+                return
+        raise ValueError(f"{value!r} is not in hash tree")
 
     #
     # Persist
@@ -277,33 +489,80 @@ class HashTreeEvolver:
         if not self.is_dirty():
             return self.original_hash_tree
         else:
-            setters = (
-                partial(set_chunk_in_tree, index=index, chunk=chunk)
-                for index, chunk in self.updated_chunks.items()
-            )
-            appenders = (
-                partial(append_chunk_to_tree, chunk=chunk)
-                for chunk in self.appended_chunks
-            )
-            raw_hash_tree = pipe(
-                self.original_hash_tree.raw_hash_tree, *setters, *appenders
-            )
-            return self.original_hash_tree.__class__(
-                raw_hash_tree, self.original_hash_tree.chunk_count
+            updated_chunks = self.updated_chunks
+            appended_chunks = self.appended_chunks
+            return self.original_hash_tree.derive(
+                lambda chunks: chunks.mset(
+                    *itertools.chain.from_iterable(updated_chunks.items())
+                ).extend(appended_chunks),
+                lambda raw_hash_tree: pipe(
+                    raw_hash_tree,
+                    partial(update_chunks_in_tree, updated_chunks=updated_chunks),
+                    partial(append_chunks_to_tree, chunks=appended_chunks),
+                ),
             )
 
 
-def hash_layer(child_layer: RawHashTreeLayer, layer_index: int) -> RawHashTreeLayer:
-    if len(child_layer) % 2 == 0:
-        padded_child_layer = child_layer
+def normalize_deletion_range(
+    index: int, stop: int | None, length: int
+) -> tuple[int, int]:
+    """
+    Turn the arguments of a `delete(index, stop)` call into a non-empty `[start, stop)`
+    range of valid, non-negative indices.
+    """
+    if index < 0:
+        index += length
+    if not 0 <= index < length:
+        raise IndexError(f"Index out of bounds: {index}")
+
+    if stop is None:
+        stop = index + 1
+    elif stop < 0:
+        stop += length
+    stop = min(stop, length)
+    if stop <= index:
+        raise IndexError(f"Deletion range [{index}, {stop}) is empty")
+
+    return index, stop
+
+
+def get_layer_bytes(
+    layer: RawHashTreeLayer, start: int = 0, stop: int | None = None
+) -> bytes:
+    """Return the concatenated hashes of a layer in the range `[start, stop)`."""
+    if isinstance(layer, FlatLayer):
+        return layer.tobytes(start, stop)
     else:
-        padded_child_layer = child_layer.append(ZERO_HASHES[layer_index])
+        return b"".join(layer[start:stop])
 
-    child_pairs = partition(2, padded_child_layer)
-    parent_layer = pvector(
-        hash_eth2(left_child + right_child) for left_child, right_child in child_pairs
-    )
-    return parent_layer
+
+def make_layer_like(
+    layer: RawHashTreeLayer, hashes: Iterable[Hash32]
+) -> RawHashTreeLayer:
+    """Create a layer with the same storage mode as the given one."""
+    if isinstance(layer, FlatLayer):
+        return FlatLayer.from_hashes(hashes)
+    else:
+        return pvector(hashes)
+
+
+def make_layer_from_bytes(layer: RawHashTreeLayer, data: bytes) -> RawHashTreeLayer:
+    """Create a layer from concatenated hashes, with the storage mode of `layer`."""
+    if isinstance(layer, FlatLayer):
+        return FlatLayer.from_bytes(data)
+    else:
+        return pvector(
+            Hash32(data[start : start + HASH_SIZE])
+            for start in range(0, len(data), HASH_SIZE)
+        )
+
+
+def hash_layer(child_layer: RawHashTreeLayer, layer_index: int) -> RawHashTreeLayer:
+    child_layer_bytes = get_layer_bytes(child_layer)
+    if len(child_layer) % 2 != 0:
+        child_layer_bytes += ZERO_HASHES[layer_index]
+
+    return make_layer_from_bytes(child_layer, hash_pairs(child_layer_bytes))
 
 
 def generate_hash_tree_layers(
@@ -351,8 +610,10 @@ def generate_chunk_tree_padding(
 
     previous_root = unpadded_chunk_tree[-1][0]
     for previous_layer_index in range(num_existing_layers - 1, num_target_layers - 1):
-        next_root = hash_eth2(previous_root + ZERO_HASHES[previous_layer_index])
-        yield pvector([next_root])
+        next_root = Hash32(
+            hash_pairs(previous_root + ZERO_HASHES[previous_layer_index])
+        )
+        yield make_layer_like(unpadded_chunk_tree[0], [next_root])
         previous_root = next_root
 
 
@@ -363,13 +624,21 @@ def pad_hash_tree(
     return unpadded_chunk_tree + padding
 
 
+def make_chunk_layer(chunks: Iterable[Hash32], flat: bool = False) -> RawHashTreeLayer:
+    if isinstance(chunks, FlatLayer):
+        return chunks
+    elif flat:
+        return FlatLayer.from_hashes(chunks)
+    else:
+        return pvector(chunks)
+
+
 def compute_hash_tree(
-    chunks: Iterable[Hash32], chunk_count: int | None = None
+    chunks: Iterable[Hash32], chunk_count: int | None = None, flat: bool = False
 ) -> RawHashTree:
     validate_chunk_count(chunk_count)
 
-    chunks = pvector(chunks)
-
+    chunks = make_chunk_layer(chunks, flat)
     if not chunks:
         raise ValueError("Number of chunks is 0")
     if chunk_count is not None and len(chunks) > chunk_count:
@@ -381,58 +650,190 @@ def compute_hash_tree(
     return pad_hash_tree(unpadded_chunk_tree, chunk_count)
 
 
-def recompute_hash_in_tree(
-    hash_tree: RawHashTree, layer_index: int, hash_index: int
-) -> RawHashTree:
-    if layer_index == 0:
-        raise ValueError(
-            "Cannot recompute hash in leaf layer as it consists of chunks not hashes"
+def get_child_pair(
+    child_layer: RawHashTreeLayer, child_layer_index: int, parent_index: int
+) -> bytes:
+    left_child_index = parent_index * 2
+    right_child_index = left_child_index + 1
+
+    if right_child_index < len(child_layer):
+        right_child = child_layer[right_child_index]
+    else:
+        right_child = ZERO_HASHES[child_layer_index]
+    return child_layer[left_child_index] + right_child
+
+
+def rehash_parents(
+    parent_layer: RawHashTreeLayer,
+    child_layer: RawHashTreeLayer,
+    child_layer_index: int,
+    parent_indices: Sequence[int],
+) -> RawHashTreeLayer:
+    """
+    Recompute the given hashes of a parent layer from its (updated) child layer.
+
+    All hashes are computed with a single call to :func:`ssz.hash.hash_pairs`.
+    """
+    parent_hashes = hash_pairs(
+        b"".join(
+            get_child_pair(child_layer, child_layer_index, parent_index)
+            for parent_index in parent_indices
         )
+    )
+    evolver = parent_layer.evolver()
+    for position, parent_index in enumerate(parent_indices):
+        start = position * HASH_SIZE
+        evolver[parent_index] = Hash32(parent_hashes[start : start + HASH_SIZE])
+    return evolver.persistent()
 
-    child_layer_index = layer_index - 1
-    left_child_hash_index = hash_index * 2
-    right_child_hash_index = left_child_hash_index + 1
 
-    child_layer = hash_tree[child_layer_index]
-    left_child_hash = child_layer[left_child_hash_index]
-    try:
-        right_child_hash = child_layer[right_child_hash_index]
-    except IndexError:
-        right_child_hash = ZERO_HASHES[child_layer_index]
+def update_chunks_in_tree(
+    hash_tree: RawHashTree, updated_chunks: Mapping[int, Hash32]
+) -> RawHashTree:
+    """
+    Replace existing chunks in the tree and recompute all affected hashes.
+
+    The hashes are updated layer by layer, bottom-up, so that every parent that has
+    one or more updated descendants is recomputed exactly once. As soon as at least
+    half of a layer is affected, the remaining layers are rehashed completely instead.
+    """
+    if not updated_chunks:
+        return hash_tree
+
+    num_chunks = len(hash_tree[0])
+    for index in updated_chunks.keys():
+        if not 0 <= index < num_chunks:
+            raise IndexError(f"Index out of bounds: {index}")
 
-    # create the layer if it doesn't exist yet
-    # (otherwise, pyrsistent would create a PMap)
-    if layer_index == len(hash_tree):
-        hash_tree = hash_tree.append(pvector())
+    chunk_layer = hash_tree[0].mset(
+        *itertools.chain.from_iterable(updated_chunks.items())
+    )
+    layers = [chunk_layer]
 
-    parent_hash = hash_eth2(left_child_hash + right_child_hash)
-    return hash_tree.transform((layer_index, hash_index), parent_hash)
+    dirty_indices: Sequence[int] | None = sorted(updated_chunks.keys())
+    for child_layer_index, parent_layer in enumerate(hash_tree[1:]):
+        child_layer = layers[-1]
 
+        if dirty_indices is not None:
+            dirty_indices = sorted({index // 2 for index in dirty_indices})
+            if len(dirty_indices) * 2 >= len(parent_layer):
+                # from here on, rehashing the whole layer is cheaper
+                dirty_indices = None
 
-def set_chunk_in_tree(hash_tree: RawHashTree, index: int, chunk: Hash32) -> RawHashTree:
-    hash_tree_with_updated_chunk = hash_tree.transform((0, index), chunk)
+        if dirty_indices is None:
+            layers.append(hash_layer(child_layer, child_layer_index))
+        else:
+            layers.append(
+                rehash_parents(
+                    parent_layer, child_layer, child_layer_index, dirty_indices
+                )
+            )
 
-    parent_layer_indices = drop(1, range(len(hash_tree)))
-    parent_hash_indices = drop(
-        1, take(len(hash_tree), iterate(lambda index: index // 2, index))
-    )
+    return pvector(layers)
 
-    update_functions = (
-        partial(recompute_hash_in_tree, layer_index=layer_index, hash_index=hash_index)
-        for layer_index, hash_index in zip(parent_layer_indices, parent_hash_indices)
-    )
 
-    hash_tree_with_updated_branch = pipe(
-        hash_tree_with_updated_chunk, *update_functions
-    )
+def set_chunk_in_tree(hash_tree: RawHashTree, index: int, chunk: Hash32) -> RawHashTree:
+    """
+    Set a single chunk and update all hashes on its branch.
 
-    if len(hash_tree_with_updated_branch[-1]) == 1:
-        return hash_tree_with_updated_branch
-    elif len(hash_tree_with_updated_branch[-1]) == 2:
-        return recompute_hash_in_tree(hash_tree_with_updated_branch, len(hash_tree), 0)
+    Setting the chunk right after the last one appends it.
+    """
+    if index == len(hash_tree[0]):
+        return append_chunks_to_tree(hash_tree, (chunk,))
     else:
-        raise Exception("Unreachable")
+        return update_chunks_in_tree(hash_tree, {index: chunk})
+
+
+def append_chunks_to_tree(
+    hash_tree: RawHashTree, chunks: Iterable[Hash32]
+) -> RawHashTree:
+    """
+    Append chunks to the tree.
+
+    Only the right edge of the tree is touched: in each layer, the hashes from the
+    first one affected by the appended chunks to the end of the layer are computed in a
+    single call to :func:`ssz.hash.hash_pairs`. Appending `k` chunks therefore costs
+    about `2 * k` hashes instead of `k` full branches.
+
+    Layers are added on top if the tree has to grow, which only happens for trees
+    without chunk count (trees with a chunk count are padded to their full depth).
+    """
+    chunk_layer = hash_tree[0]
+    num_original_chunks = len(chunk_layer)
+    child_layer = chunk_layer.extend(chunks)
+    if len(child_layer) == num_original_chunks:
+        return hash_tree
+
+    num_layers = max(len(hash_tree), get_num_layers(len(child_layer), None))
+    layers = [child_layer]
+    first_dirty_index = num_original_chunks
+
+    for child_layer_index in range(num_layers - 1):
+        parent_layer_index = child_layer_index + 1
+        if parent_layer_index < len(hash_tree):
+            parent_layer = hash_tree[parent_layer_index]
+        else:
+            parent_layer = make_layer_like(child_layer, ())
+
+        first_parent_index = min(first_dirty_index // 2, len(parent_layer))
+        child_bytes = get_layer_bytes(child_layer, first_parent_index * 2)
+        if len(child_bytes) // HASH_SIZE % 2 == 1:
+            child_bytes += ZERO_HASHES[child_layer_index]
+        parent_hashes = hash_pairs(child_bytes)
+
+        evolver = parent_layer.evolver()
+        for parent_index, start in enumerate(
+            range(0, len(parent_hashes), HASH_SIZE), start=first_parent_index
+        ):
+            parent_hash = Hash32(parent_hashes[start : start + HASH_SIZE])
+            if parent_index < len(evolver):
+                evolver[parent_index] = parent_hash
+            else:
+                evolver.append(parent_hash)
+        layers.append(evolver.persistent())
+
+        child_layer = layers[-1]
+        first_dirty_index = first_parent_index
+
+    return pvector(layers)
+
+
+def truncate_tree(
+    hash_tree: RawHashTree, num_chunks: int, chunk_count: int | None = None
+) -> RawHashTree:
+    """
+    Remove all chunks from index `num_chunks` on.
+
+    Each layer is cut to the length it needs for the remaining chunks, and only the
+    last hash of every layer is recomputed, as it is the only one whose children may
+    have changed. Trees without chunk count lose their top layers if they shrink below
+    a power of two.
+    """
+    if not 1 <= num_chunks <= len(hash_tree[0]):
+        raise ValueError(
+            f"Cannot truncate hash tree with {len(hash_tree[0])} chunks to {num_chunks}"
+        )
+    if num_chunks == len(hash_tree[0]):
+        return hash_tree
+
+    num_layers = get_num_layers(num_chunks, chunk_count)
+    layers = []
+    layer_length = num_chunks
+    for layer_index in range(num_layers):
+        layer = hash_tree[layer_index]
+        if len(layer) > layer_length:
+            layer = layer.delete(layer_length, len(layer))
+
+        if layer_index > 0:
+            layer = rehash_parents(
+                layer, layers[-1], layer_index - 1, (layer_length - 1,)
+            )
+
+        layers.append(layer)
+        layer_length = (layer_length + 1) // 2
+
+    return pvector(layers)
 
 
 def append_chunk_to_tree(hash_tree: RawHashTree, chunk: Hash32) -> RawHashTree:
-    return set_chunk_in_tree(hash_tree, len(hash_tree[0]), chunk)
+    return append_chunks_to_tree(hash_tree, (chunk,))
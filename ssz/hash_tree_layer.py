@@ -0,0 +1,301 @@
+from collections.abc import (
+    Iterable,
+    Iterator,
+    Sequence,
+)
+import itertools
+from typing import (
+    Any,
+)
+
+from eth_typing import (
+    Hash32,
+)
+from eth_utils.toolz import (
+    partition,
+)
+from pyrsistent import (
+    pvector,
+)
+from pyrsistent.typing import (
+    PVector,
+)
+
+from ssz.hash import (
+    HASH_SIZE,
+)
+
+HASHES_PER_PAGE = 2**8
+PAGE_SIZE = HASHES_PER_PAGE * HASH_SIZE
+
+
+def validate_hash(value: bytes) -> None:
+    if len(value) != HASH_SIZE:
+        raise ValueError(f"Hashes must be {HASH_SIZE} bytes long, got {len(value)}")
+
+
+def split_into_pages(data: bytes) -> Iterator[bytes]:
+    for start in range(0, len(data), PAGE_SIZE):
+        yield bytes(data[start : start + PAGE_SIZE])
+
+
+class FlatLayer(Sequence[Hash32]):
+    """
+    Persistent sequence of 32 byte hashes stored as contiguous bytes.
+
+    The hashes are kept in pages of :data:`HASHES_PER_PAGE` hashes, each one a single
+    immutable `bytes` object. Modifications copy only the pages they touch, so
+    different versions of a layer share all other pages. This avoids the per item
+    object overhead of a `PVector` of `bytes` while keeping the same persistent
+    interface.
+    """
+
+    __slots__ = ("_pages", "_length")
+
+    def __init__(self, pages: PVector[bytes], length: int) -> None:
+        self._pages = pages
+        self._length = length
+
+    @classmethod
+    def from_bytes(cls, data: bytes) -> "FlatLayer":
+        if len(data) % HASH_SIZE != 0:
+            raise ValueError(
+                f"Data length must be a multiple of {HASH_SIZE}, got {len(data)}"
+            )
+        return cls(pvector(split_into_pages(data)), len(data) // HASH_SIZE)
+
+    @classmethod
+    def from_hashes(cls, hashes: Iterable[Hash32]) -> "FlatLayer":
+        if isinstance(hashes, FlatLayer):
+            return hashes
+
+        hashes = tuple(hashes)
+        for value in hashes:
+            validate_hash(value)
+        return cls.from_bytes(b"".join(hashes))
+
+    #
+    # Buffer access
+    #
+    def tobytes(self, start: int = 0, stop: int | None = None) -> bytes:
+        """
+        Return the concatenation of the hashes in the range `[start, stop)`.
+
+        The hashes are not stored contiguously, so this copies them. For the same
+        reason, layers do not support the buffer protocol.
+        """
+        start, stop, _ = slice(start, stop).indices(self._length)
+        if start >= stop:
+            return b""
+
+        first_page_index = start // HASHES_PER_PAGE
+        last_page_index = (stop - 1) // HASHES_PER_PAGE
+        data = b"".join(
+            self._pages[page_index]
+            for page_index in range(first_page_index, last_page_index + 1)
+        )
+        offset = first_page_index * PAGE_SIZE
+        return data[start * HASH_SIZE - offset : stop * HASH_SIZE - offset]
+
+    #
+    # Sequence interface
+    #
+    def __len__(self) -> int:
+        return self._length
+
+    def __getitem__(self, index: int | slice) -> Any:
+        if isinstance(index, slice):
+            start, stop, step = index.indices(self._length)
+            if step == 1:
+                return FlatLayer.from_bytes(self.tobytes(start, stop))
+            else:
+                return FlatLayer.from_hashes(
+                    self[item_index] for item_index in range(start, stop, step)
+                )
+
+        if index < 0:
+            index += self._length
+        if not 0 <= index < self._length:
+            raise IndexError(f"Index out of bounds: {index}")
+
+        page = self._pages[index // HASHES_PER_PAGE]
+        offset = index % HASHES_PER_PAGE * HASH_SIZE
+        return Hash32(page[offset : offset + HASH_SIZE])
+
+    def __iter__(self) -> Iterator[Hash32]:
+        for page in self._pages:
+            for offset in range(0, len(page), HASH_SIZE):
+                yield Hash32(page[offset : offset + HASH_SIZE])
+
+    def __eq__(self, other: Any) -> bool:
+        if isinstance(other, FlatLayer):
+            return self._length == other._length and self.tobytes() == other.tobytes()
+        elif isinstance(other, Sequence) and not isinstance(other, (bytes, str)):
+            return len(self) == len(other) and all(
+                left == right for left, right in zip(self, other)
+            )
+        else:
+            return NotImplemented
+
+    def __hash__(self) -> int:
+        return hash(tuple(self))
+
+    def __repr__(self) -> str:
+        return f"{self.__class__.__name__}({list(self)})"
+
+    def index(self, value: Hash32, *args: int) -> int:
+        return tuple(self).index(value, *args)
+
+    def count(self, value: Hash32) -> int:
+        return tuple(self).count(value)
+
+    def tolist(self) -> list[Hash32]:
+        return list(self)
+
+    #
+    # Persistent modifications
+    #
+    def set(self, index: int, value: Hash32) -> "FlatLayer":
+        return self.mset(index, value)
+
+    def mset(self, *args: int | Hash32) -> "FlatLayer":
+        if len(args) % 2 != 0:
+            raise TypeError(
+                f"mset must be called with an even number of arguments, got {len(args)}"
+            )
+
+        evolver = self.evolver()
+        for index, value in partition(2, args):
+            evolver[index] = value
+        return evolver.persistent()
+
+    def append(self, value: Hash32) -> "FlatLayer":
+        return self.extend((value,))
+
+    def extend(self, values: Iterable[Hash32]) -> "FlatLayer":
+        evolver = self.evolver()
+        evolver.extend(values)
+        return evolver.persistent()
+
+    def delete(self, index: int, stop: int | None = None) -> "FlatLayer":
+        if index < 0:
+            index += self._length
+        if stop is None:
+            stop = index + 1
+        elif stop < 0:
+            stop += self._length
+        if not 0 <= index < self._length:
+            raise IndexError(f"Index out of bounds: {index}")
+        stop = max(index, min(stop, self._length))
+
+        # keep all pages in front of the deleted range and rebuild the rest
+        first_page_index = index // HASHES_PER_PAGE
+        head_pages = self._pages[:first_page_index]
+        tail_data = self.tobytes(
+            first_page_index * HASHES_PER_PAGE, index
+        ) + self.tobytes(stop)
+        return FlatLayer(
+            head_pages.extend(split_into_pages(tail_data)),
+            self._length - (stop - index),
+        )
+
+    def remove(self, value: Hash32) -> "FlatLayer":
+        return self.delete(self.index(value))
+
+    def evolver(self) -> "FlatLayerEvolver":
+        return FlatLayerEvolver(self)
+
+
+class FlatLayerEvolver:
+    """
+    Evolver for :class:`FlatLayer`, following the interface of pyrsistent's evolvers.
+
+    Pages are copied into mutable buffers on first write and converted back to bytes
+    when the layer is persisted.
+    """
+
+    def __init__(self, layer: FlatLayer) -> None:
+        self._original_layer = layer
+        self._pages = layer._pages.evolver()
+        self._length = len(layer)
+        self._dirty_pages: dict[int, bytearray] = {}
+
+    def _get_writable_page(self, page_index: int) -> bytearray:
+        if page_index not in self._dirty_pages:
+            self._dirty_pages[page_index] = bytearray(self._pages[page_index])
+        return self._dirty_pages[page_index]
+
+    def __len__(self) -> int:
+        return self._length
+
+    def __getitem__(self, index: int) -> Hash32:
+        if index < 0:
+            index += self._length
+        if not 0 <= index < self._length:
+            raise IndexError(f"Index out of bounds: {index}")
+
+        page_index = index // HASHES_PER_PAGE
+        page = self._dirty_pages.get(page_index, self._pages[page_index])
+        offset = index % HASHES_PER_PAGE * HASH_SIZE
+        return Hash32(bytes(page[offset : offset + HASH_SIZE]))
+
+    def set(self, index: int, value: Hash32) -> "FlatLayerEvolver":
+        self[index] = value
+        return self
+
+    def __setitem__(self, index: int, value: Hash32) -> None:
+        if index < 0:
+            index += self._length
+
+        if index == self._length:
+            self.append(value)
+            return
+        if not 0 <= index < self._length:
+            raise IndexError(f"Index out of bounds: {index}")
+
+        validate_hash(value)
+        page = self._get_writable_page(index // HASHES_PER_PAGE)
+        offset = index % HASHES_PER_PAGE * HASH_SIZE
+        page[offset : offset + HASH_SIZE] = value
+
+    def append(self, value: Hash32) -> "FlatLayerEvolver":
+        return self.extend((value,))
+
+    def extend(self, values: Iterable[Hash32]) -> "FlatLayerEvolver":
+        values_iter = iter(values)
+        while True:
+            free_slots = HASHES_PER_PAGE - self._length % HASHES_PER_PAGE
+            new_values = tuple(itertools.islice(values_iter, free_slots))
+            if not new_values:
+                return self
+
+            for value in new_values:
+                validate_hash(value)
+            if free_slots == HASHES_PER_PAGE:
+                self._pages.append(b"")
+            page = self._get_writable_page(len(self._pages) - 1)
+            page.extend(b"".join(new_values))
+            self._length += len(new_values)
+
+    def delete(self, index: int, stop: int | None = None) -> "FlatLayerEvolver":
+        layer = self.persistent().delete(index, stop)
+        self.__init__(layer)  # type: ignore
+        return self
+
+    def __delitem__(self, index: int) -> None:
+        self.delete(index)
+
+    def is_dirty(self) -> bool:
+        return bool(self._dirty_pages) or self._length != len(self._original_layer)
+
+    def persistent(self) -> FlatLayer:
+        if not self.is_dirty():
+            return self._original_layer
+
+        for page_index, page in self._dirty_pages.items():
+            self._pages[page_index] = bytes(page)
+        self._dirty_pages = {}
+
+        layer = FlatLayer(self._pages.persistent(), self._length)
+        self._original_layer = layer
+        return layer
@@ -208,13 +208,21 @@ class MetaHashableContainer(ABCMeta):
     def serialize(cls, value):
         return cls._meta.container_sedes.serialize(value)
 
-    def deserialize(cls, data):
+    def serialize_parts(cls, value):
+        return cls._meta.container_sedes.serialize_parts(value)
+
+    def get_serialized_size(cls, value):
+        return cls._meta.container_sedes.get_serialized_size(value)
+
+    def deserialize(cls, data, hashable=True):
+        # hashable containers are always deserialized as such (and are lazy anyway),
+        # so `hashable` is ignored
         field_values = cls._meta.container_sedes.deserialize(data)
         kwargs = {
             field_name: field_value
             for (field_name, _), field_value in zip(cls._meta.fields, field_values)
         }
-        return cls.create(**kwargs)
+        return cls.create_from_field_kwargs(kwargs, lazy=True)
 
     def get_hash_tree_root(cls, value):
         return cls._meta.container_sedes.get_hash_tree_root(value)
@@ -294,6 +302,15 @@ class HashableContainer(
 
     @classmethod
     def create(cls, **field_kwargs: dict[str, Any]):
+        return cls.create_from_field_kwargs(field_kwargs)
+
+    @classmethod
+    def create_from_field_kwargs(cls, field_kwargs: dict[str, Any], lazy: bool = False):
+        """
+        Create a container from a dictionary of field values.
+
+        See :meth:`BaseHashableStructure.from_iterable_and_sedes` for `lazy`.
+        """
         if cls._meta is None:
             raise TypeError("HashableContainer does not define any fields")
 
@@ -322,7 +339,7 @@ class HashableContainer(
         )
 
         return cls.from_iterable_and_sedes(
-            field_values, sedes=cls._meta.container_sedes, max_length=None
+            field_values, sedes=cls._meta.container_sedes, max_length=None, lazy=lazy
         )
 
     @property
@@ -378,7 +395,7 @@ class SignedHashableContainer(
     @property
     def signing_root(self) -> Hash32:
         signature_chunk_index = len(self) - 1
-        hash_tree_with_blank_signature = self._hash_tree.set(
+        hash_tree_with_blank_signature = self.hash_tree.set(
             signature_chunk_index, ZERO_HASHES[0]
         )
         if math.log2(len(self) - 1).is_integer():
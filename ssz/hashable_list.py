@@ -29,10 +29,18 @@ if TYPE_CHECKING:
 class HashableList(BaseResizableHashableStructure[TElement], Sequence[TElement]):
     @classmethod
     def from_iterable(
-        cls, iterable: Iterable[TElement], sedes: "List[TElement, TElement]"
+        cls,
+        iterable: Iterable[TElement],
+        sedes: "List[TElement, TElement]",
+        lazy: bool = False,
+        chunks_only: bool = False,
     ):
         return super().from_iterable_and_sedes(
-            iterable, sedes, max_length=sedes.max_length
+            iterable,
+            sedes,
+            max_length=sedes.max_length,
+            lazy=lazy,
+            chunks_only=chunks_only,
         )
 
     @property
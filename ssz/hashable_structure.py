@@ -4,9 +4,9 @@ from collections.abc import (
     Iterator,
     Sequence,
 )
-import functools
 import itertools
 from typing import (
+    TYPE_CHECKING,
     Any,
     TypeVar,
 )
@@ -15,13 +15,10 @@ from eth_typing import (
     Hash32,
 )
 from eth_utils import (
-    to_dict,
     to_tuple,
 )
 from eth_utils.toolz import (
-    groupby,
     partition,
-    pipe,
 )
 from pyrsistent import (
     pvector,
@@ -45,10 +42,19 @@ from ssz.constants import (
 )
 from ssz.hash_tree import (
     HashTree,
+    normalize_deletion_range,
 )
 from ssz.sedes.base import (
     BaseProperCompositeSedes,
 )
+from ssz.utils import (
+    pack_bytes,
+)
+
+if TYPE_CHECKING:
+    from ssz.sedes.basic import (
+        BasicSedes,
+    )
 
 TStructure = TypeVar("TStructure", bound="BaseHashableStructure")
 TResizableStructure = TypeVar(
@@ -57,6 +63,15 @@ TResizableStructure = TypeVar(
 TElement = TypeVar("TElement")
 
 
+def validate_element_in_chunk(chunk_size: int, index: int, element_size: int) -> None:
+    if element_size == 0:
+        raise ValueError("Element size is zero")
+    if chunk_size % element_size != 0:
+        raise ValueError(f"Element size is not a divisor of chunk size: {element_size}")
+    if not 0 <= index < chunk_size // element_size:
+        raise IndexError(f"Index out of range for element size {element_size}: {index}")
+
+
 def update_element_in_chunk(
     original_chunk: Hash32, index: int, element: bytes
 ) -> Hash32:
@@ -76,14 +91,7 @@ def update_element_in_chunk(
         b'aaxxcc'
     """
     element_size = len(element)
-    chunk_size = len(original_chunk)
-
-    if element_size == 0:
-        raise ValueError("Element size is zero")
-    if chunk_size % element_size != 0:
-        raise ValueError(f"Element size is not a divisor of chunk size: {element_size}")
-    if not 0 <= index < chunk_size // element_size:
-        raise IndexError(f"Index out of range for element size {element_size}: {index}")
+    validate_element_in_chunk(len(original_chunk), index, element_size)
 
     first_byte_index = index * element_size
     last_byte_index = first_byte_index + element_size
@@ -99,16 +107,18 @@ def update_elements_in_chunk(
     """
     Update multiple elements in a chunk.
 
-    The set of updates is given by a dictionary mapping indices to elements. The items
-    of the dictionary will be passed one by one to `update_element_in_chunk`.
+    The set of updates is given by a dictionary mapping indices to elements, with the
+    same requirements as for `update_element_in_chunk`. All elements are written into
+    a single copy of the chunk.
     """
-    return pipe(
-        original_chunk,
-        *(
-            functools.partial(update_element_in_chunk, index=index, element=element)
-            for index, element in updated_elements.items()
-        ),
-    )
+    chunk = bytearray(original_chunk)
+    for index, element in updated_elements.items():
+        element_size = len(element)
+        validate_element_in_chunk(len(chunk), index, element_size)
+
+        first_byte_index = index * element_size
+        chunk[first_byte_index : first_byte_index + element_size] = element
+    return Hash32(bytes(chunk))
 
 
 def get_num_padding_elements(
@@ -125,7 +135,6 @@ def get_num_padding_elements(
     return num_elements_in_padding
 
 
-@to_dict
 def get_updated_chunks(
     *,
     updated_elements: dict[int, bytes],
@@ -134,7 +143,7 @@ def get_updated_chunks(
     element_size: int,
     num_original_elements: int,
     num_padding_elements: int,
-) -> Generator[tuple[int, Hash32], None, None]:
+) -> dict[int, Hash32]:
     """
     For an element changeset, compute the updates that have to be applied to the
     existing chunks.
@@ -146,31 +155,61 @@ def get_updated_chunks(
     The pre-existing state is given by the sequence of original chunks and the number of
     elements represented by these chunks.
 
-    The return value is a dictionary mapping chunk indices to chunks.
+    The return value is a dictionary mapping chunk indices to chunks. Each of them is
+    patched once with all of its updated elements, see `get_bulk_updated_chunks`.
     """
     effective_appended_elements = appended_elements[:num_padding_elements]
-    elements_per_chunk = CHUNK_SIZE // element_size
-
     padding_elements_with_indices = dict(
         enumerate(effective_appended_elements, start=num_original_elements)
     )
     effective_updated_elements = {**updated_elements, **padding_elements_with_indices}
 
-    element_indices = effective_updated_elements.keys()
-    element_indices_by_chunk = groupby(
-        lambda element_index: element_index // elements_per_chunk, element_indices
+    return get_bulk_updated_chunks(
+        indices=tuple(effective_updated_elements.keys()),
+        serialized_elements=b"".join(effective_updated_elements.values()),
+        original_chunks=original_chunks,
+        element_size=element_size,
     )
 
-    for chunk_index, element_indices in element_indices_by_chunk.items():
-        chunk_updates = {
-            element_index
-            % elements_per_chunk: effective_updated_elements[element_index]
-            for element_index in element_indices
-        }
-        updated_chunk = update_elements_in_chunk(
-            original_chunks[chunk_index], chunk_updates
-        )
-        yield chunk_index, updated_chunk
+
+def get_bulk_updated_chunks(
+    *,
+    indices: Sequence[int],
+    serialized_elements: bytes,
+    original_chunks: Sequence[Hash32],
+    element_size: int,
+) -> dict[int, Hash32]:
+    """
+    Patch many updated elements into the existing chunks in one pass.
+
+    The elements are given serialized back to back in the order of their indices,
+    as produced by `serialize_sequence` of their sedes. If an index occurs more than
+    once, the last element wins.
+
+    The return value is a dictionary mapping chunk indices to chunks.
+    """
+    elements_per_chunk = CHUNK_SIZE // element_size
+    # slicing the view does not copy the elements
+    serialized_view = memoryview(serialized_elements)
+
+    patched_chunks: dict[int, bytearray] = {}
+    for position, index in enumerate(indices):
+        chunk_index, index_in_chunk = divmod(index, elements_per_chunk)
+        chunk = patched_chunks.get(chunk_index)
+        if chunk is None:
+            chunk = bytearray(original_chunks[chunk_index])
+            patched_chunks[chunk_index] = chunk
+
+        first_byte_index = index_in_chunk * element_size
+        first_element_byte_index = position * element_size
+        chunk[first_byte_index : first_byte_index + element_size] = serialized_view[
+            first_element_byte_index : first_element_byte_index + element_size
+        ]
+
+    return {
+        chunk_index: Hash32(bytes(chunk))
+        for chunk_index, chunk in patched_chunks.items()
+    }
 
 
 @to_tuple
@@ -192,11 +231,124 @@ def get_appended_chunks(
         yield Hash32(b"".join(elements_in_chunk))
 
 
+def compute_chunks(
+    elements: Sequence[TElement], sedes: BaseProperCompositeSedes
+) -> tuple[Hash32, ...]:
+    """Serialize the elements of a structure and pack them into chunks."""
+    if sedes.is_packing and len(elements) > 0:
+        # basic elements are serialized in one piece
+        return pack_bytes(sedes.get_element_sedes(0).serialize_sequence(elements))
+
+    serialized_elements = [
+        sedes.serialize_element_for_tree(index, element)
+        for index, element in enumerate(elements)
+    ]
+    return get_appended_chunks(
+        appended_elements=serialized_elements,
+        element_size=sedes.element_size_in_tree,
+        num_padding_elements=0,
+    )
+
+
+def get_packed_elements(
+    hash_tree: HashTree, sedes: BaseProperCompositeSedes, length: int
+) -> "PackedElements[TElement]":
+    """Get the first `length` elements packed into the chunks of a hash tree."""
+    return PackedElements(hash_tree.chunks, sedes.get_element_sedes(0), 0, length)
+
+
+class PackedElements(Sequence[TElement]):
+    """
+    The basic elements of a structure, decoded on access from the chunks they are
+    packed into.
+
+    The chunks are shared with the hash tree of the structure, so the elements are
+    not stored a second time. Slices are views over the same chunks.
+    """
+
+    def __init__(
+        self,
+        chunks: PVector[Hash32],
+        element_sedes: "BasicSedes",
+        start: int,
+        stop: int,
+    ) -> None:
+        self._chunks = chunks
+        self._element_sedes = element_sedes
+        self._element_size = element_sedes.get_fixed_size()
+        self._elements_per_chunk = CHUNK_SIZE // self._element_size
+        self._start = start
+        self._stop = stop
+
+    def __len__(self) -> int:
+        return self._stop - self._start
+
+    def __getitem__(self, index):
+        if isinstance(index, slice):
+            start, stop, step = index.indices(len(self))
+            if step != 1:
+                return tuple(self)[index]
+            return PackedElements(
+                self._chunks,
+                self._element_sedes,
+                self._start + start,
+                self._start + max(start, stop),
+            )
+
+        if index < 0:
+            index += len(self)
+        if not 0 <= index < len(self):
+            raise IndexError(f"Index out of bounds: {index}")
+
+        chunk_index, index_in_chunk = divmod(
+            self._start + index, self._elements_per_chunk
+        )
+        first_byte_index = index_in_chunk * self._element_size
+        return self._element_sedes.deserialize(
+            self._chunks[chunk_index][
+                first_byte_index : first_byte_index + self._element_size
+            ]
+        )
+
+    def __iter__(self) -> Iterator[TElement]:
+        if len(self) == 0:
+            return
+
+        first_chunk_index, skipped = divmod(self._start, self._elements_per_chunk)
+        last_chunk_index = (self._stop - 1) // self._elements_per_chunk
+        remaining = len(self)
+        for chunk_index in range(first_chunk_index, last_chunk_index + 1):
+            elements = self._element_sedes.deserialize_sequence(
+                self._chunks[chunk_index]
+            )[skipped : skipped + remaining]
+            yield from elements
+            remaining -= len(elements)
+            skipped = 0
+
+    def to_bytes(self) -> bytes:
+        """Return the serialized elements, as they are packed in the chunks."""
+        first_chunk_index = self._start // self._elements_per_chunk
+        last_chunk_index = (self._stop - 1) // self._elements_per_chunk
+        first_byte_index = (
+            self._start - first_chunk_index * self._elements_per_chunk
+        ) * self._element_size
+        data = b"".join(
+            self._chunks[chunk_index]
+            for chunk_index in range(first_chunk_index, last_chunk_index + 1)
+        )
+        return data[
+            first_byte_index : first_byte_index + len(self) * self._element_size
+        ]
+
+    def __repr__(self) -> str:
+        return f"{self.__class__.__name__}({list(self)!r})"
+
+
 class BaseHashableStructure(HashableStructureAPI[TElement]):
     def __init__(
         self,
         elements: PVector[TElement],
-        hash_tree: HashTree,
+        hash_tree: HashTree | None,
         sedes: BaseProperCompositeSedes,
         max_length: int | None = None,
     ) -> None:
@@ -204,6 +356,8 @@ class BaseHashableStructure(HashableStructureAPI[TElement]):
         self._hash_tree = hash_tree
         self._sedes = sedes
         self._max_length = max_length
+        # memoized by the sedes, see `ProperCompositeSedes.get_serialized_size`
+        self._serialized_size_cache: int | None = None
 
     @classmethod
     def from_iterable_and_sedes(
@@ -211,7 +365,23 @@ class BaseHashableStructure(HashableStructureAPI[TElement]):
         iterable: Iterable[TElement],
         sedes: BaseProperCompositeSedes,
         max_length: int | None = None,
+        lazy: bool = False,
+        chunks_only: bool = False,
     ):
+        """
+        Create a structure from its elements.
+
+        If `lazy` is set, the hash tree is only created once it is accessed, e.g. to
+        compute the root. Until then no chunks are computed, except for `chunks_only`
+        structures, which are stored as chunks. Structures derived from a lazy one are
+        lazy as well, but their updated elements are still validated right away.
+
+        If `chunks_only` is set, structures of basic elements do not store their
+        elements separately, but decode them from the chunks of the hash tree on
+        access, see :class:`PackedElements`. This saves most of the memory of large
+        structures at the cost of slower element access. Structures derived from
+        such a structure store only chunks as well.
+        """
         elements = pvector(iterable)
         if max_length and len(elements) > max_length:
             raise ValueError(
@@ -219,28 +389,55 @@ class BaseHashableStructure(HashableStructureAPI[TElement]):
                 f"{max_length}"
             )
 
-        serialized_elements = [
-            sedes.serialize_element_for_tree(index, element)
-            for index, element in enumerate(elements)
-        ]
-        appended_chunks = get_appended_chunks(
-            appended_elements=serialized_elements,
-            element_size=sedes.element_size_in_tree,
-            num_padding_elements=0,
-        )
-        hash_tree = HashTree.compute(
-            appended_chunks or [ZERO_BYTES32], sedes.chunk_count
-        )
+        if chunks_only:
+            if not sedes.is_packing:
+                raise ValueError(
+                    "Only structures of basic elements can store only their chunks"
+                )
+            hash_tree = HashTree.compute(
+                compute_chunks(elements, sedes) or [ZERO_BYTES32],
+                sedes.chunk_count,
+                lazy=lazy,
+            )
+            return cls(
+                get_packed_elements(hash_tree, sedes, len(elements)),
+                hash_tree,
+                sedes,
+                max_length,
+            )
+
+        if lazy:
+            hash_tree = None
+        else:
+            hash_tree = HashTree.compute(
+                compute_chunks(elements, sedes) or [ZERO_BYTES32], sedes.chunk_count
+            )
         return cls(elements, hash_tree, sedes, max_length)
 
     @property
-    def elements(self) -> PVector[TElement]:
+    def elements(self) -> PVector[TElement] | PackedElements[TElement]:
         return self._elements
 
+    @property
+    def is_chunks_only(self) -> bool:
+        """Whether the elements are decoded from the chunks instead of stored."""
+        return isinstance(self._elements, PackedElements)
+
     @property
     def hash_tree(self) -> HashTree:
+        if self._hash_tree is None:
+            self._hash_tree = HashTree.compute(
+                compute_chunks(self.elements, self.sedes) or [ZERO_BYTES32],
+                self.sedes.chunk_count,
+                lazy=True,
+            )
         return self._hash_tree
 
+    @property
+    def has_hash_tree(self) -> bool:
+        """Whether the hash tree has been created, which lazy structures defer."""
+        return self._hash_tree is not None
+
     @property
     def chunks(self) -> PVector[Hash32]:
         return self.hash_tree.chunks
@@ -308,6 +505,97 @@ class BaseHashableStructure(HashableStructureAPI[TElement]):
     ) -> "HashableStructureEvolverAPI[TStructure, TElement]":
         return HashableStructureEvolver(self)
 
+    #
+    # Bulk updates
+    #
+    def apply_updates(
+        self: TStructure, indices: Sequence[int], values: Sequence[TElement]
+    ) -> TStructure:
+        """
+        Replace the elements at the given indices with the given values.
+
+        The result is the same as setting them one by one in an evolver, but for
+        structures of basic elements the values are serialized and patched into the
+        chunks in one pass, and each affected layer of the hash tree is rehashed once.
+        `values` can also be a buffer such as an :class:`array.array` matching the
+        serialization of the elements, e.g. of typecode "Q" for `uint64`.
+        """
+        if len(indices) != len(values):
+            raise ValueError(
+                f"Got {len(indices)} indices, but {len(values)} values to update"
+            )
+        length = len(self)
+        for index in indices:
+            if not 0 <= index < length:
+                raise IndexError(f"Index out of bounds: {index}")
+
+        if not self.sedes.is_packing or not self.has_hash_tree:
+            evolver = self.evolver()
+            for index, value in zip(indices, values):
+                evolver[index] = value
+            return evolver.persistent()
+
+        updated_chunks = get_bulk_updated_chunks(
+            indices=indices,
+            serialized_elements=self.sedes.get_element_sedes(0).serialize_sequence(
+                values
+            ),
+            original_chunks=self.chunks,
+            element_size=self.sedes.element_size_in_tree,
+        )
+        hash_tree = self.hash_tree.update_chunks(updated_chunks)
+
+        if self.is_chunks_only:
+            elements = get_packed_elements(hash_tree, self.sedes, length)
+        else:
+            elements_evolver = self.elements.evolver()
+            for index, value in zip(indices, values):
+                elements_evolver[index] = value
+            elements = elements_evolver.persistent()
+
+        return self.__class__(elements, hash_tree, self.sedes, self.max_length)
+
+    def replace_all(self: TStructure, values: Sequence[TElement]) -> TStructure:
+        """
+        Replace all elements with the given ones, keeping the length.
+
+        For structures of basic elements, the new chunks are packed at once and only
+        the hash tree branches of chunks that actually changed are rehashed. As for
+        :meth:`apply_updates`, `values` can also be a buffer.
+        """
+        if len(values) != len(self):
+            raise ValueError(
+                f"Cannot replace {len(self)} elements with {len(values)} values"
+            )
+        if len(self) == 0:
+            return self
+
+        if not self.sedes.is_packing:
+            return self.apply_updates(range(len(self)), values)
+
+        if self.has_hash_tree:
+            chunks = compute_chunks(values, self.sedes)
+            hash_tree = self.hash_tree.update_chunks(
+                {
+                    chunk_index: chunk
+                    for chunk_index, (original_chunk, chunk) in enumerate(
+                        zip(self.chunks, chunks)
+                    )
+                    if chunk != original_chunk
+                }
+            )
+        else:
+            # validate the values, as they are not packed into chunks
+            self.sedes.get_element_sedes(0).serialize_sequence(values)
+            hash_tree = None
+
+        if self.is_chunks_only:
+            elements = get_packed_elements(hash_tree, self.sedes, len(self))
+        else:
+            elements = pvector(values)
+
+        return self.__class__(elements, hash_tree, self.sedes, self.max_length)
+
 
 class HashableStructureEvolver(HashableStructureEvolverAPI[TStructure, TElement]):
     def __init__(self, hashable_structure: TStructure) -> None:
@@ -355,6 +643,55 @@ class HashableStructureEvolver(HashableStructureEvolverAPI[TStructure, TElement]
         if not self.is_dirty():
             return self._original_structure
 
+        if self._original_structure.is_chunks_only:
+            hash_tree = self._get_updated_hash_tree()
+            return self._original_structure.__class__(
+                get_packed_elements(
+                    hash_tree, self._original_structure.sedes, len(self)
+                ),
+                hash_tree,
+                self._original_structure.sedes,
+                self._original_structure.max_length,
+            )
+
+        elements = self._original_structure.elements.mset(
+            *itertools.chain.from_iterable(  # type: ignore
+                self._updated_elements.items()
+            )
+        ).extend(self._appended_elements)
+
+        if self._original_structure.has_hash_tree:
+            hash_tree = self._get_updated_hash_tree()
+        else:
+            # the elements are not serialized for the hash tree, which would validate
+            # them, so that is done separately
+            self._validate_changed_elements()
+            hash_tree = None
+
+        return self._original_structure.__class__(
+            elements,
+            hash_tree,
+            self._original_structure.sedes,
+            self._original_structure.max_length,
+        )
+
+    def _validate_changed_elements(self) -> None:
+        sedes = self._original_structure.sedes
+        changed_elements = tuple(
+            itertools.chain(
+                self._updated_elements.items(),
+                enumerate(self._appended_elements, start=len(self._original_structure)),
+            )
+        )
+        if sedes.is_packing:
+            sedes.get_element_sedes(0).serialize_sequence(
+                tuple(element for _, element in changed_elements)
+            )
+        else:
+            for index, element in changed_elements:
+                sedes.get_element_sedes(index).serialize(element)
+
+    def _get_updated_hash_tree(self) -> HashTree:
         sedes = self._original_structure.sedes
 
         num_original_elements = len(self._original_structure)
@@ -365,16 +702,27 @@ class HashableStructureEvolver(HashableStructureEvolverAPI[TStructure, TElement]
             element_size=sedes.element_size_in_tree,
         )
 
-        updated_elements = {
-            index: sedes.serialize_element_for_tree(index, element)
-            for index, element in self._updated_elements.items()
-        }
-        appended_elements = [
-            sedes.serialize_element_for_tree(index, element)
-            for index, element in enumerate(
-                self._appended_elements, start=num_original_elements
-            )
-        ]
+        if sedes.is_packing:
+            # all elements share the same basic sedes
+            serialize = sedes.get_element_sedes(0).serialize
+            updated_elements = {
+                index: serialize(element)
+                for index, element in self._updated_elements.items()
+            }
+            appended_elements = [
+                serialize(element) for element in self._appended_elements
+            ]
+        else:
+            updated_elements = {
+                index: sedes.serialize_element_for_tree(index, element)
+                for index, element in self._updated_elements.items()
+            }
+            appended_elements = [
+                sedes.serialize_element_for_tree(index, element)
+                for index, element in enumerate(
+                    self._appended_elements, start=num_original_elements
+                )
+            ]
 
         updated_chunks = get_updated_chunks(
             updated_elements=updated_elements,
@@ -390,17 +738,8 @@ class HashableStructureEvolver(HashableStructureEvolverAPI[TStructure, TElement]
             num_padding_elements=num_padding_elements,
         )
 
-        elements = self._original_structure.elements.mset(
-            *itertools.chain.from_iterable(  # type: ignore
-                self._updated_elements.items()
-            )
-        ).extend(self._appended_elements)
-        hash_tree = self._original_structure.hash_tree.mset(
-            *itertools.chain.from_iterable(updated_chunks.items())  # type: ignore
-        ).extend(appended_chunks)
-
-        return self._original_structure.__class__(
-            elements, hash_tree, self._original_structure.sedes
+        return self._original_structure.hash_tree.update_chunks(updated_chunks).extend(
+            appended_chunks
         )
 
 
@@ -432,6 +771,115 @@ class BaseResizableHashableStructure(
         else:
             return (self + self) * (times - 1)
 
+    def truncate(self: TResizableStructure, length: int) -> TResizableStructure:
+        if not 0 <= length <= len(self):
+            raise ValueError(
+                f"Cannot truncate structure with {len(self)} elements to {length}"
+            )
+        if length == len(self):
+            return self
+
+        if self.is_chunks_only:
+            return self._replace_packed_elements_from(length, ())
+        return self._replace_elements_from(self.elements[:length], length)
+
+    def delete(
+        self: TResizableStructure, index: int, stop: int | None = None
+    ) -> TResizableStructure:
+        start, stop = normalize_deletion_range(index, stop, len(self))
+        if self.is_chunks_only:
+            return self._replace_packed_elements_from(start, self.elements[stop:])
+        return self._replace_elements_from(self.elements.delete(start, stop), start)
+
+    def remove(self: TResizableStructure, value: TElement) -> TResizableStructure:
+        return self.delete(self.elements.index(value))
+
+    def _replace_elements_from(
+        self: TResizableStructure, elements: PVector[TElement], first_changed_index: int
+    ) -> TResizableStructure:
+        """
+        Create a new structure from elements that differ from the current ones only
+        from index `first_changed_index` on.
+
+        Chunks that lie completely before the first changed element are kept, the rest
+        of the hash tree is cut off and rebuilt from the new elements.
+        """
+        sedes = self.sedes
+        if not self.has_hash_tree:
+            return self.__class__(elements, None, sedes, self.max_length)
+
+        element_size = sedes.element_size_in_tree
+        elements_per_chunk = CHUNK_SIZE // element_size
+
+        num_kept_chunks = first_changed_index // elements_per_chunk
+        first_rebuilt_element_index = num_kept_chunks * elements_per_chunk
+        rebuilt_elements = [
+            sedes.serialize_element_for_tree(index, element)
+            for index, element in enumerate(
+                elements[first_rebuilt_element_index:],
+                start=first_rebuilt_element_index,
+            )
+        ]
+        rebuilt_chunks = get_appended_chunks(
+            appended_elements=rebuilt_elements,
+            element_size=element_size,
+            num_padding_elements=0,
+        )
+
+        hash_tree = self._rebuild_hash_tree(num_kept_chunks, rebuilt_chunks)
+        return self.__class__(elements, hash_tree, sedes, self.max_length)
+
+    def _replace_packed_elements_from(
+        self: TResizableStructure,
+        first_changed_index: int,
+        changed_elements: Iterable[TElement],
+    ) -> TResizableStructure:
+        """
+        Create a new structure that only stores chunks from the elements before index
+        `first_changed_index`, followed by the given changed elements.
+
+        Only the elements in the first rebuilt chunk have to be decoded from the
+        current chunks.
+        """
+        sedes = self.sedes
+        elements_per_chunk = CHUNK_SIZE // sedes.element_size_in_tree
+
+        num_kept_chunks = first_changed_index // elements_per_chunk
+        first_rebuilt_element_index = num_kept_chunks * elements_per_chunk
+        rebuilt_elements = tuple(
+            itertools.chain(
+                self.elements[first_rebuilt_element_index:first_changed_index],
+                changed_elements,
+            )
+        )
+        rebuilt_chunks = compute_chunks(rebuilt_elements, sedes)
+
+        hash_tree = self._rebuild_hash_tree(num_kept_chunks, rebuilt_chunks)
+        length = first_rebuilt_element_index + len(rebuilt_elements)
+        return self.__class__(
+            get_packed_elements(hash_tree, sedes, length),
+            hash_tree,
+            sedes,
+            self.max_length,
+        )
+
+    def _rebuild_hash_tree(
+        self, num_kept_chunks: int, rebuilt_chunks: Sequence[Hash32]
+    ) -> HashTree:
+        """
+        Keep the first `num_kept_chunks` chunks of the hash tree and replace the rest
+        with the rebuilt ones.
+        """
+        if num_kept_chunks == 0:
+            return HashTree.compute(
+                rebuilt_chunks or [ZERO_BYTES32],
+                self.sedes.chunk_count,
+                flat=self.hash_tree.is_flat,
+                lazy=self.hash_tree.is_lazy,
+            )
+        else:
+            return self.hash_tree.truncate(num_kept_chunks).extend(rebuilt_chunks)
+
     def evolver(
         self: TResizableStructure,
     ) -> "ResizableHashableStructureEvolverAPI[TResizableStructure, TElement]":
@@ -455,3 +903,49 @@ class ResizableHashableStructureEvolver(
             raise ValueError(f"Structure would exceed maximum length {max_length}")
 
         self._appended_elements.extend(extension)
+
+    def truncate(self, length: int) -> None:
+        num_original_elements = len(self._original_structure)
+        if not 0 <= length <= len(self):
+            raise ValueError(
+                f"Cannot truncate structure with {len(self)} elements to {length}"
+            )
+
+        if length >= num_original_elements:
+            del self._appended_elements[length - num_original_elements :]
+        else:
+            # pending updates of the remaining elements stay valid for the truncated
+            # structure, so they do not have to be persisted first
+            self._appended_elements = []
+            self._updated_elements = {
+                index: element
+                for index, element in self._updated_elements.items()
+                if index < length
+            }
+            self._original_structure = self._original_structure.truncate(length)
+
+    def pop(self) -> TElement:
+        if len(self) == 0:
+            raise IndexError("Cannot pop from empty structure")
+
+        element = self[-1]
+        self.truncate(len(self) - 1)
+        return element
+
+    def delete(self, index: int, stop: int | None = None) -> None:
+        start, stop = normalize_deletion_range(index, stop, len(self))
+        num_original_elements = len(self._original_structure)
+
+        if start >= num_original_elements:
+            del self._appended_elements[
+                start - num_original_elements : stop - num_original_elements
+            ]
+        elif stop == len(self):
+            self.truncate(start)
+        else:
+            self._original_structure = self.persistent().delete(start, stop)
+            self._updated_elements = {}
+            self._appended_elements = []
+
+    def __delitem__(self, index: int) -> None:
+        self.delete(index)
@@ -29,7 +29,11 @@ TElement = TypeVar("TElement")
 class HashableVector(BaseHashableStructure[TElement], Sequence[TElement]):
     @classmethod
     def from_iterable(
-        cls, iterable: Iterable[TElement], sedes: "Vector[TElement, TElement]"
+        cls,
+        iterable: Iterable[TElement],
+        sedes: "Vector[TElement, TElement]",
+        lazy: bool = False,
+        chunks_only: bool = False,
     ):
         elements = pvector(iterable)
         if len(elements) != sedes.length:
@@ -37,7 +41,13 @@ class HashableVector(BaseHashableStructure[TElement], Sequence[TElement]):
                 f"Vector has length {sedes.length}, but "
                 f"{len(elements)} elements are given"
             )
-        return super().from_iterable_and_sedes(elements, sedes, max_length=None)
+        return super().from_iterable_and_sedes(
+            elements,
+            sedes,
+            max_length=None,
+            lazy=lazy,
+            chunks_only=chunks_only,
+        )
 
     @property
     def hash_tree_root(self) -> Hash32:
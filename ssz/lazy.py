@@ -0,0 +1,260 @@
+from abc import (
+    abstractmethod,
+)
+from collections.abc import (
+    Sequence,
+)
+from typing import (
+    Any,
+)
+
+from ssz.constants import (
+    OFFSET_SIZE,
+)
+from ssz.exceptions import (
+    DeserializationError,
+)
+from ssz.sedes.base import (
+    BaseSedes,
+)
+from ssz.sedes.basic import (
+    deserialize_element,
+)
+from ssz.sedes.container import (
+    Container,
+)
+from ssz.sedes.list import (
+    List,
+)
+from ssz.sedes.vector import (
+    Vector,
+)
+from ssz.utils import (
+    get_variable_size_part_bounds,
+    read_offset,
+)
+
+# marks fields and elements which have not been decoded yet
+NOT_DECODED = object()
+
+
+def get_container_sedes(sedes: BaseSedes) -> Container | None:
+    """
+    Return the container sedes of containers, serializable classes and hashable
+    container classes, or None for any other sedes.
+    """
+    if isinstance(sedes, Container):
+        return sedes
+    elif isinstance(sedes, type):
+        meta = getattr(sedes, "_meta", None)
+        return getattr(meta, "container_sedes", None)
+    else:
+        return None
+
+
+def decode_lazy(data: bytes, sedes: BaseSedes, hashable: bool = True) -> Any:
+    """
+    Decode a SSZ encoded value lazily.
+
+    Containers, serializable and hashable container values are returned as a
+    :class:`LazyContainer` and lists and vectors of composite elements as a
+    :class:`LazySequence`. Both keep a view of `data` and only decode a field or
+    element when it is accessed, nested values again lazily. All other values are
+    decoded right away, as by :func:`ssz.decode`.
+
+    `data` is not copied, so it must not be modified while the result is in use.
+    """
+    view = memoryview(data)
+    if get_container_sedes(sedes) is not None:
+        return LazyContainer(view, sedes, hashable)
+    elif isinstance(sedes, (List, Vector)) and not sedes.is_packing:
+        return LazySequence(view, sedes, hashable)
+    else:
+        return deserialize_element(sedes, view, hashable)
+
+
+class BaseLazyValue(Sequence[Any]):
+    """
+    Base class of lazily decoded values, which are abstract sequences of their fields
+    or elements.
+    """
+
+    __slots__ = ("_data", "_sedes", "_hashable", "_values")
+
+    def __init__(self, data: memoryview, sedes: BaseSedes, hashable: bool) -> None:
+        self._data = data
+        self._sedes = sedes
+        self._hashable = hashable
+
+    @property
+    def sedes(self) -> BaseSedes:
+        return self._sedes
+
+    def to_bytes(self) -> bytes:
+        """The serialized value, a copy of the data it is decoded from."""
+        return self._data.tobytes()
+
+    def decode(self) -> Any:
+        """Decode the complete value eagerly, as by :func:`ssz.decode`."""
+        return deserialize_element(self._sedes, self._data, self._hashable)
+
+    @property
+    def hash_tree_root(self) -> bytes:
+        return self._sedes.get_hash_tree_root(self.decode())
+
+    def _get_value(self, index: int) -> Any:
+        value = self._values[index]
+        if value is NOT_DECODED:
+            start, stop = self._get_bounds(index)
+            value = decode_lazy(
+                self._data[start:stop], self._get_element_sedes(index), self._hashable
+            )
+            self._values[index] = value
+        return value
+
+    @abstractmethod
+    def _get_bounds(self, index: int) -> tuple[int, int]:
+        """Return the start and stop of the field or element in the data."""
+        ...
+
+    @abstractmethod
+    def _get_element_sedes(self, index: int) -> BaseSedes:
+        ...
+
+    def __len__(self) -> int:
+        return len(self._values)
+
+    def __repr__(self) -> str:
+        return f"<{self.__class__.__name__} of {len(self._data)} bytes: {self._sedes}>"
+
+
+class LazyContainer(BaseLazyValue):
+    """
+    A container value which decodes its fields on first access.
+
+    Fields are accessed by index, and by name as item or attribute if the value is
+    an instance of a serializable or hashable container class.
+    """
+
+    __slots__ = ("_container_sedes", "_field_names")
+
+    def __init__(self, data: memoryview, sedes: BaseSedes, hashable: bool) -> None:
+        super().__init__(data, sedes, hashable)
+        self._container_sedes = get_container_sedes(sedes)
+        if self._container_sedes is sedes:
+            self._field_names = None
+        else:
+            self._field_names = sedes._meta.field_names
+        self._values = [NOT_DECODED] * len(self._container_sedes.field_sedes)
+
+        # the fields are located with the fixed size section, so make sure it is there
+        self._container_sedes.get_field_bounds(data, 0)
+
+    def _get_bounds(self, index: int) -> tuple[int, int]:
+        return self._container_sedes.get_field_bounds(self._data, index)
+
+    def _get_element_sedes(self, index: int) -> BaseSedes:
+        return self._container_sedes.field_sedes[index]
+
+    @property
+    def field_names(self) -> tuple[str, ...] | None:
+        return self._field_names
+
+    def __getitem__(self, index):
+        if isinstance(index, str):
+            return self._get_value(self._get_field_index(index))
+        elif isinstance(index, slice):
+            return tuple(self._get_value(i) for i in range(len(self))[index])
+        elif not -len(self) <= index < len(self):
+            raise IndexError(f"Container has {len(self)} fields, got index {index}")
+        return self._get_value(index % len(self))
+
+    def __getattr__(self, name: str) -> Any:
+        # only called for attributes which are not found otherwise, the slots are
+        # excluded in case they are not set yet
+        if name.startswith("_") or self._field_names is None:
+            raise AttributeError(name)
+        if name not in self._field_names:
+            raise AttributeError(f"Container has no field {name}")
+        return self._get_value(self._field_names.index(name))
+
+    def _get_field_index(self, name: str) -> int:
+        if self._field_names is None or name not in self._field_names:
+            raise KeyError(f"Container has no field {name}")
+        return self._field_names.index(name)
+
+
+class LazySequence(BaseLazyValue):
+    """
+    A list or vector of composite elements which decodes its elements on access.
+    """
+
+    __slots__ = ("_element_size",)
+
+    def __init__(self, data: memoryview, sedes: List | Vector, hashable: bool) -> None:
+        super().__init__(data, sedes, hashable)
+
+        element_sedes = sedes.element_sedes
+        if element_sedes.is_fixed_sized:
+            self._element_size = element_sedes.get_fixed_size()
+            if len(data) % self._element_size != 0:
+                raise DeserializationError(
+                    f"Cannot deserialize length {len(data)} data as sequence of "
+                    f"elements of size {self._element_size}"
+                )
+            length = len(data) // self._element_size
+        else:
+            self._element_size = None
+            first_offset = read_offset(data, 0) if len(data) > 0 else 0
+            if first_offset % OFFSET_SIZE != 0 or first_offset == 0 < len(data):
+                raise DeserializationError(
+                    f"First offset {first_offset} is not a positive multiple of "
+                    f"{OFFSET_SIZE}"
+                )
+            # the offsets are read on access, so reject a first offset pointing past
+            # the data before allocating the elements it implies
+            if first_offset > len(data):
+                raise DeserializationError(
+                    f"First offset {first_offset} points past the end of the data of "
+                    f"length {len(data)}"
+                )
+            length = first_offset // OFFSET_SIZE
+
+        if isinstance(sedes, Vector) and length != sedes.length:
+            raise DeserializationError(
+                f"Expected {sedes.length} vector elements, got {length}"
+            )
+        elif isinstance(sedes, List) and length > sedes.max_length:
+            raise DeserializationError(
+                f"Expected at most {sedes.max_length} list elements, got {length}"
+            )
+        self._values = [NOT_DECODED] * length
+
+    def _get_bounds(self, index: int) -> tuple[int, int]:
+        if self._element_size is not None:
+            start = index * self._element_size
+            return start, start + self._element_size
+
+        # the offsets of the element and its neighbours are validated together with
+        # the first one, which has to point to the end of the offsets
+        offset_indices = sorted(
+            {0, max(index - 1, 0), index, index + 1}.difference({len(self)})
+        )
+        offsets = tuple(
+            read_offset(self._data, offset_index * OFFSET_SIZE)
+            for offset_index in offset_indices
+        )
+        bounds = get_variable_size_part_bounds(
+            offsets, len(self) * OFFSET_SIZE, len(self._data)
+        )
+        return bounds[offset_indices.index(index)]
+
+    def _get_element_sedes(self, index: int) -> BaseSedes:
+        return self._sedes.element_sedes
+
+    def __getitem__(self, index):
+        if isinstance(index, slice):
+            return tuple(self._get_value(i) for i in range(len(self))[index])
+        elif not -len(self) <= index < len(self):
+            raise IndexError(f"Sequence has {len(self)} elements, got index {index}")
+        return self._get_value(index % len(self))
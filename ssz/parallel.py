@@ -0,0 +1,143 @@
+from collections.abc import (
+    Iterable,
+    Sequence,
+)
+from concurrent.futures import (
+    Executor,
+)
+import itertools
+from typing import (
+    TYPE_CHECKING,
+    Any,
+)
+
+from eth_typing import (
+    Hash32,
+)
+from eth_utils.toolz import (
+    partition_all,
+)
+
+if TYPE_CHECKING:
+    from ssz.sedes.base import (
+        TSedes,
+    )
+
+DEFAULT_PARALLEL_MIN_ELEMENTS = 2**12
+DEFAULT_PARALLEL_MIN_CHUNKS = 2**16
+DEFAULT_SHARD_SIZE = 2**10
+DEFAULT_SUBTREE_DEPTH = 12
+
+_executor: Executor | None = None
+_min_elements = DEFAULT_PARALLEL_MIN_ELEMENTS
+_min_chunks = DEFAULT_PARALLEL_MIN_CHUNKS
+
+
+def set_executor(
+    executor: Executor | None,
+    min_elements: int = DEFAULT_PARALLEL_MIN_ELEMENTS,
+    min_chunks: int = DEFAULT_PARALLEL_MIN_CHUNKS,
+) -> None:
+    """
+    Compute the roots of large values with the given executor.
+
+    Only sequences of at least `min_elements` composite elements are distributed, as
+    sending the elements to the workers is not free. Likewise, only merkle trees of
+    at least `min_chunks` chunks are split into subtrees hashed by the workers.
+    Passing `None` computes all roots in the calling thread again, which is the
+    default.
+
+    The elements are sent to the workers serialized and the chunks as plain byte
+    strings, so the executor is typically a
+    :class:`concurrent.futures.ProcessPoolExecutor`.
+    """
+    global _executor, _min_elements, _min_chunks
+
+    if min_elements < 1:
+        raise ValueError(
+            f"Minimum number of elements must be positive, got {min_elements}"
+        )
+    if min_chunks < 1:
+        raise ValueError(f"Minimum number of chunks must be positive, got {min_chunks}")
+
+    _executor = executor
+    _min_elements = min_elements
+    _min_chunks = min_chunks
+
+
+def get_executor() -> Executor | None:
+    """Return the executor set with :func:`set_executor`, if any."""
+    return _executor
+
+
+def resolve_executor(
+    element_count: int, executor: Executor | None = None
+) -> Executor | None:
+    """
+    Return the executor to compute the roots of `element_count` elements with.
+
+    An explicitly given executor is always used, the configured one only for
+    sufficiently many elements.
+    """
+    if executor is not None:
+        return executor
+    elif _executor is not None and element_count >= _min_elements:
+        return _executor
+    else:
+        return None
+
+
+def resolve_merkleization_executor(
+    chunk_count: int, executor: Executor | None = None
+) -> Executor | None:
+    """
+    Return the executor to hash the subtrees of a tree of `chunk_count` chunks with.
+
+    An explicitly given executor is always used, the configured one only for
+    sufficiently many chunks.
+    """
+    if executor is not None:
+        return executor
+    elif _executor is not None and chunk_count >= _min_chunks:
+        return _executor
+    else:
+        return None
+
+
+def compute_element_roots(
+    elements: Iterable[Any],
+    element_sedes: "TSedes",
+    executor: Executor,
+    shard_size: int = DEFAULT_SHARD_SIZE,
+) -> tuple[Hash32, ...]:
+    """
+    Compute the hash tree roots of the elements in shards with the given executor.
+    """
+    shards = partition_all(
+        shard_size, (element_sedes.serialize(element) for element in elements)
+    )
+    shard_roots = executor.map(
+        _compute_shard_roots,
+        itertools.repeat(_get_plain_sedes(element_sedes)),
+        shards,
+    )
+    return tuple(itertools.chain.from_iterable(shard_roots))
+
+
+def _get_plain_sedes(sedes: "TSedes") -> "TSedes":
+    # Instances of serializable classes are hashed with a cache of their own, which is
+    # of no use for the short-lived values in the workers, so hash their fields
+    # directly. The roots are the same.
+    if isinstance(sedes, type) and sedes._meta is not None:
+        return sedes._meta.container_sedes
+    else:
+        return sedes
+
+
+def _compute_shard_roots(
+    element_sedes: "TSedes", serialized_elements: Sequence[bytes]
+) -> tuple[Hash32, ...]:
+    return tuple(
+        element_sedes.get_hash_tree_root(element_sedes.deserialize(data))
+        for data in serialized_elements
+    )
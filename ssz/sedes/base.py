@@ -2,6 +2,9 @@ from abc import (
     ABC,
     abstractmethod,
 )
+from collections.abc import (
+    Iterator,
+)
 from typing import (
     Any,
     Generic,
@@ -38,6 +41,22 @@ class BaseSedes(ABC, Generic[TSerializable, TDeserialized]):
     def serialize(self, value: TSerializable) -> bytes:
         ...
 
+    def serialize_parts(self, value: TSerializable) -> Iterator[bytes]:
+        """
+        Serialize a value piece by piece.
+
+        The concatenation of the returned byte strings is the serialization of the
+        value. Composite sedes yield the serializations of the values they contain
+        instead of joining them first.
+        """
+        yield self.serialize(value)
+
+    def get_serialized_size(self, value: TSerializable) -> int:
+        if self.is_fixed_sized:
+            return self.get_fixed_size()
+        else:
+            return len(self.serialize(value))
+
     #
     # Deserialization
     #
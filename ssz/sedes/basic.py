@@ -1,15 +1,14 @@
 from abc import (
     abstractmethod,
 )
+import array
 from collections.abc import (
     Generator,
     Iterable,
+    Iterator,
     Sequence,
 )
-import io
-import operator
 from typing import (
-    IO,
     Any,
 )
 
@@ -19,10 +18,6 @@ from eth_typing import (
 from eth_utils import (
     to_tuple,
 )
-from eth_utils.toolz import (
-    accumulate,
-    concatv,
-)
 
 from ssz import (
     constants,
@@ -33,8 +28,8 @@ from ssz.cache.utils import (
 from ssz.constants import (
     CHUNK_SIZE,
 )
-from ssz.exceptions import (
-    DeserializationError,
+from ssz.hashable_structure import (
+    BaseHashableStructure,
 )
 from ssz.sedes.base import (
     BaseBitfieldCompositeSedes,
@@ -70,6 +65,24 @@ class BasicSedes(BaseSedes[TSerializable, TDeserialized]):
     def get_fixed_size(self):
         return self.size
 
+    #
+    # Serialization
+    #
+    def serialize_sequence(self, values: Iterable[TSerializable]) -> bytes:
+        """
+        Serialize a sequence of values, as packed in lists and vectors.
+        """
+        return b"".join(self.serialize(value) for value in values)
+
+    def deserialize_sequence(self, data: bytes) -> tuple[TDeserialized, ...]:
+        """
+        Deserialize the packed values in `data`, a multiple of the size long.
+        """
+        return tuple(
+            self.deserialize(bytes(data[start : start + self.size]))
+            for start in range(0, len(data), self.size)
+        )
+
     #
     # Tree hashing
     #
@@ -87,7 +100,7 @@ class BasicSedes(BaseSedes[TSerializable, TDeserialized]):
         return get_key(self, value)
 
 
-def _compute_fixed_size_section_length(element_sedes: Iterable[TSedes]) -> int:
+def compute_fixed_size_section_length(element_sedes: Iterable[TSedes]) -> int:
     return sum(
         sedes.get_fixed_size() if sedes.is_fixed_sized else constants.OFFSET_SIZE
         for sedes in element_sedes
@@ -110,67 +123,82 @@ class ProperCompositeSedes(BaseProperCompositeSedes[TSerializable, TDeserialized
     def _validate_serializable(self, value: Any) -> None:
         ...
 
+    @abstractmethod
+    def get_fixed_size_section_length(self, value: TSerializable) -> int:
+        """
+        Return the length of the fixed size section of the serialized value.
+
+        It consists of the serialized fixed size elements and the offsets of the
+        variable size ones.
+        """
+        ...
+
     def serialize(self, value: TSerializable) -> bytes:
+        # the parts of nested values are only joined once, here at the top level
+        return b"".join(self.serialize_parts(value))
+
+    def serialize_parts(self, value: TSerializable) -> Iterator[bytes]:
         self._validate_serializable(value)
 
         if not len(value):
-            return b""
+            return
 
-        pairs = self._get_item_sedes_pairs(value)  # slow
-        element_sedes = tuple(sedes for element, sedes in pairs)
+        if self.is_packing:
+            if (
+                isinstance(value, BaseHashableStructure)
+                and value.sedes is self
+                and value.is_chunks_only
+            ):
+                # the chunks already contain the serialized elements
+                yield value.elements.to_bytes()
+                return
+            # sequences of basic values are serialized in one piece
+            yield self.get_element_sedes(0).serialize_sequence(value)
+            return
 
-        has_fixed_size_section_length_cache = hasattr(
-            value, "_fixed_size_section_length_cache"
-        )
-        if has_fixed_size_section_length_cache:
-            if value._fixed_size_section_length_cache is None:
-                fixed_size_section_length = _compute_fixed_size_section_length(
-                    element_sedes
-                )
-                value._fixed_size_section_length_cache = fixed_size_section_length
+        pairs = self._get_item_sedes_pairs(value)  # slow
+        fixed_size_section_length = self.get_fixed_size_section_length(value)
+
+        # fixed size section, containing the offsets of the variable size values
+        variable_size_pairs = []
+        next_offset = fixed_size_section_length
+        for item, sedes in pairs:
+            if isinstance(sedes, BasicSedes):
+                yield sedes.serialize(item)
+            elif sedes.is_fixed_sized:
+                yield from sedes.serialize_parts(item)  # slow
             else:
-                fixed_size_section_length = value._fixed_size_section_length_cache
-        else:
-            fixed_size_section_length = _compute_fixed_size_section_length(
-                element_sedes
-            )
-
-        variable_size_section_parts = tuple(
-            sedes.serialize(item)  # slow
-            for item, sedes in pairs
-            if not sedes.is_fixed_sized
-        )
-
-        if variable_size_section_parts:
-            offsets = tuple(
-                accumulate(
-                    operator.add,
-                    map(len, variable_size_section_parts[:-1]),
-                    fixed_size_section_length,
-                )
-            )
+                yield encode_offset(next_offset)
+                next_offset += sedes.get_serialized_size(item)
+                variable_size_pairs.append((item, sedes))
+
+        # variable size section
+        for item, sedes in variable_size_pairs:
+            yield from sedes.serialize_parts(item)  # slow
+
+    def get_serialized_size(self, value: TSerializable) -> int:
+        if self.is_fixed_sized:
+            return self.get_fixed_size()
+
+        if isinstance(value, BaseHashableStructure) and value.sedes is self:
+            # hashable structures are immutable, so their size can be memoized
+            if value._serialized_size_cache is None:
+                value._serialized_size_cache = self._compute_serialized_size(value)
+            return value._serialized_size_cache
         else:
-            offsets = ()
+            return self._compute_serialized_size(value)
 
-        offsets_iter = iter(offsets)
+    def _compute_serialized_size(self, value: TSerializable) -> int:
+        self._validate_serializable(value)
+        if self.is_packing:
+            return len(value) * self.get_element_sedes(0).get_fixed_size()
 
-        fixed_size_section_parts = tuple(
-            sedes.serialize(item)  # slow
-            if sedes.is_fixed_sized
-            else encode_offset(next(offsets_iter))
-            for item, sedes in pairs
+        variable_size_section_length = sum(
+            sedes.get_serialized_size(item)
+            for item, sedes in self._get_item_sedes_pairs(value)
+            if not sedes.is_fixed_sized
         )
-
-        try:
-            next(offsets_iter)
-        except StopIteration:
-            pass
-        else:
-            raise DeserializationError(
-                "Did not consume all offsets while decoding value"
-            )
-
-        return b"".join(concatv(fixed_size_section_parts, variable_size_section_parts))
+        return self.get_fixed_size_section_length(value) + variable_size_section_length
 
     def serialize_element_for_tree(self, index: int, element: TSerializable) -> bytes:
         sedes = self.get_element_sedes(index)
@@ -187,22 +215,47 @@ class ProperCompositeSedes(BaseProperCompositeSedes[TSerializable, TDeserialized
         else:
             return CHUNK_SIZE
 
-    def deserialize(self, data: bytes) -> TDeserialized:
-        stream = io.BytesIO(data)
-        value = self._deserialize_stream(stream)
-        extra_data = stream.read()
-        if extra_data:
-            raise DeserializationError(f"Got {len(extra_data)} superfluous bytes")
-        return value
+    def deserialize(self, data: bytes, hashable: bool = True) -> TDeserialized:
+        """
+        Deserialize a value.
+
+        Lists and vectors are returned as hashable structures by default, but with
+        `hashable` set to false they are returned as plain tuples, which skips creating
+        hash trees completely. This applies to all levels of nesting.
+
+        `data` can be any bytes-like object. It is not copied: nested composite values
+        are deserialized from views into it and only the data of basic values and
+        byte strings ends up in new `bytes` objects.
+        """
+        return self._deserialize_view(memoryview(data), hashable)
 
     @abstractmethod
-    def _deserialize_stream(self, stream: IO[bytes]) -> TDeserialized:
+    def _deserialize_view(
+        self, data: memoryview, hashable: bool = True
+    ) -> TDeserialized:
+        """Deserialize a value which has to span all of `data`."""
         ...
 
     def get_key(self, value: Any) -> str:
         return get_key(self, value)
 
 
+def deserialize_element(sedes: TSedes, data: bytes, hashable: bool = True) -> Any:
+    """
+    Deserialize a value with the given sedes, usually one nested in a composite value.
+
+    Composite sedes and serializable classes work on a view of `data` and receive
+    `hashable`. Other sedes always deserialize to the same values and get a copy of
+    `data` as `bytes`.
+    """
+    if not isinstance(sedes, (ProperCompositeSedes, type)):
+        return sedes.deserialize(bytes(data))
+    elif hashable:
+        return sedes.deserialize(data)
+    else:
+        return sedes.deserialize(data, hashable=hashable)
+
+
 class HomogeneousProperCompositeSedes(
     ProperCompositeSedes[TSerializable, TDeserialized]
 ):
@@ -214,6 +267,27 @@ class HomogeneousProperCompositeSedes(
     def is_packing(self) -> bool:
         return isinstance(self.element_sedes, BasicSedes)
 
+    def deserialize_array(self, data: bytes) -> array.array:
+        """
+        Deserialize a list or vector of unsigned integers into an :class:`array.array`.
+
+        Unlike :meth:`deserialize`, this does not create an integer object per element.
+        """
+        if not hasattr(self.element_sedes, "deserialize_array"):
+            raise TypeError(f"Cannot deserialize {self.get_sedes_id()} into an array")
+        self._validate_fixed_size_elements_data(data)
+        return self.element_sedes.deserialize_array(data)
+
+    @abstractmethod
+    def _validate_fixed_size_elements_data(self, data: bytes) -> None:
+        ...
+
+    def get_fixed_size_section_length(self, value: TSerializable) -> int:
+        if self.element_sedes.is_fixed_sized:
+            return len(value) * self.element_sedes.get_fixed_size()
+        else:
+            return len(value) * constants.OFFSET_SIZE
+
     @property
     def chunk_count(self) -> int:
         if self.is_packing:
@@ -9,10 +9,10 @@ from typing import (
 from eth_typing import (
     Hash32,
 )
-from eth_utils import (
-    to_tuple,
-)
 
+from ssz.bitfield import (
+    Bitfield,
+)
 from ssz.exceptions import (
     DeserializationError,
     SerializationError,
@@ -55,6 +55,15 @@ class Bitlist(BitfieldCompositeSedes[BytesOrByteArray, bytes]):
     def chunk_count(self) -> int:
         return (self.max_bit_count + 255) // 256
 
+    def get_serialized_size(self, value: Sequence[bool]) -> int:
+        if len(value) > self.max_bit_count:
+            raise SerializationError(
+                f"Cannot serialize length {len(value)} bit array as "
+                f"Bitlist[{self.max_bit_count}]"
+            )
+        # one additional bit marks the length
+        return len(value) // 8 + 1
+
     def serialize(self, value: Sequence[bool]) -> bytes:
         len_value = len(value)
         if len_value > self.max_bit_count:
@@ -63,6 +72,10 @@ class Bitlist(BitfieldCompositeSedes[BytesOrByteArray, bytes]):
                 f"Bitlist[{self.max_bit_count}]"
             )
 
+        if isinstance(value, Bitfield):
+            # the length is marked by one additional bit
+            return (value.bits | 1 << len_value).to_bytes(len_value // 8 + 1, "little")
+
         serialized_bytearray = get_serialized_bytearray(
             value, len_value, extra_byte=True
         )
@@ -72,8 +85,7 @@ class Bitlist(BitfieldCompositeSedes[BytesOrByteArray, bytes]):
     #
     # Deserialization
     #
-    @to_tuple
-    def deserialize(self, data: bytes) -> tuple[bool, ...]:
+    def deserialize(self, data: bytes) -> Bitfield:
         # Length of data should be larger than 1
         if len(data) < 1:
             raise DeserializationError(
@@ -98,8 +110,8 @@ class Bitlist(BitfieldCompositeSedes[BytesOrByteArray, bytes]):
                 f"Bitlist[{self.max_bit_count}]"
             )
 
-        for bit_index in range(len_value):
-            yield bool((data[bit_index // 8] >> bit_index % 8) % 2)
+        # strip the bit marking the length
+        return Bitfield(as_integer ^ 1 << len_value, len_value)
 
     #
     # Tree hashing
@@ -9,10 +9,10 @@ from typing import (
 from eth_typing import (
     Hash32,
 )
-from eth_utils import (
-    to_tuple,
-)
 
+from ssz.bitfield import (
+    Bitfield,
+)
 from ssz.exceptions import (
     DeserializationError,
     SerializationError,
@@ -58,21 +58,21 @@ class Bitvector(BitfieldCompositeSedes[BytesOrByteArray, bytes]):
                 f"Cannot serialize length {len(value)} bit array as "
                 f"Bitvector[{self.bit_count}]"
             )
+        if isinstance(value, Bitfield):
+            return value.to_bytes()
         return bytes(get_serialized_bytearray(value, self.bit_count, extra_byte=False))
 
     #
     # Deserialization
     #
-    @to_tuple
-    def deserialize(self, data: bytes) -> bytes:
-        if len(data) > (self.bit_count + 7) // 8:
+    def deserialize(self, data: bytes) -> Bitfield:
+        if len(data) != (self.bit_count + 7) // 8:
             raise DeserializationError(
                 f"Cannot deserialize length {len(data)} bytes data as "
                 f"Bitvector[{self.bit_count}]"
             )
 
-        for bit_index in range(self.bit_count):
-            yield bool((data[bit_index // 8] >> bit_index % 8) % 2)
+        return Bitfield.from_bytes(data, self.bit_count)
 
     #
     # Tree hashing
@@ -1,3 +1,9 @@
+from collections.abc import (
+    Iterator,
+)
+from concurrent.futures import (
+    Executor,
+)
 from typing import (
     Union,
 )
@@ -42,6 +48,12 @@ class ByteList(List[BytesOrByteArray, bytes]):
 
         return value
 
+    def serialize_parts(self, value: BytesOrByteArray) -> Iterator[bytes]:
+        yield self.serialize(value)
+
+    def get_serialized_size(self, value: BytesOrByteArray) -> int:
+        return len(self.serialize(value))
+
     def serialize_element_for_tree(self, index: int, byte_value: int) -> bytes:
         if not 0 <= byte_value < 256:
             raise SerializationError(
@@ -50,17 +62,20 @@ class ByteList(List[BytesOrByteArray, bytes]):
 
         return bytes((byte_value,))
 
-    def deserialize(self, data: bytes) -> bytes:
+    def deserialize(self, data: bytes, hashable: bool = True) -> bytes:
+        # byte strings are not hashable structures, so `hashable` does not apply
         if len(data) > self.max_length:
             raise DeserializationError(
                 f"Cannot deserialize length {len(data)} data as ByteList{self.length}"
             )
-        return data
+        return bytes(data)
 
-    def get_hash_tree_root(self, value: bytes) -> bytes:
+    def get_hash_tree_root(
+        self, value: bytes, executor: Executor | None = None
+    ) -> bytes:
         serialized_value = self.serialize(value)
         merkle_leaves = pack_bytes(serialized_value)
-        merkleized = merkleize(merkle_leaves, limit=self.chunk_count)
+        merkleized = merkleize(merkle_leaves, limit=self.chunk_count, executor=executor)
         return mix_in_length(merkleized, len(value))
 
     def get_sedes_id(self) -> str:
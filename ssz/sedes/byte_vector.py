@@ -1,3 +1,6 @@
+from collections.abc import (
+    Iterator,
+)
 from typing import (
     Union,
 )
@@ -43,6 +46,12 @@ class ByteVector(Vector[BytesOrByteArray, bytes]):
 
         return value
 
+    def serialize_parts(self, value: BytesOrByteArray) -> Iterator[bytes]:
+        yield self.serialize(value)
+
+    def get_serialized_size(self, value: BytesOrByteArray) -> int:
+        return len(self.serialize(value))
+
     def serialize_element_for_tree(self, index: int, byte_value: int) -> bytes:
         if not 0 <= byte_value < 256:
             raise SerializationError(
@@ -51,12 +60,13 @@ class ByteVector(Vector[BytesOrByteArray, bytes]):
 
         return bytes((byte_value,))
 
-    def deserialize(self, data: bytes) -> bytes:
+    def deserialize(self, data: bytes, hashable: bool = True) -> bytes:
+        # byte strings are not hashable structures, so `hashable` does not apply
         if len(data) != self.length:
             raise DeserializationError(
                 f"Cannot deserialize length {len(data)} data as bytes{self.length}"
             )
-        return data
+        return bytes(data)
 
     def get_hash_tree_root(self, value: bytes) -> bytes:
         serialized_value = self.serialize(value)
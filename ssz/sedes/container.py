@@ -1,10 +1,10 @@
 from collections.abc import (
-    Iterable,
     Sequence,
 )
+import struct
 from typing import (
-    IO,
     Any,
+    NamedTuple,
 )
 
 from eth_typing import (
@@ -12,12 +12,11 @@ from eth_typing import (
 )
 from eth_utils import (
     ValidationError,
-    to_tuple,
-)
-from eth_utils.toolz import (
-    sliding_window,
 )
 
+from ssz.constants import (
+    OFFSET_SIZE,
+)
 from ssz.exceptions import (
     DeserializationError,
     SerializationError,
@@ -31,26 +30,43 @@ from ssz.sedes.base import (
 )
 from ssz.sedes.basic import (
     ProperCompositeSedes,
+    compute_fixed_size_section_length,
+    deserialize_element,
+)
+from ssz.sedes.struct_codec import (
+    StructCodec,
 )
 from ssz.typing import (
     CacheObj,
 )
 from ssz.utils import (
+    get_variable_size_part_bounds,
     merkleize,
-    read_exact,
-    s_decode_offset,
+    read_offset,
+    read_view,
 )
 
 
-@to_tuple
-def _deserialize_fixed_size_items_and_offsets(stream, field_sedes):
+class FieldSlot(NamedTuple):
+    """The place of a container field in the fixed size section of its values."""
+
+    # start of the field, or of its offset if the field is variable size
+    position: int
+    # size of the field, or of its offset if the field is variable size
+    size: int
+    is_fixed_sized: bool
+
+
+def compute_field_slots(field_sedes: Sequence[TSedes]) -> tuple[FieldSlot, ...]:
+    slots = []
+    position = 0
     for sedes in field_sedes:
         if sedes.is_fixed_sized:
-            field_size = sedes.get_fixed_size()
-            field_data = read_exact(field_size, stream)
-            yield (sedes.deserialize(field_data), sedes)
+            slots.append(FieldSlot(position, sedes.get_fixed_size(), True))
         else:
-            yield (s_decode_offset(stream), sedes)
+            slots.append(FieldSlot(position, OFFSET_SIZE, False))
+        position += slots[-1].size
+    return tuple(slots)
 
 
 class Container(ProperCompositeSedes[Sequence[Any], tuple[Any, ...]]):
@@ -59,18 +75,40 @@ class Container(ProperCompositeSedes[Sequence[Any], tuple[Any, ...]]):
             raise ValidationError("Cannot define container without any fields")
         self.field_sedes = tuple(field_sedes)
 
+        # the sizes are queried for every value, so compute them only once
+        self._is_fixed_sized = all(field.is_fixed_sized for field in self.field_sedes)
+        if self._is_fixed_sized:
+            self._fixed_size = sum(field.get_fixed_size() for field in self.field_sedes)
+        self._fixed_size_section_length = compute_fixed_size_section_length(
+            self.field_sedes
+        )
+        # where each field or its offset is found in serialized values
+        self.field_slots = compute_field_slots(self.field_sedes)
+        self._variable_size_field_indices = tuple(
+            index
+            for index, slot in enumerate(self.field_slots)
+            if not slot.is_fixed_sized
+        )
+        # values of fixed size containers are packed and unpacked in one go
+        self._struct_codec = (
+            StructCodec(self.field_sedes) if self._is_fixed_sized else None
+        )
+
     #
     # Size
     #
     @property
     def is_fixed_sized(self):
-        return all(field.is_fixed_sized for field in self.field_sedes)
+        return self._is_fixed_sized
 
     def get_fixed_size(self):
         if not self.is_fixed_sized:
             raise ValueError("Container contains dynamically sized elements")
 
-        return sum(field.get_fixed_size() for field in self.field_sedes)
+        return self._fixed_size
+
+    def get_fixed_size_section_length(self, value: Sequence[Any]) -> int:
+        return self._fixed_size_section_length
 
     #
     # Serialization
@@ -96,82 +134,99 @@ class Container(ProperCompositeSedes[Sequence[Any], tuple[Any, ...]]):
     #
     # Deserialization
     #
-    def deserialize_fixed_size_parts(
-        self, stream: IO[bytes]
-    ) -> Iterable[tuple[tuple[Any], tuple[int, TSedes]]]:
-        fixed_items_and_offets = _deserialize_fixed_size_items_and_offsets(
-            stream, self.field_sedes
-        )
-        fixed_size_values = tuple(
-            item for item, sedes in fixed_items_and_offets if sedes.is_fixed_sized
+    def _deserialize_view(
+        self, data: memoryview, hashable: bool = True
+    ) -> tuple[Any, ...]:
+        if self._struct_codec is not None and len(data) == self._fixed_size:
+            return self._struct_codec.decode(data, hashable)
+
+        # fixed size section: fixed size fields and offsets of variable size fields
+        values: list[Any] = []
+        for sedes, slot in zip(self.field_sedes, self.field_slots):
+            if slot.is_fixed_sized:
+                field_data = read_view(data, slot.position, slot.size)
+                values.append(deserialize_element(sedes, field_data, hashable))
+            else:
+                values.append(None)
+
+        if not self._variable_size_field_indices:
+            if self._fixed_size_section_length != len(data):
+                raise DeserializationError(
+                    f"Got {len(data) - self._fixed_size_section_length} superfluous "
+                    f"bytes"
+                )
+            return tuple(values)
+
+        # variable size section
+        offsets = tuple(
+            read_offset(data, self.field_slots[field_index].position)
+            for field_index in self._variable_size_field_indices
         )
-        offset_pairs = tuple(
-            (item, sedes)
-            for item, sedes in fixed_items_and_offets
-            if not sedes.is_fixed_sized
+        field_bounds = get_variable_size_part_bounds(
+            offsets, self._fixed_size_section_length, len(data)
         )
-        return fixed_size_values, offset_pairs
-
-    @to_tuple
-    def deserialize_variable_size_parts(
-        self, offset_pairs: tuple[tuple[int, TSedes], ...], stream: IO[bytes]
-    ) -> Iterable[Any]:
-        offsets, fields = zip(*offset_pairs)
-
-        *head_fields, last_field = fields
-        for sedes, (left_offset, right_offset) in zip(
-            head_fields, sliding_window(2, offsets)
+        for field_index, (start, stop) in zip(
+            self._variable_size_field_indices, field_bounds
         ):
-            field_length = right_offset - left_offset
-            field_data = read_exact(field_length, stream)
-            yield sedes.deserialize(field_data)
+            values[field_index] = deserialize_element(
+                self.field_sedes[field_index], data[start:stop], hashable
+            )
 
-        # simply reading to the end of the current stream gives us all of the final
-        # element data
-        final_field_data = stream.read()
-        yield last_field.deserialize(final_field_data)
+        return tuple(values)
 
-    def _deserialize_stream(self, stream: IO[bytes]) -> tuple[Any, ...]:
-        if not self.field_sedes:
-            # TODO: likely remove once
-            # https://github.com/ethereum/eth2.0-specs/issues/854 is resolved
-            return tuple()
+    def get_field_bounds(self, data: bytes, index: int) -> tuple[int, int]:
+        """
+        Return the `(start, stop)` positions of the field at `index` in the
+        serialized value `data`.
 
-        fixed_size_values, offset_pairs = self.deserialize_fixed_size_parts(stream)
+        Only the offsets needed to locate the field are read and validated.
+        """
+        if not 0 <= index < len(self.field_sedes):
+            raise IndexError(
+                f"Container has {len(self.field_sedes)} fields, got index {index}"
+            )
 
-        if not offset_pairs:
-            return fixed_size_values
+        if self._is_fixed_sized and len(data) != self._fixed_size:
+            raise DeserializationError(
+                f"Expected {self._fixed_size} bytes, got {len(data)}"
+            )
+        elif len(data) < self._fixed_size_section_length:
+            raise DeserializationError(
+                f"Expected at least {self._fixed_size_section_length} bytes, got "
+                f"{len(data)}"
+            )
 
-        variable_size_values = self.deserialize_variable_size_parts(
-            offset_pairs, stream
+        slot = self.field_slots[index]
+        if slot.is_fixed_sized:
+            return slot.position, slot.position + slot.size
+
+        # the field spans from its offset to the next one. They are validated together
+        # with the previous offset and the first one, which has to point to the end
+        # of the fixed size section
+        variable_size_indices = self._variable_size_field_indices
+        position = variable_size_indices.index(index)
+        offset_field_indices = sorted(
+            {variable_size_indices[0]}.union(
+                variable_size_indices[max(position - 1, 0) : position + 2]
+            )
         )
-
-        fixed_size_parts_iter = iter(fixed_size_values)
-        variable_size_parts_iter = iter(variable_size_values)
-
-        value = tuple(
-            next(fixed_size_parts_iter)
-            if sedes.is_fixed_sized
-            else next(variable_size_parts_iter)
-            for sedes in self.field_sedes
+        offsets = tuple(
+            read_offset(data, self.field_slots[field_index].position)
+            for field_index in offset_field_indices
+        )
+        bounds = get_variable_size_part_bounds(
+            offsets, self._fixed_size_section_length, len(data)
+        )
+        return bounds[offset_field_indices.index(index)]
+
+    def read_field(self, data: bytes, index: int, hashable: bool = True) -> Any:
+        """
+        Deserialize only the field at `index` of the serialized value `data`.
+        """
+        start, stop = self.get_field_bounds(data, index)
+        return deserialize_element(
+            self.field_sedes[index], memoryview(data)[start:stop], hashable
         )
-
-        # Verify that both iterables have been fully consumed.
-        try:
-            next(fixed_size_parts_iter)
-        except StopIteration:
-            pass
-        else:
-            raise DeserializationError("Did not consume all fixed size values")
-
-        try:
-            next(variable_size_parts_iter)
-        except StopIteration:
-            pass
-        else:
-            raise DeserializationError("Did not consume all variable size values")
-
-        return value
 
     #
     # Tree hashing
@@ -192,14 +247,15 @@ class Container(ProperCompositeSedes[Sequence[Any], tuple[Any, ...]]):
         merkle_leaves = ()
         for element, sedes in zip(value, self.field_sedes):
             key = sedes.get_key(element)
-            if key not in cache:
+            root = cache.get(key)
+            if root is None:
                 if hasattr(sedes, "get_hash_tree_root_and_leaves"):
                     root, cache = sedes.get_hash_tree_root_and_leaves(element, cache)
-                    cache[key] = root
                 else:
-                    cache[key] = sedes.get_hash_tree_root(element)
+                    root = sedes.get_hash_tree_root(element)
+                cache[key] = root
 
-            merkle_leaves += (cache[key],)
+            merkle_leaves += (root,)
 
         return merkleize(merkle_leaves), cache
 
@@ -207,11 +263,30 @@ class Container(ProperCompositeSedes[Sequence[Any], tuple[Any, ...]]):
         if hasattr(value, "_serialize_cache") and value._serialize_cache is not None:
             return value._serialize_cache
         elif hasattr(value, "_serialize_cache") and value._serialize_cache is None:
-            value._serialize_cache = super().serialize(value)
+            value._serialize_cache = self._serialize(value)
             return value._serialize_cache
+        else:
+            return self._serialize(value)
+
+    def serialize_parts(self, value):
+        if self._struct_codec is not None:
+            yield self._serialize_fixed_size(value)
+        else:
+            yield from super().serialize_parts(value)
+
+    def _serialize(self, value) -> bytes:
+        if self._struct_codec is not None:
+            return self._serialize_fixed_size(value)
         else:
             return super().serialize(value)
 
+    def _serialize_fixed_size(self, value) -> bytes:
+        try:
+            return self._struct_codec.encode(value)
+        except struct.error:
+            # the generic serialization raises the appropriate error for the field
+            return b"".join(super().serialize_parts(value))
+
     def get_sedes_id(self) -> str:
         return ",".join(field.get_sedes_id() for field in self.field_sedes)
 
@@ -2,8 +2,10 @@ from collections.abc import (
     Iterable,
     Sequence,
 )
+from concurrent.futures import (
+    Executor,
+)
 from typing import (
-    IO,
     Any,
 )
 
@@ -13,10 +15,6 @@ from eth_typing import (
 from eth_utils import (
     to_tuple,
 )
-from eth_utils.toolz import (
-    cons,
-    sliding_window,
-)
 
 from ssz.cache.utils import (
     get_merkle_leaves_with_cache,
@@ -34,6 +32,10 @@ from ssz.hashable_list import (
 from ssz.hashable_structure import (
     BaseHashableStructure,
 )
+from ssz.parallel import (
+    compute_element_roots,
+    resolve_executor,
+)
 from ssz.sedes.base import (
     BaseSedes,
     TSedes,
@@ -41,6 +43,7 @@ from ssz.sedes.base import (
 from ssz.sedes.basic import (
     BasicSedes,
     HomogeneousProperCompositeSedes,
+    deserialize_element,
 )
 from ssz.typing import (
     CacheObj,
@@ -48,12 +51,12 @@ from ssz.typing import (
     TSerializable,
 )
 from ssz.utils import (
+    get_variable_size_part_bounds,
     merkleize,
     merkleize_with_cache,
     mix_in_length,
-    pack,
-    read_exact,
-    s_decode_offset,
+    pack_bytes,
+    read_offset,
 )
 
 TSedesPairs = tuple[tuple[BaseSedes[TSerializable, TDeserialized], TSerializable], ...]
@@ -84,81 +87,108 @@ class List(
     def get_element_sedes(self, index) -> BaseSedes[TSerializable, TDeserialized]:
         return self.element_sedes
 
-    def _deserialize_stream(self, stream: IO[bytes]) -> HashableList[TDeserialized]:
-        elements = self._deserialize_stream_to_tuple(stream)
-        return HashableList.from_iterable(elements, sedes=self)
+    def _deserialize_view(
+        self, data: memoryview, hashable: bool = True
+    ) -> HashableList[TDeserialized] | tuple[TDeserialized, ...]:
+        elements = self._deserialize_view_to_tuple(data, hashable)
+        if not hashable:
+            return elements
+        # the hash tree is only built if the root of the result is actually needed
+        return HashableList.from_iterable(elements, sedes=self, lazy=True)
+
+    def _deserialize_view_to_tuple(
+        self, data: memoryview, hashable: bool = True
+    ) -> tuple[TDeserialized, ...]:
+        if isinstance(self.element_sedes, BasicSedes):
+            self._validate_fixed_size_elements_data(data)
+            elements = self.element_sedes.deserialize_sequence(data)
+        else:
+            elements = self._deserialize_elements(data, hashable)
+
+        if len(elements) > self.max_length:
+            raise DeserializationError(
+                f"Cannot deserialize {len(elements)} elements as list of at most "
+                f"{self.max_length} elements"
+            )
+        return elements
+
+    def _validate_fixed_size_elements_data(self, data: bytes) -> None:
+        element_size = self.element_sedes.get_fixed_size()
+        if len(data) % element_size != 0:
+            raise DeserializationError(
+                f"Invalid max_length. List is comprised of a fixed size sedes "
+                f"but total serialized data is not an even multiple of the "
+                f"element size. data max_length: {len(data)}  element size: "
+                f"{element_size}"
+            )
 
     @to_tuple
-    def _deserialize_stream_to_tuple(
-        self, stream: IO[bytes]
+    def _deserialize_elements(
+        self, data: memoryview, hashable: bool
     ) -> Iterable[TDeserialized]:
         if self.element_sedes.is_fixed_sized:
+            self._validate_fixed_size_elements_data(data)
             element_size = self.element_sedes.get_fixed_size()
-            data = stream.read()
-            if len(data) % element_size != 0:
-                raise DeserializationError(
-                    f"Invalid max_length. List is comprised of a fixed size sedes "
-                    f"but total serialized data is not an even multiple of the "
-                    f"element size. data max_length: {len(data)}  element size: "
-                    f"{element_size}"
-                )
-            for start_idx in range(0, len(data), element_size):
-                segment = data[start_idx : start_idx + element_size]
-                yield self.element_sedes.deserialize(segment)
+            for start in range(0, len(data), element_size):
+                segment = data[start : start + element_size]
+                yield deserialize_element(self.element_sedes, segment, hashable)
         else:
-            stream_zero_loc = stream.tell()
-            try:
-                first_offset = s_decode_offset(stream)
-            except DeserializationError:
-                if stream.tell() == stream_zero_loc:
-                    # Empty list
-                    return
-                else:
-                    raise
-
-            num_remaining_offset_bytes = first_offset - stream.tell()
-            if num_remaining_offset_bytes % OFFSET_SIZE != 0:
+            if len(data) == 0:
+                # Empty list
+                return
+
+            first_offset = read_offset(data, 0)
+            if first_offset == 0 or first_offset % OFFSET_SIZE != 0:
                 raise DeserializationError(
-                    f"Offset bytes was not a multiple of {OFFSET_SIZE}.  Got "
-                    f"{num_remaining_offset_bytes}"
+                    f"Offset bytes was not a positive multiple of {OFFSET_SIZE}.  Got "
+                    f"{first_offset}"
                 )
 
-            num_remaining_offsets = num_remaining_offset_bytes // OFFSET_SIZE
-            tail_offsets = tuple(
-                s_decode_offset(stream) for _ in range(num_remaining_offsets)
+            offsets = tuple(
+                read_offset(data, position)
+                for position in range(0, first_offset, OFFSET_SIZE)
             )
-
-            offsets = tuple(cons(first_offset, tail_offsets))
-
-            for left_offset, right_offset in sliding_window(2, offsets):
-                element_length = right_offset - left_offset
-                element_data = read_exact(element_length, stream)
-                yield self.element_sedes.deserialize(element_data)
-
-            # simply reading to the end of the current stream gives us all of the final
-            # element data
-            final_element_data = stream.read()
-            yield self.element_sedes.deserialize(final_element_data)
+            element_bounds = get_variable_size_part_bounds(
+                offsets, first_offset, len(data)
+            )
+            for start, stop in element_bounds:
+                yield deserialize_element(
+                    self.element_sedes, data[start:stop], hashable
+                )
 
     #
     # Tree hashing
     #
-    def get_hash_tree_root(self, value: Iterable[TSerializable]) -> bytes:
+    def get_hash_tree_root(
+        self, value: Iterable[TSerializable], executor: Executor | None = None
+    ) -> bytes:
+        """
+        Compute the hash tree root of a list.
+
+        The roots of composite elements and the subtrees of the merkle tree are
+        computed with `executor` if given, or with the one set by
+        :func:`ssz.parallel.set_executor` for long lists.
+        """
         if isinstance(value, BaseHashableStructure) and value.sedes == self:
             return value.hash_tree_root
 
         if isinstance(self.element_sedes, BasicSedes):
-            serialized_items = tuple(
-                self.element_sedes.serialize(element) for element in value
-            )
-            merkle_leaves = pack(serialized_items)
+            serialized_items = self.element_sedes.serialize_sequence(value)
+            merkle_leaves = pack_bytes(serialized_items)
         else:
-            merkle_leaves = tuple(
-                self.element_sedes.get_hash_tree_root(element) for element in value
-            )
+            element_executor = resolve_executor(len(value), executor)
+            if element_executor is None:
+                merkle_leaves = tuple(
+                    self.element_sedes.get_hash_tree_root(element) for element in value
+                )
+            else:
+                merkle_leaves = compute_element_roots(
+                    value, self.element_sedes, element_executor
+                )
 
         return mix_in_length(
-            merkleize(merkle_leaves, limit=self.chunk_count), len(value)
+            merkleize(merkle_leaves, limit=self.chunk_count, executor=executor),
+            len(value),
         )
 
     def get_hash_tree_root_and_leaves(
@@ -166,10 +196,8 @@ class List(
     ) -> tuple[Hash32, CacheObj]:
         merkle_leaves = ()
         if isinstance(self.element_sedes, BasicSedes):
-            serialized_items = tuple(
-                self.element_sedes.serialize(element) for element in value
-            )
-            merkle_leaves = pack(serialized_items)
+            serialized_items = self.element_sedes.serialize_sequence(value)
+            merkle_leaves = pack_bytes(serialized_items)
         else:
             has_get_hash_tree_root_and_leaves = hasattr(
                 self.element_sedes, "get_hash_tree_root_and_leaves"
@@ -1,9 +1,11 @@
 import abc
 import collections.abc
 from collections.abc import (
+    Iterator,
     Sequence,
 )
 import copy
+import keyword
 import operator
 import re
 from typing import (
@@ -20,15 +22,13 @@ from eth_utils.toolz import (
     assoc,
     merge,
 )
-from lru import (
-    LRU,
-)
 
 from ssz.cache.cache import (
-    DEFAULT_CACHE_SIZE,
+    MerkleCache,
+    get_shared_merkle_cache,
 )
 from ssz.cache.utils import (
-    get_base_key,
+    get_digest_key,
 )
 from ssz.constants import (
     FIELDS_META_ATTR,
@@ -114,7 +114,9 @@ class BaseSerializable(collections.abc.Sequence):
         for value, attr in zip(field_values, self._meta.field_attrs or ()):
             setattr(self, attr, make_immutable(value))
 
-        self.cache = LRU(DEFAULT_CACHE_SIZE) if cache is None else cache
+        # without a cache of its own, one is allocated on the first hash
+        if cache is not None:
+            self.cache = cache
 
     def as_dict(self):
         return {field: value for field, value in zip(self._meta.field_names, self)}
@@ -187,9 +189,10 @@ class BaseSerializable(collections.abc.Sequence):
         return result
 
     def reset_cache(self):
-        self.cache.clear()
-        self._fixed_size_section_length_cache = None
+        if self.cache is not None:
+            self.cache.clear()
         self._serialize_cache = None
+        self._serialized_size_cache = None
 
     def __copy__(self):
         return self.copy()
@@ -207,12 +210,11 @@ class BaseSerializable(collections.abc.Sequence):
                 setattr(result, k, copy.deepcopy(v, memodict))
 
         result.cache = self.cache
-        result._fixed_size_section_length_cache = self._fixed_size_section_length_cache
 
         return result
 
-    _fixed_size_section_length_cache = None
     _serialize_cache = None
+    _serialized_size_cache = None
 
     @property
     def hash_tree_root(self):
@@ -223,13 +225,14 @@ class BaseSerializable(collections.abc.Sequence):
         # Serializable implementation name should be unique
         return cls.__name__
 
-    def get_key(self) -> bytes:
-        # Serilaize with self._meta.container_sedes
-        key = get_base_key(self._meta.container_sedes, self).hex()
-
-        if len(key) == 0:
-            key = ""
-
+    def get_key(self) -> str:
+        # reuse the serialization if it is cached already, but do not cache it here,
+        # as the keys of all elements of large lists are computed when hashing them
+        if self._serialize_cache is not None:
+            serialized = self._serialize_cache
+        else:
+            serialized = self._meta.container_sedes._serialize(self)
+        key = get_digest_key(serialized)
         return f"{self.__class__.get_sedes_id()}{key}"
 
 
@@ -252,6 +255,52 @@ def _mk_field_attrs(field_names, extra_namespace):
                 break
 
 
+def _can_mk_init(field_names):
+    # fields called like keywords or `cache` can't be arguments of a generated method
+    return not any(
+        keyword.iskeyword(field_name) or field_name == "cache"
+        for field_name in field_names
+    )
+
+
+def _mk_init(field_names, field_attrs):
+    """
+    Generate an `__init__` method for the given fields.
+
+    It takes the field values as positional or keyword arguments, like
+    :meth:`BaseSerializable.__init__`, but sets the field attributes without inspecting
+    the arguments itself. It falls back to the generic method for subclasses of the
+    class it was created for which store the fields in different attributes.
+    """
+    params = ", ".join(field_names)
+    lines = [
+        f"def __init__(__ssz_self, {params}, *, cache=None):",
+        "    if __ssz_self._meta.field_attrs is not __ssz_field_attrs:",
+        f"        __ssz_base_init(__ssz_self, {params}, cache=cache)",
+        "        return",
+    ]
+    for field_name, field_attr in zip(field_names, field_attrs):
+        lines.append(
+            f"    __ssz_self.{field_attr} = __ssz_make_immutable({field_name}) "
+            f"if __ssz_isinstance({field_name}, __ssz_list) else {field_name}"
+        )
+    lines.append("    if cache is not None:")
+    lines.append("        __ssz_self.cache = cache")
+
+    # field names may shadow builtins, so only prefixed names are used otherwise
+    namespace = {
+        "__ssz_isinstance": isinstance,
+        "__ssz_list": list,
+        "__ssz_field_attrs": field_attrs,
+        "__ssz_base_init": BaseSerializable.__init__,
+        "__ssz_make_immutable": make_immutable,
+    }
+    exec("\n".join(lines), namespace)
+    init = namespace["__init__"]
+    init.__ssz_generated__ = True
+    return init
+
+
 @to_dict
 def _mk_field_props(field_names, field_attrs):
     for field, attr in zip(field_names, field_attrs):
@@ -377,10 +426,22 @@ class MetaSerializable(abc.ABCMeta):
             field_names=field_names,
             field_attrs=field_attrs,
         )
-        return super().__new__(
+        cls = super().__new__(
             mcls, name, bases, merge(namespace, field_props, {"_meta": meta})
         )
 
+        # replace the generic or generated `__init__` the class would inherit, but
+        # keep any one defined explicitly
+        inherits_default_init = cls.__init__ is BaseSerializable.__init__ or getattr(
+            cls.__init__, "__ssz_generated__", False
+        )
+        if inherits_default_init and _can_mk_init(field_names):
+            init = _mk_init(field_names, field_attrs)
+            init.__qualname__ = f"{cls.__qualname__}.__init__"
+            cls.__init__ = init
+
+        return cls
+
     #
     # Implement BaseSedes methods as pass-throughs to the container sedes
     #
@@ -390,19 +451,68 @@ class MetaSerializable(abc.ABCMeta):
             value._serialize_cache = cls._meta.container_sedes.serialize(value)
         return value._serialize_cache
 
-    def deserialize(cls: type[TSerializable], data: bytes) -> TSerializable:
-        deserialized_fields = cls._meta.container_sedes.deserialize(data)
+    def serialize_parts(
+        cls: type[TSerializable], value: TSerializable
+    ) -> Iterator[bytes]:
+        if value._serialize_cache is not None or cls.is_fixed_sized:
+            yield cls.serialize(value)
+        else:
+            # variable size values are streamed instead of being kept in the cache
+            yield from cls._meta.container_sedes.serialize_parts(value)
+
+    def get_serialized_size(cls: type[TSerializable], value: TSerializable) -> int:
+        if value._serialized_size_cache is None:
+            if value._serialize_cache is not None:
+                value._serialized_size_cache = len(value._serialize_cache)
+            else:
+                value._serialized_size_cache = (
+                    cls._meta.container_sedes.get_serialized_size(value)
+                )
+        return value._serialized_size_cache
+
+    def deserialize(
+        cls: type[TSerializable], data: bytes, hashable: bool = True
+    ) -> TSerializable:
+        deserialized_fields = cls._meta.container_sedes.deserialize(data, hashable)
         deserialized_field_dict = dict(zip(cls._meta.field_names, deserialized_fields))
         return cls(**deserialized_field_dict)
 
+    def read_field(
+        cls: type[TSerializable],
+        data: bytes,
+        index_or_name: int | str,
+        hashable: bool = True,
+    ):
+        """
+        Deserialize only the field given by its index or name from the serialized
+        value `data`, without decoding the other fields.
+        """
+        if isinstance(index_or_name, str):
+            if index_or_name not in cls._meta.field_names:
+                raise ValueError(f"{cls.__name__} has no field {index_or_name}")
+            index = cls._meta.field_names.index(index_or_name)
+        else:
+            index = index_or_name
+        return cls._meta.container_sedes.read_field(data, index, hashable)
+
     def get_hash_tree_root(
         cls: type[TSerializable], value: TSerializable, cache: bool = True
     ) -> bytes:
         if cache:
-            root, cache = cls._meta.container_sedes.get_hash_tree_root_and_leaves(
+            container_sedes = cls._meta.container_sedes
+            shared_cache = get_shared_merkle_cache()
+            if value.cache is None and shared_cache is not None:
+                root, _ = container_sedes.get_hash_tree_root_and_leaves(
+                    value, shared_cache
+                )
+                return root
+
+            if value.cache is None:
+                # most values are never hashed, so they only get a cache when they are
+                value.cache = MerkleCache()
+            root, value.cache = container_sedes.get_hash_tree_root_and_leaves(
                 value, value.cache
             )
-            value.cache = cache
             return root
         else:
             return cls._meta.container_sedes.get_hash_tree_root(value)
@@ -0,0 +1,104 @@
+from collections.abc import (
+    Callable,
+    Sequence,
+)
+import struct
+from typing import (
+    Any,
+    NamedTuple,
+)
+
+from ssz.sedes.base import (
+    TSedes,
+)
+from ssz.sedes.basic import (
+    deserialize_element,
+)
+from ssz.sedes.byte_vector import (
+    ByteVector,
+)
+from ssz.sedes.uint import (
+    UInt,
+)
+
+# struct format characters of little endian unsigned integers by size
+UINT_FORMATS = {1: "B", 2: "H", 4: "I", 8: "Q"}
+
+
+class FieldLayout(NamedTuple):
+    format: str
+    # converts the field value to what is packed, if it can't be packed as it is
+    encode: Callable[[Any], Any] | None
+    # whether the unpacked field has to be deserialized with the field sedes
+    needs_decoding: bool
+
+
+def get_field_layout(sedes: TSedes) -> FieldLayout:
+    if isinstance(sedes, UInt) and sedes.size in UINT_FORMATS:
+        # struct rejects negative and too large integers itself
+        return FieldLayout(UINT_FORMATS[sedes.size], None, False)
+    elif isinstance(sedes, ByteVector):
+        # struct would pad or truncate byte strings of the wrong length silently, so
+        # they are validated by the sedes, but unpacked byte strings are final
+        return FieldLayout(f"{sedes.length}s", sedes.serialize, False)
+    else:
+        # any other fixed size field is packed in its serialized form
+        return FieldLayout(f"{sedes.get_fixed_size()}s", sedes.serialize, True)
+
+
+class StructCodec:
+    """
+    Encode and decode the values of a fixed size container with a single
+    :class:`struct.Struct`.
+
+    Unsigned integers of up to 64 bits are packed and unpacked directly. Other fields
+    are packed as byte strings, serialized and deserialized by their sedes, which
+    keeps their validation. Invalid field values make :meth:`encode` raise a
+    :class:`struct.error` or the error of the field sedes.
+    """
+
+    def __init__(self, field_sedes: Sequence[TSedes]) -> None:
+        self.field_sedes = tuple(field_sedes)
+
+        layouts = tuple(get_field_layout(sedes) for sedes in self.field_sedes)
+        self.struct = struct.Struct("<" + "".join(layout.format for layout in layouts))
+        self._encoders = tuple(
+            (index, layout.encode)
+            for index, layout in enumerate(layouts)
+            if layout.encode is not None
+        )
+        self._decoded_fields = tuple(
+            (index, sedes)
+            for index, (sedes, layout) in enumerate(zip(self.field_sedes, layouts))
+            if layout.needs_decoding
+        )
+
+    @property
+    def size(self) -> int:
+        return self.struct.size
+
+    def encode(self, value: Sequence[Any]) -> bytes:
+        if not self._encoders:
+            return self.struct.pack(*value)
+
+        field_values = list(value)
+        if len(field_values) != len(self.field_sedes):
+            raise struct.error(
+                f"Expected {len(self.field_sedes)} fields, got {len(field_values)}"
+            )
+        for index, encode in self._encoders:
+            field_values[index] = encode(field_values[index])
+        return self.struct.pack(*field_values)
+
+    def decode(self, data: bytes, hashable: bool = True) -> tuple[Any, ...]:
+        """Decode `data`, which has to be exactly :attr:`size` bytes long."""
+        field_values = self.struct.unpack(data)
+        if not self._decoded_fields:
+            return field_values
+
+        decoded_values = list(field_values)
+        for index, sedes in self._decoded_fields:
+            decoded_values[index] = deserialize_element(
+                sedes, decoded_values[index], hashable
+            )
+        return tuple(decoded_values)
@@ -1,3 +1,8 @@
+import array
+from collections.abc import (
+    Iterable,
+)
+import sys
 from typing import (
     Any,
 )
@@ -10,6 +15,38 @@ from ssz.sedes.basic import (
     BasicSedes,
 )
 
+# struct format characters of unsigned integer types, as used by arrays and buffers
+UNSIGNED_FORMATS = "BHILQ"
+# buffers in native byte order can be copied as they are on little endian machines
+NATIVE_ORDER_IS_LITTLE_ENDIAN = sys.byteorder == "little"
+
+
+def get_array_typecode(size: int) -> str | None:
+    """
+    Return the typecode of the arrays of unsigned integers of the given size, if any.
+    """
+    for typecode in UNSIGNED_FORMATS:
+        if array.array(typecode).itemsize == size:
+            return typecode
+    return None
+
+
+def is_little_endian_buffer(view: memoryview, size: int) -> bool:
+    """
+    Return whether `view` is a flat buffer of little endian unsigned integers of the
+    given size, such as an :class:`array.array` or a NumPy array.
+    """
+    if view.ndim != 1 or view.itemsize != size:
+        return False
+    elif view.format.startswith("<"):
+        return view.format[1:] in UNSIGNED_FORMATS
+    else:
+        format_without_native_order = view.format.lstrip("@=")
+        return (
+            NATIVE_ORDER_IS_LITTLE_ENDIAN
+            and format_without_native_order in UNSIGNED_FORMATS
+        )
+
 
 class UInt(BasicSedes[int, int]):
     def __init__(self, num_bits: int) -> None:
@@ -17,6 +54,7 @@ class UInt(BasicSedes[int, int]):
             raise ValueError("Number of bits must be a multiple of 8")
         self.num_bits = num_bits
         super().__init__(num_bits // 8)
+        self.array_typecode = get_array_typecode(self.size)
 
     def serialize(self, value: int) -> bytes:
         if value < 0:
@@ -31,6 +69,38 @@ class UInt(BasicSedes[int, int]):
                 f"{value} is too large to be serialized in {self.size * 8} bits"
             )
 
+    def serialize_sequence(self, values: Iterable[int]) -> bytes:
+        """
+        Serialize a sequence of integers, as packed in lists and vectors.
+
+        Buffers of little endian integers of the right size, like arrays or NumPy
+        arrays, are copied as they are. Other sequences are converted with
+        :class:`array.array` in one go, if there is an array type of the right size.
+        """
+        if self.array_typecode is None:
+            return super().serialize_sequence(values)
+
+        try:
+            view = memoryview(values)
+        except TypeError:
+            pass
+        else:
+            if is_little_endian_buffer(view, self.size):
+                return view.tobytes()
+            # arrays would take the raw bytes of other buffers for their values
+            values = view.tolist()
+
+        try:
+            packed_values = array.array(self.array_typecode, values)
+        except OverflowError:
+            raise SerializationError(
+                f"Can only serialize integers from 0 to {2 ** self.num_bits - 1} as "
+                f"uint{self.num_bits}"
+            )
+        if not NATIVE_ORDER_IS_LITTLE_ENDIAN:
+            packed_values.byteswap()
+        return packed_values.tobytes()
+
     def deserialize(self, data: bytes) -> int:
         if len(data) != self.size:
             raise DeserializationError(
@@ -39,6 +109,30 @@ class UInt(BasicSedes[int, int]):
             )
         return int.from_bytes(data, "little")
 
+    def deserialize_sequence(self, data: bytes) -> tuple[int, ...]:
+        if self.array_typecode is None:
+            return super().deserialize_sequence(data)
+        else:
+            return tuple(self.deserialize_array(data))
+
+    def deserialize_array(self, data: bytes) -> array.array:
+        """
+        Deserialize the packed integers in `data` into an :class:`array.array`.
+        """
+        if self.array_typecode is None:
+            raise TypeError(f"There is no array type for uint{self.num_bits}")
+        if len(data) % self.size != 0:
+            raise DeserializationError(
+                f"Cannot deserialize length {len(data)} byte-string as a sequence of "
+                f"uint{self.num_bits}"
+            )
+
+        values = array.array(self.array_typecode)
+        values.frombytes(data)
+        if not NATIVE_ORDER_IS_LITTLE_ENDIAN:
+            values.byteswap()
+        return values
+
     def get_sedes_id(self) -> str:
         return f"{self.__class__.__name__}{self.num_bits}"
 
@@ -2,8 +2,10 @@ from collections.abc import (
     Iterable,
     Sequence,
 )
+from concurrent.futures import (
+    Executor,
+)
 from typing import (
-    IO,
     Any,
 )
 
@@ -13,15 +15,16 @@ from eth_typing import (
 from eth_utils import (
     to_tuple,
 )
-from eth_utils.toolz import (
-    sliding_window,
-)
 
 from ssz.cache.utils import (
     get_merkle_leaves_with_cache,
     get_merkle_leaves_without_cache,
 )
+from ssz.constants import (
+    OFFSET_SIZE,
+)
 from ssz.exceptions import (
+    DeserializationError,
     SerializationError,
 )
 from ssz.hashable_structure import (
@@ -30,6 +33,10 @@ from ssz.hashable_structure import (
 from ssz.hashable_vector import (
     HashableVector,
 )
+from ssz.parallel import (
+    compute_element_roots,
+    resolve_executor,
+)
 from ssz.sedes.base import (
     BaseSedes,
     TSedes,
@@ -37,6 +44,7 @@ from ssz.sedes.base import (
 from ssz.sedes.basic import (
     BasicSedes,
     HomogeneousProperCompositeSedes,
+    deserialize_element,
 )
 from ssz.typing import (
     CacheObj,
@@ -44,11 +52,11 @@ from ssz.typing import (
     TSerializableElement,
 )
 from ssz.utils import (
+    get_variable_size_part_bounds,
     merkleize,
     merkleize_with_cache,
-    pack,
-    read_exact,
-    s_decode_offset,
+    pack_bytes,
+    read_offset,
 )
 
 TSedesPairs = tuple[
@@ -106,59 +114,94 @@ class Vector(
     #
     # Deserialization
     #
-    def _deserialize_stream(self, stream: IO[bytes]) -> Iterable[TDeserializedElement]:
-        elements = self._deserialize_stream_to_tuple(stream)
-        return HashableVector.from_iterable(elements, sedes=self)
+    def _deserialize_view(
+        self, data: memoryview, hashable: bool = True
+    ) -> Iterable[TDeserializedElement]:
+        elements = self._deserialize_view_to_tuple(data, hashable)
+        if not hashable:
+            return elements
+        # the hash tree is only built if the root of the result is actually needed
+        return HashableVector.from_iterable(elements, sedes=self, lazy=True)
+
+    def _deserialize_view_to_tuple(
+        self, data: memoryview, hashable: bool = True
+    ) -> tuple[TDeserializedElement, ...]:
+        if isinstance(self.element_sedes, BasicSedes):
+            self._validate_fixed_size_elements_data(data)
+            return self.element_sedes.deserialize_sequence(data)
+        else:
+            return self._deserialize_elements(data, hashable)
+
+    def _validate_fixed_size_elements_data(self, data: bytes) -> None:
+        element_size = self.element_sedes.get_fixed_size()
+        if len(data) != element_size * self.length:
+            raise DeserializationError(
+                f"Cannot deserialize length {len(data)} data as vector of "
+                f"{self.length} elements of size {element_size}"
+            )
 
     @to_tuple
-    def _deserialize_stream_to_tuple(
-        self, stream: IO[bytes]
+    def _deserialize_elements(
+        self, data: memoryview, hashable: bool
     ) -> Iterable[TDeserializedElement]:
         if self.element_sedes.is_fixed_sized:
+            self._validate_fixed_size_elements_data(data)
             element_size = self.element_sedes.get_fixed_size()
-            for _ in range(self.length):
-                element_data = read_exact(element_size, stream)
-                yield self.element_sedes.deserialize(element_data)
+            for start in range(0, len(data), element_size):
+                segment = data[start : start + element_size]
+                yield deserialize_element(self.element_sedes, segment, hashable)
         else:
-            offsets = tuple(s_decode_offset(stream) for _ in range(self.length))
-
-            for left_offset, right_offset in sliding_window(2, offsets):
-                element_length = right_offset - left_offset
-                element_data = read_exact(element_length, stream)
-                yield self.element_sedes.deserialize(element_data)
-
-            # simply reading to the end of the current stream gives us all of the final
-            # element data
-            final_element_data = stream.read()
-            yield self.element_sedes.deserialize(final_element_data)
+            fixed_size_section_length = self.length * OFFSET_SIZE
+            offsets = tuple(
+                read_offset(data, position)
+                for position in range(0, fixed_size_section_length, OFFSET_SIZE)
+            )
+            element_bounds = get_variable_size_part_bounds(
+                offsets, fixed_size_section_length, len(data)
+            )
+            for start, stop in element_bounds:
+                yield deserialize_element(
+                    self.element_sedes, data[start:stop], hashable
+                )
 
     #
     # Tree hashing
     #
-    def get_hash_tree_root(self, value: Sequence[Any]) -> bytes:
+    def get_hash_tree_root(
+        self, value: Sequence[Any], executor: Executor | None = None
+    ) -> bytes:
+        """
+        Compute the hash tree root of a vector.
+
+        The roots of composite elements and the subtrees of the merkle tree are
+        computed with `executor` if given, or with the one set by
+        :func:`ssz.parallel.set_executor` for long vectors.
+        """
         if isinstance(value, BaseHashableStructure) and value.sedes == self:
             return value.hash_tree_root
 
         if isinstance(self.element_sedes, BasicSedes):
-            serialized_elements = tuple(
-                self.element_sedes.serialize(element) for element in value
-            )
-            return merkleize(pack(serialized_elements))
+            serialized_elements = self.element_sedes.serialize_sequence(value)
+            return merkleize(pack_bytes(serialized_elements), executor=executor)
         else:
-            element_tree_hashes = tuple(
-                self.element_sedes.get_hash_tree_root(element) for element in value
-            )
-            return merkleize(element_tree_hashes)
+            element_executor = resolve_executor(len(value), executor)
+            if element_executor is None:
+                element_tree_hashes = tuple(
+                    self.element_sedes.get_hash_tree_root(element) for element in value
+                )
+            else:
+                element_tree_hashes = compute_element_roots(
+                    value, self.element_sedes, element_executor
+                )
+            return merkleize(element_tree_hashes, executor=executor)
 
     def get_hash_tree_root_and_leaves(
         self, value: Sequence[Any], cache: CacheObj
     ) -> tuple[Hash32, CacheObj]:
         merkle_leaves = ()
         if isinstance(self.element_sedes, BasicSedes):
-            serialized_elements = tuple(
-                self.element_sedes.serialize(element) for element in value
-            )
-            merkle_leaves = pack(serialized_elements)
+            serialized_elements = self.element_sedes.serialize_sequence(value)
+            merkle_leaves = pack_bytes(serialized_elements)
         else:
             has_get_hash_tree_root_and_leaves = hasattr(
                 self.element_sedes, "get_hash_tree_root_and_leaves"
@@ -2,7 +2,10 @@ import collections
 from collections.abc import (
     Sequence,
 )
-import functools
+from concurrent.futures import (
+    Executor,
+)
+import itertools
 from typing import (
     IO,
     Any,
@@ -12,6 +15,18 @@ from eth_typing import (
     Hash32,
 )
 
+from ssz.bitfield import (
+    Bitfield,
+)
+from ssz.cache.cache import (
+    MerkleCache,
+)
+from ssz.cache.memo import (
+    bounded_memo,
+    get_bytes_sequence_size,
+    get_bytes_size,
+    get_tuple_size,
+)
 from ssz.constants import (
     BASE_TYPES,
     CHUNK_SIZE,
@@ -24,6 +39,11 @@ from ssz.exceptions import (
 )
 from ssz.hash import (
     hash_eth2,
+    hash_pairs,
+)
+from ssz.parallel import (
+    DEFAULT_SUBTREE_DEPTH,
+    resolve_merkleization_executor,
 )
 from ssz.typing import (
     CacheObj,
@@ -57,6 +77,47 @@ def s_decode_offset(stream: IO[bytes]) -> int:
     return decode_offset(data)
 
 
+def read_view(data: memoryview, start: int, num_bytes: int) -> memoryview:
+    """Return a view of `num_bytes` bytes of `data` starting at `start`."""
+    stop = start + num_bytes
+    if stop > len(data):
+        raise DeserializationError(
+            f"Tried to read {num_bytes}. Only got {max(len(data) - start, 0)} bytes"
+        )
+    return data[start:stop]
+
+
+def read_offset(data: memoryview, start: int) -> int:
+    return decode_offset(read_view(data, start, OFFSET_SIZE))
+
+
+def get_variable_size_part_bounds(
+    offsets: Sequence[int], fixed_size_section_length: int, data_length: int
+) -> tuple[tuple[int, int], ...]:
+    """
+    Compute the `(start, stop)` positions of the variable size parts of a value from
+    their offsets.
+
+    The first offset has to point to the end of the fixed size section and the
+    offsets have to be in ascending order and within the data, otherwise a
+    `DeserializationError` is raised.
+    """
+    if offsets[0] != fixed_size_section_length:
+        raise DeserializationError(
+            f"First offset {offsets[0]} does not point to the end of the fixed size "
+            f"section at {fixed_size_section_length}"
+        )
+
+    stops = tuple(offsets[1:]) + (data_length,)
+    for start, stop in zip(offsets, stops):
+        if not start <= stop <= data_length:
+            raise DeserializationError(
+                f"Invalid offsets: part would span from {start} to {stop} in "
+                f"{data_length} bytes"
+            )
+    return tuple(zip(offsets, stops))
+
+
 def get_items_per_chunk(item_size: int) -> int:
     if item_size < 0:
         raise ValueError("Item size must be positive integer")
@@ -79,8 +140,14 @@ def pad_zeros(value: bytes) -> bytes:
     return value.ljust(CHUNK_SIZE, b"\x00")
 
 
-@functools.lru_cache(maxsize=2**12)
+@bounded_memo(get_bytes_size, get_bytes_sequence_size)
 def to_chunks(packed_data: bytes) -> tuple[bytes, ...]:
+    return split_into_chunks(packed_data)
+
+
+def split_into_chunks(packed_data: bytes) -> tuple[bytes, ...]:
+    # the memoized packing functions use this directly, so that their results are
+    # not memoized twice
     size = len(packed_data)
     number_of_full_chunks = size // CHUNK_SIZE
     last_chunk_is_full = size % CHUNK_SIZE == 0
@@ -96,28 +163,35 @@ def to_chunks(packed_data: bytes) -> tuple[bytes, ...]:
         return full_chunks + (last_chunk,)
 
 
-@functools.lru_cache(maxsize=2**12)
+@bounded_memo(get_bytes_sequence_size, get_bytes_sequence_size)
 def pack(serialized_values: Sequence[bytes]) -> tuple[Hash32, ...]:
     if len(serialized_values) == 0:
         return (EMPTY_CHUNK,)
 
     data = b"".join(serialized_values)
-    return to_chunks(data)
+    return split_into_chunks(data)
 
 
-@functools.lru_cache(maxsize=2**12)
+@bounded_memo(get_bytes_size, get_bytes_sequence_size)
 def pack_bytes(byte_string: bytes) -> tuple[bytes, ...]:
     if len(byte_string) == 0:
         return (EMPTY_CHUNK,)
 
-    return to_chunks(byte_string)
+    return split_into_chunks(byte_string)
 
 
-@functools.lru_cache(maxsize=2**12)
 def pack_bits(values: Sequence[bool]) -> tuple[Hash32]:
+    if isinstance(values, Bitfield):
+        # the bits are already packed
+        return split_into_chunks(values.to_bytes())
+    return _pack_bool_sequence(values)
+
+
+@bounded_memo(get_tuple_size, get_bytes_sequence_size)
+def _pack_bool_sequence(values: Sequence[bool]) -> tuple[Hash32]:
     as_bytearray = get_serialized_bytearray(values, len(values), extra_byte=False)
     packed = bytes(as_bytearray)
-    return to_chunks(packed)
+    return split_into_chunks(packed)
 
 
 def get_next_power_of_two(value: int) -> int:
@@ -147,6 +221,20 @@ def _get_merkleized_result(
 ) -> tuple[Hash32, CacheObj]:
     merkleized_result_per_layers = [None for _ in range(max_depth + 1)]
 
+    if isinstance(cache, MerkleCache):
+        cache.reserve(chunk_len)
+        min_height = cache.min_height
+    else:
+        min_height = 1
+
+    def hash_node(key: bytes, height: int) -> Hash32:
+        node = cache.get(key)
+        if node is None:
+            node = hash_pairs(key)
+            if height >= min_height:
+                cache[key] = node
+        return node
+
     def merge(leaf: bytes, leaf_index: int) -> None:
         node = leaf
         layer = 0
@@ -154,17 +242,11 @@ def _get_merkleized_result(
             if leaf_index & (1 << layer) == 0:
                 if leaf_index == chunk_len and layer < chunk_depth:
                     # Keep going if we are complementing the void to the next power of 2
-                    key = node + ZERO_HASHES[layer]
-                    if key not in cache:
-                        cache[key] = hash_eth2(key)
-                    node = cache[key]
+                    node = hash_node(node + ZERO_HASHES[layer], layer + 1)
                 else:
                     break
             else:
-                key = merkleized_result_per_layers[layer] + node
-                if key not in cache:
-                    cache[key] = hash_eth2(key)
-                node = cache[key]
+                node = hash_node(merkleized_result_per_layers[layer] + node, layer + 1)
             layer += 1
 
         merkleized_result_per_layers[layer] = node
@@ -180,12 +262,9 @@ def _get_merkleized_result(
     # The next power of two may be smaller than the ultimate virtual size,
     # complement with zero-hashes at each depth.
     for layer in range(chunk_depth, max_depth):
-        key = merkleized_result_per_layers[layer] + ZERO_HASHES[layer]
-        if key not in cache:
-            cache[key] = hash_eth2(
-                merkleized_result_per_layers[layer] + ZERO_HASHES[layer]
-            )
-        merkleized_result_per_layers[layer + 1] = cache[key]
+        merkleized_result_per_layers[layer + 1] = hash_node(
+            merkleized_result_per_layers[layer] + ZERO_HASHES[layer], layer + 1
+        )
 
     root = merkleized_result_per_layers[max_depth]
 
@@ -212,9 +291,78 @@ def merkleize_with_cache(
     )
 
 
-def merkleize(chunks: Sequence[Hash32], limit: int = None) -> Hash32:
-    root, _ = merkleize_with_cache(chunks, {}, limit)
-    return root
+def merkleize(
+    chunks: Sequence[Hash32], limit: int = None, executor: Executor | None = None
+) -> Hash32:
+    """
+    Compute the merkle root of the given chunks.
+
+    Without a cache there is nothing to look up per node, so the tree is hashed one
+    layer at a time, each with a single call to :func:`ssz.hash.hash_pairs`.
+
+    Large trees are split into subtrees hashed by `executor` if given, or by the one
+    set with :func:`ssz.parallel.set_executor`.
+    """
+    chunk_len = len(chunks)
+    if limit is None:
+        limit = chunk_len
+    chunk_depth, max_depth = _get_chunk_and_max_depth(chunks, limit, chunk_len)
+
+    if limit == 0:
+        return ZERO_HASHES[0]
+    if chunk_len == 0:
+        return ZERO_HASHES[max_depth]
+
+    executor = resolve_merkleization_executor(chunk_len, executor)
+    if executor is not None and chunk_depth > 0:
+        return merkleize_subtrees(chunks, max_depth, executor)
+
+    return Hash32(hash_layers(b"".join(chunks), 0, max_depth))
+
+
+def hash_layers(layer: bytes, start_depth: int, end_depth: int) -> bytes:
+    """
+    Hash a layer of nodes at `start_depth` up to the layer at `end_depth`.
+
+    Layers with an odd number of nodes are complemented with the zero hash of their
+    depth.
+    """
+    for depth in range(start_depth, end_depth):
+        if len(layer) // CHUNK_SIZE % 2 == 1:
+            layer += ZERO_HASHES[depth]
+        layer = hash_pairs(layer)
+    return layer
+
+
+def merkleize_subtrees(
+    chunks: Sequence[Hash32],
+    max_depth: int,
+    executor: Executor,
+    subtree_depth: int = DEFAULT_SUBTREE_DEPTH,
+) -> Hash32:
+    """
+    Compute the merkle root of a tree of depth `max_depth` over the given chunks.
+
+    The chunks are split into aligned subtrees of depth `subtree_depth`, which are
+    hashed by `executor`. Their roots are combined in the calling thread.
+    """
+    chunk_len = len(chunks)
+    subtree_depth = min(subtree_depth, max(chunk_len - 1, 0).bit_length())
+    subtree_size = CHUNK_SIZE << subtree_depth
+
+    data = b"".join(chunks)
+    subtree_roots = executor.map(
+        hash_layers,
+        (
+            data[start : start + subtree_size]
+            for start in range(0, len(data), subtree_size)
+        ),
+        itertools.repeat(0),
+        itertools.repeat(subtree_depth),
+    )
+    layer = b"".join(subtree_roots)
+
+    return Hash32(hash_layers(layer, subtree_depth, max_depth))
 
 
 def mix_in_length(root: Hash32, length: int) -> Hash32:
@@ -237,7 +385,11 @@ def get_serialized_bytearray(
 
 
 def is_immutable_field_value(value: Any) -> bool:
-    return type(value) in BASE_TYPES or (
-        isinstance(value, tuple)
-        and (len(value) == 0 or is_immutable_field_value(value[0]))
+    return (
+        type(value) in BASE_TYPES
+        or isinstance(value, Bitfield)
+        or (
+            isinstance(value, tuple)
+            and (len(value) == 0 or is_immutable_field_value(value[0]))
+        )
     )
@@ -71,8 +71,10 @@ def chunks_and_chunk_count_st(draw):
     return pvector(chunks), chunk_count
 
 
-def hash_tree_st():
+def hash_tree_st(flat=False):
     return st.builds(
-        lambda chunks_and_chunk_count: HashTree.compute(*chunks_and_chunk_count),
+        lambda chunks_and_chunk_count: HashTree.compute(
+            *chunks_and_chunk_count, flat=flat
+        ),
         chunks_and_chunk_count_st(),
     )
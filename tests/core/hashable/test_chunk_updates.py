@@ -5,6 +5,7 @@ from hypothesis import (
 
 from ssz.hashable_structure import (
     get_appended_chunks,
+    get_bulk_updated_chunks,
     get_num_padding_elements,
     get_updated_chunks,
     update_element_in_chunk,
@@ -142,3 +143,44 @@ def test_updated_chunks(data, element_size):
             last_chunk[first_padding_replacement_byte:last_padding_replacement_byte]
             == padding_replacement
         )
+
+
+@given(st.data(), element_size_st())
+def test_bulk_updated_chunks(data, element_size):
+    original_elements = data.draw(st.lists(element_st(size=element_size), min_size=1))
+    original_chunks = get_appended_chunks(
+        appended_elements=original_elements,
+        element_size=element_size,
+        num_padding_elements=0,
+    )
+    indices = data.draw(
+        st.lists(st.integers(min_value=0, max_value=len(original_elements) - 1))
+    )
+    elements = data.draw(
+        st.lists(
+            element_st(size=element_size), min_size=len(indices), max_size=len(indices)
+        )
+    )
+
+    updated_chunks = get_bulk_updated_chunks(
+        indices=indices,
+        serialized_elements=b"".join(elements),
+        original_chunks=original_chunks,
+        element_size=element_size,
+    )
+
+    # later updates of the same index win
+    expected_elements = list(original_elements)
+    for index, element in zip(indices, elements):
+        expected_elements[index] = element
+    expected_chunks = get_appended_chunks(
+        appended_elements=expected_elements,
+        element_size=element_size,
+        num_padding_elements=0,
+    )
+    elements_per_chunk = 32 // element_size
+    assert set(updated_chunks.keys()) == {
+        index // elements_per_chunk for index in indices
+    }
+    for chunk_index, chunk in updated_chunks.items():
+        assert chunk == expected_chunks[chunk_index]
@@ -1,4 +1,5 @@
 import pytest
+import itertools
 
 from hypothesis import (
     assume,
@@ -12,6 +13,9 @@ from ssz.constants import (
 from ssz.hash_tree import (
     HashTree,
 )
+from ssz.hash_tree_layer import (
+    FlatLayer,
+)
 from ssz.utils import (
     merkleize,
 )
@@ -133,3 +137,226 @@ def test_remove(hash_tree):
         assume(len(chunks) >= 1)
         result = HashTree.compute(chunks, hash_tree.chunk_count)
         assert hash_tree.remove(chunk) == result
+
+
+@given(chunks_and_chunk_count_st())
+def test_compute_flat(chunks_and_chunk_count):
+    hash_tree = HashTree.compute(*chunks_and_chunk_count)
+    flat_hash_tree = HashTree.compute(*chunks_and_chunk_count, flat=True)
+
+    assert flat_hash_tree.is_flat
+    assert not hash_tree.is_flat
+    assert all(isinstance(layer, FlatLayer) for layer in flat_hash_tree.raw_hash_tree)
+    assert flat_hash_tree == hash_tree
+    assert flat_hash_tree.chunks == hash_tree.chunks
+    assert flat_hash_tree.raw_hash_tree == hash_tree.raw_hash_tree
+
+
+@given(hash_tree_st(flat=True), st.lists(chunk_st(), min_size=1))
+def test_flat_modifications(hash_tree, chunks):
+    if hash_tree.chunk_count is not None:
+        chunks = chunks[: hash_tree.chunk_count - len(hash_tree)]
+    non_flat_hash_tree = HashTree.compute(
+        hash_tree.chunks.tolist(), hash_tree.chunk_count
+    )
+
+    results = (
+        (hash_tree.set(0, ZERO_HASHES[0]), non_flat_hash_tree.set(0, ZERO_HASHES[0])),
+        (hash_tree.extend(chunks), non_flat_hash_tree.extend(chunks)),
+    )
+    for flat_result, result in results:
+        assert flat_result.is_flat
+        assert flat_result == result
+        assert flat_result.raw_hash_tree == result.raw_hash_tree
+
+    if len(hash_tree) > 1:
+        assert hash_tree.delete(0).is_flat
+        assert hash_tree.delete(0) == non_flat_hash_tree.delete(0)
+
+
+@given(st.booleans(), hash_tree_st())
+def test_get_layer_buffer(flat, hash_tree):
+    if flat:
+        hash_tree = HashTree.compute(hash_tree.chunks, hash_tree.chunk_count, flat=True)
+
+    for layer_index, layer in enumerate(hash_tree.raw_hash_tree):
+        buffer = hash_tree.get_layer_buffer(layer_index)
+        assert buffer.readonly
+        assert bytes(buffer) == b"".join(layer)
+    assert bytes(hash_tree.get_layer_buffer(-1)) == hash_tree.root
+
+    # the buffers are copies, which are not affected by updates of the tree
+    buffer = hash_tree.get_layer_buffer(0)
+    updated_hash_tree = hash_tree.set(0, b"\xff" * 32)
+    assert bytes(buffer) == b"".join(hash_tree.chunks)
+    assert updated_hash_tree.get_layer_buffer(0)[:32] == b"\xff" * 32
+
+
+@given(st.data(), hash_tree_st(), st.booleans())
+def test_mset(data, hash_tree, flat):
+    if flat:
+        hash_tree = HashTree.compute(hash_tree.chunks, hash_tree.chunk_count, flat=True)
+
+    indices = data.draw(
+        st.lists(st.integers(min_value=0, max_value=len(hash_tree) - 1), unique=True)
+    )
+    chunks = data.draw(
+        st.lists(chunk_st(), min_size=len(indices), max_size=len(indices))
+    )
+    updates = tuple(itertools.chain.from_iterable(zip(indices, chunks)))
+
+    result = HashTree.compute(hash_tree.chunks.mset(*updates), hash_tree.chunk_count)
+    updated_hash_tree = hash_tree.mset(*updates)
+    assert updated_hash_tree == result
+    assert updated_hash_tree.raw_hash_tree == result.raw_hash_tree
+    assert updated_hash_tree.is_flat == flat
+
+
+@given(hash_tree_st())
+def test_mset_out_of_bounds(hash_tree):
+    with pytest.raises(IndexError):
+        hash_tree.mset(len(hash_tree) + 1, ZERO_HASHES[0])
+
+
+@given(st.data(), hash_tree_st(), st.booleans())
+def test_update_chunks(data, hash_tree, lazy):
+    updated_chunks = data.draw(
+        st.dictionaries(
+            st.integers(min_value=0, max_value=len(hash_tree) - 1), chunk_st()
+        )
+    )
+    if lazy:
+        hash_tree = HashTree.compute(hash_tree.chunks, hash_tree.chunk_count, lazy=True)
+
+    result = hash_tree.mset(*itertools.chain.from_iterable(updated_chunks.items()))
+    updated_hash_tree = hash_tree.update_chunks(updated_chunks)
+    assert updated_hash_tree.is_lazy == lazy
+    assert updated_hash_tree.chunks == result.chunks
+    assert updated_hash_tree.raw_hash_tree == result.raw_hash_tree
+
+    with pytest.raises(IndexError):
+        hash_tree.update_chunks({len(hash_tree): ZERO_HASHES[0]})
+
+
+@given(hash_tree_st(), st.lists(chunk_st()), st.booleans())
+def test_extend_layers(hash_tree, chunks, flat):
+    if flat:
+        hash_tree = HashTree.compute(hash_tree.chunks, hash_tree.chunk_count, flat=True)
+    if hash_tree.chunk_count is not None:
+        chunks = chunks[: hash_tree.chunk_count - len(hash_tree)]
+
+    result = HashTree.compute(hash_tree.chunks.extend(chunks), hash_tree.chunk_count)
+    extended_hash_tree = hash_tree.extend(chunks)
+    assert extended_hash_tree.raw_hash_tree == result.raw_hash_tree
+    assert extended_hash_tree.is_flat == flat
+
+
+@given(st.data(), hash_tree_st(), st.booleans())
+def test_truncate(data, hash_tree, flat):
+    if flat:
+        hash_tree = HashTree.compute(hash_tree.chunks, hash_tree.chunk_count, flat=True)
+    num_chunks = data.draw(st.integers(min_value=1, max_value=len(hash_tree)))
+
+    result = HashTree.compute(hash_tree.chunks[:num_chunks], hash_tree.chunk_count)
+    truncated_hash_tree = hash_tree.truncate(num_chunks)
+    assert truncated_hash_tree.raw_hash_tree == result.raw_hash_tree
+    assert truncated_hash_tree.is_flat == flat
+
+    evolver = hash_tree.evolver()
+    evolver.truncate(num_chunks)
+    assert evolver.persistent() == result
+
+
+@given(hash_tree_st())
+def test_invalid_truncate(hash_tree):
+    for num_chunks in (0, len(hash_tree) + 1):
+        with pytest.raises(ValueError):
+            hash_tree.truncate(num_chunks)
+
+
+@given(st.data(), hash_tree_st())
+def test_delete_range(data, hash_tree):
+    index = data.draw(st.integers(min_value=0, max_value=len(hash_tree) - 1))
+    stop = data.draw(st.integers(min_value=index + 1, max_value=len(hash_tree)))
+    assume(stop - index < len(hash_tree))
+
+    result = HashTree.compute(
+        hash_tree.chunks.delete(index, stop), hash_tree.chunk_count
+    )
+    assert hash_tree.delete(index, stop).raw_hash_tree == result.raw_hash_tree
+
+    evolver = hash_tree.evolver()
+    evolver.delete(index, stop)
+    assert evolver.persistent() == result
+
+
+@given(st.data(), hash_tree_st(), st.lists(chunk_st(), min_size=1))
+def test_evolver_delete_with_pending_changes(data, hash_tree, chunks):
+    if hash_tree.chunk_count is not None:
+        chunks = chunks[: hash_tree.chunk_count - len(hash_tree)]
+    evolver = hash_tree.evolver()
+    evolver[0] = ZERO_HASHES[0]
+    evolver.extend(chunks)
+    expected_chunks = [ZERO_HASHES[0]] + list(hash_tree.chunks[1:]) + chunks
+
+    index = data.draw(st.integers(min_value=0, max_value=len(evolver) - 1))
+    assume(len(evolver) > 1)
+    del evolver[index]
+    del expected_chunks[index]
+
+    assert len(evolver) == len(expected_chunks)
+    assert evolver.persistent() == HashTree.compute(
+        expected_chunks, hash_tree.chunk_count
+    )
+
+
+@given(chunks_and_chunk_count_st())
+def test_compute_lazy(chunks_and_chunk_count):
+    hash_tree = HashTree.compute(*chunks_and_chunk_count)
+    lazy_hash_tree = HashTree.compute(*chunks_and_chunk_count, lazy=True)
+
+    assert lazy_hash_tree.is_lazy
+    assert not lazy_hash_tree.is_materialized
+    assert lazy_hash_tree.chunks == hash_tree.chunks
+    assert len(lazy_hash_tree) == len(hash_tree)
+    assert not lazy_hash_tree.is_materialized
+
+    assert lazy_hash_tree.root == hash_tree.root
+    assert lazy_hash_tree.is_materialized
+    assert lazy_hash_tree.raw_hash_tree == hash_tree.raw_hash_tree
+
+
+@pytest.mark.parametrize("materialize", (False, True))
+@given(hash_tree=hash_tree_st(), chunks=st.lists(chunk_st(), min_size=1))
+def test_lazy_modifications(materialize, hash_tree, chunks):
+    if hash_tree.chunk_count is not None:
+        chunks = chunks[: hash_tree.chunk_count - len(hash_tree)]
+    lazy_hash_tree = HashTree.compute(
+        hash_tree.chunks, hash_tree.chunk_count, lazy=True
+    )
+    if materialize:
+        lazy_hash_tree.root
+
+    results = [
+        (lazy_hash_tree.set(0, ZERO_HASHES[0]), hash_tree.set(0, ZERO_HASHES[0])),
+        (lazy_hash_tree.extend(chunks), hash_tree.extend(chunks)),
+        (
+            lazy_hash_tree.extend(chunks).set(0, ZERO_HASHES[0]),
+            hash_tree.extend(chunks).set(0, ZERO_HASHES[0]),
+        ),
+    ]
+    if len(hash_tree) > 1:
+        results.append((lazy_hash_tree.truncate(1), hash_tree.truncate(1)))
+        results.append((lazy_hash_tree.delete(0), hash_tree.delete(0)))
+        results.append((lazy_hash_tree.delete(1), hash_tree.delete(1)))
+
+    for lazy_result, result in results:
+        assert lazy_result.is_lazy
+        # extending by zero chunks returns the original tree
+        if lazy_result is not lazy_hash_tree:
+            assert not lazy_result.is_materialized
+        assert lazy_result.chunks == result.chunks
+        assert lazy_result.raw_hash_tree == result.raw_hash_tree
+        assert lazy_result == result
+
+    assert lazy_hash_tree == hash_tree
@@ -0,0 +1,144 @@
+import pytest
+
+from hypothesis import (
+    given,
+    strategies as st,
+)
+from pyrsistent import (
+    pvector,
+)
+
+from ssz.hash_tree_layer import (
+    HASHES_PER_PAGE,
+    FlatLayer,
+)
+
+layer_size_st = st.integers(min_value=0, max_value=3 * HASHES_PER_PAGE)
+
+
+def make_hashes(size, seed=0):
+    return [(seed * 2**16 + index).to_bytes(32, "little") for index in range(size)]
+
+
+@given(layer_size_st)
+def test_from_hashes(size):
+    hashes = make_hashes(size)
+    layer = FlatLayer.from_hashes(hashes)
+
+    assert len(layer) == size
+    assert list(layer) == hashes
+    assert layer == pvector(hashes)
+    assert layer.tobytes() == b"".join(hashes)
+    assert FlatLayer.from_bytes(layer.tobytes()) == layer
+
+
+def test_buffer_access():
+    hashes = make_hashes(600)
+    layer = FlatLayer.from_hashes(hashes)
+
+    # the pages of a layer are not contiguous, so they are only accessible as a copy
+    with pytest.raises(TypeError):
+        memoryview(layer)
+    assert memoryview(layer.tobytes()).nbytes == 600 * 32
+    assert layer.tobytes(255, 257) == b"".join(hashes[255:257])
+    assert layer.tobytes(10, 5) == b""
+
+
+@pytest.mark.parametrize("value", (b"", b"\x00" * 31, b"\x00" * 33))
+def test_invalid_hash(value):
+    with pytest.raises(ValueError):
+        FlatLayer.from_hashes([value])
+    with pytest.raises(ValueError):
+        FlatLayer.from_hashes(make_hashes(1)).set(0, value)
+
+
+def test_invalid_data_length():
+    with pytest.raises(ValueError):
+        FlatLayer.from_bytes(b"\x00" * 33)
+
+
+@given(st.data(), layer_size_st.filter(lambda size: size > 0))
+def test_get_item(data, size):
+    hashes = make_hashes(size)
+    layer = FlatLayer.from_hashes(hashes)
+
+    index = data.draw(st.integers(min_value=-size, max_value=size - 1))
+    start = data.draw(st.integers(min_value=0, max_value=size))
+    stop = data.draw(st.integers(min_value=0, max_value=size))
+
+    assert layer[index] == hashes[index]
+    assert layer[start:stop] == hashes[start:stop]
+    assert layer[start:stop:2] == hashes[start:stop:2]
+    assert layer.tobytes(start, stop) == b"".join(hashes[start:stop])
+
+    with pytest.raises(IndexError):
+        layer[size]
+
+
+@given(st.data(), layer_size_st.filter(lambda size: size > 0))
+def test_set(data, size):
+    hashes = make_hashes(size)
+    layer = FlatLayer.from_hashes(hashes)
+    reference = pvector(hashes)
+
+    indices = data.draw(st.lists(st.integers(min_value=0, max_value=size)))
+    for index, value in zip(indices, make_hashes(len(indices), seed=1)):
+        layer = layer.set(index, value)
+        reference = reference.set(index, value)
+        assert layer == reference
+
+
+@given(layer_size_st, layer_size_st)
+def test_extend(size, extension_size):
+    hashes = make_hashes(size)
+    extension = make_hashes(extension_size, seed=1)
+    layer = FlatLayer.from_hashes(hashes)
+
+    assert layer.extend(extension) == hashes + extension
+    assert layer.append(make_hashes(1, seed=1)[0]) == hashes + make_hashes(1, seed=1)
+
+
+@given(st.data(), layer_size_st.filter(lambda size: size > 0))
+def test_delete(data, size):
+    hashes = make_hashes(size)
+    layer = FlatLayer.from_hashes(hashes)
+
+    index = data.draw(st.integers(min_value=0, max_value=size - 1))
+    stop = data.draw(st.integers(min_value=index, max_value=size))
+
+    assert layer.delete(index) == pvector(hashes).delete(index)
+    assert layer.delete(index, stop) == pvector(hashes).delete(index, stop)
+    assert layer.remove(hashes[index]) == pvector(hashes).remove(hashes[index])
+
+
+def test_pages_are_shared():
+    hashes = make_hashes(3 * HASHES_PER_PAGE)
+    layer = FlatLayer.from_hashes(hashes)
+
+    updated_layer = layer.set(HASHES_PER_PAGE, make_hashes(1, seed=1)[0])
+
+    assert updated_layer._pages[0] is layer._pages[0]
+    assert updated_layer._pages[1] is not layer._pages[1]
+    assert updated_layer._pages[2] is layer._pages[2]
+    assert layer == hashes
+
+
+def test_evolver():
+    hashes = make_hashes(HASHES_PER_PAGE + 1)
+    layer = FlatLayer.from_hashes(hashes)
+    evolver = layer.evolver()
+    assert not evolver.is_dirty()
+    assert evolver.persistent() is layer
+
+    new_hashes = make_hashes(HASHES_PER_PAGE, seed=1)
+    evolver[0] = new_hashes[0]
+    evolver.extend(new_hashes)
+    evolver[-1] = new_hashes[0]
+
+    assert evolver.is_dirty()
+    assert len(evolver) == 2 * HASHES_PER_PAGE + 1
+    assert evolver[0] == new_hashes[0]
+    assert evolver.persistent() == [new_hashes[0]] + hashes[1:] + new_hashes[:-1] + [
+        new_hashes[0]
+    ]
+    assert layer == hashes
@@ -1,3 +1,5 @@
+import pytest
+import array
 import itertools
 
 from hypothesis import (
@@ -10,13 +12,28 @@ from pyrsistent import (
 )
 
 import ssz
+from ssz.exceptions import (
+    SerializationError,
+)
 from ssz.hashable_container import (
     SignedHashableContainer,
 )
+from ssz.hashable_list import (
+    HashableList,
+)
+from ssz.hashable_vector import (
+    HashableVector,
+)
 from ssz.sedes import (
+    List,
+    bytes32,
     bytes96,
+    uint8,
+    uint64,
 )
 from tests.core.hashable.hashable_strategies import (
+    basic_list_sedes_and_values_st,
+    basic_vector_sedes_and_values_st,
     composite_sedes_and_values_st,
     container_sedes_and_values_st,
     list_sedes_and_values_st,
@@ -188,6 +205,62 @@ def test_sequence_manipulation(data, sequence_type_and_values_st, sequence_size)
     assert hashable_value_evolved == hashable_value_mset
 
 
+@given(
+    st.data(),
+    st.one_of(st.just(list_sedes_and_values_st), st.just(vector_sedes_and_values_st)),
+    st.integers(min_value=1, max_value=10),
+    st.booleans(),
+)
+def test_bulk_updates(data, sequence_type_and_values_st, sequence_size, lazy):
+    sedes, values = data.draw(sequence_type_and_values_st(size=sequence_size))
+
+    value = data.draw(values)
+    replacement_value = data.draw(values)
+
+    hashable_value = to_hashable_value(value, sedes)
+    hashable_replacement_value = to_hashable_value(replacement_value, sedes)
+    if lazy:
+        hashable_value = ssz.decode(ssz.encode(hashable_value, sedes), sedes)
+
+    index_st = st.integers(min_value=0, max_value=sequence_size - 1)
+    indices = data.draw(st.lists(index_st))
+    replacements = [hashable_replacement_value[index] for index in indices]
+
+    evolver = hashable_value.evolver()
+    for index, replacement in zip(indices, replacements):
+        evolver[index] = replacement
+    expected = evolver.persistent()
+
+    updated_value = hashable_value.apply_updates(indices, replacements)
+    assert updated_value.has_hash_tree == hashable_value.has_hash_tree
+    assert updated_value == expected
+    assert list(updated_value) == list(expected)
+
+    replaced_value = hashable_value.replace_all(hashable_replacement_value)
+    assert replaced_value == hashable_replacement_value
+    assert list(replaced_value) == list(hashable_replacement_value)
+
+
+@pytest.mark.parametrize("chunks_only", (False, True))
+def test_bulk_updates_from_buffer(chunks_only):
+    sedes = List(uint64, 256)
+    value = HashableList.from_iterable(range(100), sedes, chunks_only=chunks_only)
+    indices = array.array("L", (3, 50, 99, 3))
+    updates = array.array("Q", (2**64 - 1, 7, 8, 9))
+
+    updated_value = value.apply_updates(indices, updates)
+    assert updated_value.is_chunks_only == chunks_only
+    assert updated_value == value.mset(3, 9, 50, 7, 99, 8)
+    assert updated_value.replace_all(array.array("Q", range(100))) == value
+
+    with pytest.raises(ValueError):
+        value.apply_updates((1, 2), (1,))
+    with pytest.raises(IndexError):
+        value.apply_updates((100,), (1,))
+    with pytest.raises(ValueError):
+        value.replace_all(range(99))
+
+
 @given(st.data(), st.integers(min_value=1, max_value=10))
 def test_container_manipulation(data, size):
     sedes, values = data.draw(container_sedes_and_values_st(size=size))
@@ -290,6 +363,76 @@ def test_list_extend(data, list_sedes_and_values):
     assert hashable_value_plussed == hashable_value_appended
 
 
+@given(st.data(), list_sedes_and_values_st())
+def test_list_shrink(data, list_sedes_and_values):
+    sedes, values = list_sedes_and_values
+
+    value = data.draw(values)
+    assume(len(value) > 0)
+    hashable_value = to_hashable_value(value, sedes)
+
+    index = data.draw(st.integers(min_value=0, max_value=len(value) - 1))
+    stop = data.draw(st.integers(min_value=index + 1, max_value=len(value)))
+
+    # truncate and pop
+    truncated = hashable_value.truncate(index)
+    truncate_evolver = hashable_value.evolver()
+    truncate_evolver.truncate(index)
+    pop_evolver = hashable_value.evolver()
+    popped_elements = [pop_evolver.pop() for _ in range(len(value) - index)]
+    assert popped_elements == list(reversed(hashable_value[index:]))
+    # only evolvers can be popped, as they are mutable
+    assert not hasattr(hashable_value, "pop")
+
+    expected_truncated = to_hashable_value(value[:index], sedes)
+    for result in (truncated, truncate_evolver, pop_evolver):
+        assert len(result) == index
+    for result in (
+        truncated,
+        truncate_evolver.persistent(),
+        pop_evolver.persistent(),
+    ):
+        assert result == expected_truncated
+        assert result.max_length == sedes.max_length
+
+    # delete and remove
+    deleted = hashable_value.delete(index, stop)
+    delete_evolver = hashable_value.evolver()
+    delete_evolver.delete(index, stop)
+
+    expected_deleted = to_hashable_value(value[:index] + value[stop:], sedes)
+    assert deleted == expected_deleted
+    assert delete_evolver.persistent() == expected_deleted
+
+    removed = hashable_value.remove(hashable_value[index])
+    first_index = list(hashable_value).index(hashable_value[index])
+    assert removed == to_hashable_value(
+        value[:first_index] + value[first_index + 1 :], sedes
+    )
+
+
+@given(st.data(), list_sedes_and_values_st())
+def test_list_evolver_shrink_with_pending_changes(data, list_sedes_and_values):
+    sedes, values = list_sedes_and_values
+
+    value = data.draw(values)
+    extension = data.draw(values)[: sedes.max_length - len(value)]
+    assume(len(value) > 0)
+    hashable_value = to_hashable_value(value, sedes)
+    hashable_extension = to_hashable_value(extension, sedes)
+
+    length = data.draw(st.integers(min_value=0, max_value=len(value) + len(extension)))
+
+    evolver = hashable_value.evolver()
+    evolver[0] = hashable_value[-1]
+    evolver.extend(hashable_extension)
+    evolver.truncate(length)
+
+    expected = ([value[-1]] + list(value[1:]) + list(extension))[:length]
+    assert len(evolver) == length
+    assert evolver.persistent() == to_hashable_value(expected, sedes)
+
+
 @given(st.data(), container_sedes_and_values_st())
 def test_transform(data, sedes_and_values):
     sedes, values = sedes_and_values
@@ -342,3 +485,137 @@ def test_signing_root(data, sedes_and_values):
     hashable_value = SignedValueClass.create(**kwargs, signature=signature)
 
     assert hashable_value.signing_root == unsigned_hashable_value.hash_tree_root
+
+
+@given(st.data(), st.one_of(list_sedes_and_values_st(), vector_sedes_and_values_st()))
+def test_lazy_sequence(data, sequence_sedes_and_values):
+    sedes, values = sequence_sedes_and_values
+    value = data.draw(values)
+    hashable_value = to_hashable_value(value, sedes)
+
+    decoded_value = ssz.decode(ssz.encode(hashable_value, sedes), sedes)
+    assert not decoded_value.has_hash_tree
+    assert len(decoded_value) == len(hashable_value)
+    assert ssz.encode(decoded_value, sedes) == ssz.encode(hashable_value, sedes)
+    assert not decoded_value.has_hash_tree
+
+    if len(value) > 0:
+        index = data.draw(st.integers(min_value=0, max_value=len(value) - 1))
+        element = hashable_value[-1]
+        updated_value = decoded_value.set(index, element)
+        assert not updated_value.has_hash_tree
+        assert updated_value == hashable_value.set(index, element)
+
+    assert decoded_value.hash_tree_root == hashable_value.hash_tree_root
+    assert decoded_value.has_hash_tree
+    assert decoded_value.hash_tree.is_lazy
+
+
+@given(st.data(), container_sedes_and_values_st())
+def test_lazy_container(data, sedes_and_values):
+    sedes, values = sedes_and_values
+    value = data.draw(values)
+    hashable_value = to_hashable_value(value, sedes)
+
+    decoded_value = ssz.decode(ssz.encode(hashable_value, sedes), type(hashable_value))
+    assert not decoded_value.has_hash_tree
+    assert decoded_value == hashable_value
+
+
+@pytest.mark.parametrize(
+    ("sedes", "value", "invalid_element"),
+    (
+        (List(uint64, 4), (1, 2), -5),
+        (List(uint64, 4), (1, 2), 2**70),
+        (List(bytes32, 4), (b"\x01" * 32,), b"\x01" * 31),
+    ),
+)
+def test_lazy_sequence_updates_are_validated(sedes, value, invalid_element):
+    decoded_value = ssz.decode(ssz.encode(value, sedes), sedes)
+    assert not decoded_value.has_hash_tree
+
+    with pytest.raises(SerializationError):
+        decoded_value.set(0, invalid_element)
+    with pytest.raises(SerializationError):
+        decoded_value.append(invalid_element)
+    with pytest.raises(SerializationError):
+        decoded_value.mset(0, value[0], 0, invalid_element)
+    with pytest.raises(SerializationError):
+        decoded_value.replace_all(value[:-1] + (invalid_element,))
+    assert not decoded_value.has_hash_tree
+
+
+@given(st.data(), basic_list_sedes_and_values_st())
+def test_chunks_only_list(data, list_sedes_and_values):
+    sedes, values = list_sedes_and_values
+    assume(sedes.is_packing)
+    value = data.draw(values)
+    hashable_value = HashableList.from_iterable(value, sedes)
+
+    for lazy in (False, True):
+        chunks_only_value = HashableList.from_iterable(
+            value, sedes, lazy=lazy, chunks_only=True
+        )
+        assert chunks_only_value.is_chunks_only
+        assert chunks_only_value == hashable_value
+        assert list(chunks_only_value) == list(value)
+        assert ssz.encode(chunks_only_value, sedes) == ssz.encode(value, sedes)
+
+        index = data.draw(st.integers(min_value=0, max_value=len(value) - 1))
+        stop = data.draw(st.integers(min_value=index + 1, max_value=len(value)))
+        assert chunks_only_value[index] == value[index]
+        assert list(chunks_only_value[index:stop]) == list(value[index:stop])
+
+        derived_values = (
+            (
+                chunks_only_value.set(index, value[-1]),
+                hashable_value.set(index, value[-1]),
+            ),
+            (chunks_only_value.truncate(index), hashable_value.truncate(index)),
+            (chunks_only_value.delete(index, stop), hashable_value.delete(index, stop)),
+        )
+        if len(value) < sedes.max_length:
+            derived_values += (
+                (chunks_only_value.append(value[0]), hashable_value.append(value[0])),
+            )
+        for derived_chunks_only_value, expected in derived_values:
+            assert derived_chunks_only_value.is_chunks_only
+            assert derived_chunks_only_value == expected
+            assert list(derived_chunks_only_value) == list(expected)
+
+
+@given(st.data(), basic_vector_sedes_and_values_st())
+def test_chunks_only_vector(data, vector_sedes_and_values):
+    sedes, values = vector_sedes_and_values
+    assume(sedes.is_packing)
+    value = data.draw(values)
+    hashable_value = HashableVector.from_iterable(value, sedes)
+    chunks_only_value = HashableVector.from_iterable(value, sedes, chunks_only=True)
+
+    assert chunks_only_value == hashable_value
+    assert tuple(chunks_only_value) == value
+
+    index = data.draw(st.integers(min_value=0, max_value=len(value) - 1))
+    updated_value = chunks_only_value.set(index, value[0])
+    assert updated_value.is_chunks_only
+    assert updated_value == hashable_value.set(index, value[0])
+
+
+@pytest.mark.parametrize("element_sedes", (uint8, uint64))
+def test_chunks_only_across_chunks(element_sedes):
+    sedes = List(element_sedes, 256)
+    value = tuple(range(100))
+    hashable_value = HashableList.from_iterable(value, sedes)
+    chunks_only_value = HashableList.from_iterable(value, sedes, chunks_only=True)
+
+    assert list(chunks_only_value[3:97]) == list(value[3:97])
+    assert chunks_only_value[3:97].to_bytes() == ssz.encode(value[3:97], sedes)
+    assert chunks_only_value.delete(5, 90) == hashable_value.delete(5, 90)
+    assert chunks_only_value.truncate(33) == hashable_value.truncate(33)
+    assert chunks_only_value.remove(50) == hashable_value.remove(50)
+    assert chunks_only_value.extend(value) == hashable_value.extend(value)
+
+
+def test_chunks_only_composite_elements():
+    with pytest.raises(ValueError):
+        HashableList.from_iterable((), List(bytes32, 8), chunks_only=True)
@@ -0,0 +1,107 @@
+import pytest
+import copy
+import pickle
+
+from hypothesis import (
+    given,
+    strategies as st,
+)
+
+from ssz.bitfield import (
+    Bitfield,
+)
+from ssz.sedes import (
+    Bitlist,
+    Bitvector,
+)
+from ssz.utils import (
+    pack_bits,
+)
+
+bools_st = st.lists(st.booleans(), max_size=600).map(tuple)
+
+
+@st.composite
+def bitfield_pair_st(draw):
+    length = draw(st.integers(min_value=0, max_value=600))
+    bools = st.lists(st.booleans(), min_size=length, max_size=length).map(tuple)
+    return draw(bools), draw(bools)
+
+
+@given(bools_st)
+def test_sequence_interface(bools):
+    bitfield = Bitfield.from_bools(bools)
+
+    assert len(bitfield) == len(bools)
+    assert tuple(bitfield) == bools
+    assert bitfield == bools
+    assert bools == bitfield
+    assert hash(bitfield) == hash(bools)
+    assert bitfield.bit_count() == sum(bools)
+    for index in range(-len(bools), len(bools)):
+        assert bitfield[index] is bools[index]
+    assert bitfield[3:-2] == bools[3:-2]
+    assert bitfield[::3] == bools[::3]
+    assert Bitfield.from_bytes(bitfield.to_bytes(), len(bools)) == bitfield
+
+    with pytest.raises(IndexError):
+        bitfield[len(bools)]
+
+
+@given(bitfield_pair_st())
+def test_bitwise_operations(bools_pair):
+    bools_a, bools_b = bools_pair
+    a = Bitfield.from_bools(bools_a)
+    b = Bitfield.from_bools(bools_b)
+
+    assert a | b == tuple(x or y for x, y in zip(bools_a, bools_b))
+    assert a & b == tuple(x and y for x, y in zip(bools_a, bools_b))
+    assert a ^ b == tuple(x != y for x, y in zip(bools_a, bools_b))
+    assert a.issubset(b) == all(y for x, y in zip(bools_a, bools_b) if x)
+    assert a.isdisjoint(b) == (not any(x and y for x, y in zip(bools_a, bools_b)))
+    assert a.issubset(a | b)
+
+
+def test_set():
+    bitfield = Bitfield.from_bools((False, True, False))
+    assert bitfield.set(0) == (True, True, False)
+    assert bitfield.set(-2, False) == (False, False, False)
+    assert bitfield == (False, True, False)
+
+    with pytest.raises(IndexError):
+        bitfield.set(3)
+
+
+def test_invalid_bitfields():
+    with pytest.raises(ValueError):
+        Bitfield(0b100, 2)
+    with pytest.raises(ValueError):
+        Bitfield(0, -1)
+    with pytest.raises(ValueError):
+        Bitfield.from_bytes(b"\x00", 9)
+    with pytest.raises(ValueError):
+        Bitfield(0, 2) | Bitfield(0, 3)
+    with pytest.raises(TypeError):
+        Bitfield(0, 2).issubset((False, False))
+
+
+def test_copy_and_pickle():
+    bitfield = Bitfield.from_bools((True, False, True))
+    assert copy.deepcopy(bitfield) is bitfield
+    assert pickle.loads(pickle.dumps(bitfield)) == bitfield
+
+
+@given(bools_st)
+def test_bitfield_serialization(bools):
+    bitfield = Bitfield.from_bools(bools)
+    bitlist = Bitlist(600)
+
+    assert bitlist.serialize(bitfield) == bitlist.serialize(bools)
+    assert bitlist.deserialize(bitlist.serialize(bools)) == bitfield
+    assert pack_bits(bitfield) == pack_bits(bools)
+    assert bitlist.get_hash_tree_root(bitfield) == bitlist.get_hash_tree_root(bools)
+
+    if len(bools) > 0:
+        bitvector = Bitvector(len(bools))
+        assert bitvector.serialize(bitfield) == bitvector.serialize(bools)
+        assert bitvector.deserialize(bitvector.serialize(bools)) == bitfield
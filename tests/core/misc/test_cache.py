@@ -1,12 +1,40 @@
 import pytest
+from concurrent.futures import (
+    ThreadPoolExecutor,
+)
+import hashlib
+import pickle
 
+import ssz
 from ssz import (
+    List,
     Serializable,
     bytes32,
     uint8,
 )
 from ssz.cache.cache import (
+    DEFAULT_MERKLE_CACHE_MAX_BYTES,
+    DEFAULT_MERKLE_CACHE_MIN_HEIGHT,
+    MERKLE_NODE_ENTRY_SIZE,
+    MerkleCache,
     SSZCache,
+    get_shared_merkle_cache,
+    set_shared_merkle_cache,
+)
+from ssz.cache.memo import (
+    OBJECT_OVERHEAD,
+    BoundedMemo,
+)
+from ssz.cache.utils import (
+    get_digest_key,
+)
+from ssz.hashable_list import (
+    HashableList,
+)
+from ssz.utils import (
+    merkleize,
+    merkleize_with_cache,
+    pack_bytes,
 )
 
 
@@ -42,3 +70,257 @@ def test_reset_cache_without_db(foo_without_db):
 
     foo_without_db.reset_cache()
     assert len(foo_without_db.cache) == 0
+
+
+class Bar(Serializable):
+    fields = (("foos", List(Foo, 4)), ("values", List(uint8, 64)))
+
+
+@pytest.mark.parametrize(
+    ("sedes", "value"),
+    (
+        (uint8, 1),
+        (bytes32, b"\x12" * 32),
+        (List(uint8, 64), tuple(range(64))),
+        (List(Foo, 4), (Foo(field1=1, field2=b"\x12" * 32),) * 4),
+    ),
+)
+def test_key_size_is_bounded(sedes, value):
+    key = sedes.get_key(value)
+    assert key.startswith(sedes.get_sedes_id())
+    # a prefix and the hex encoding of at most 32 bytes
+    assert len(key) - len(sedes.get_sedes_id()) <= 2 + 64
+    assert sedes.get_key(value) == key
+
+
+def test_keys_of_hashable_structures():
+    sedes = List(uint8, 64)
+    value = HashableList.from_iterable(range(64), sedes)
+    assert (
+        sedes.get_key(value) == f"{sedes.get_sedes_id()}h:{value.hash_tree_root.hex()}"
+    )
+    assert sedes.get_key(value.set(0, 1)) != sedes.get_key(value)
+
+
+def test_keys_do_not_collide():
+    long_value = tuple(range(40))
+    # the digest of the long value is a serialization of the same length as a hash
+    short_value = tuple(hashlib.sha256(bytes(long_value)).digest())
+    sedes = List(uint8, 64)
+    assert sedes.get_key(long_value) != sedes.get_key(short_value)
+    # a value serialized to the root of a hashable structure
+    hashable_value = HashableList.from_iterable(short_value, sedes)
+    root_value = tuple(hashable_value.hash_tree_root)
+    assert sedes.get_key(hashable_value) != sedes.get_key(root_value)
+
+    class Baz(Serializable):
+        fields = (("values", List(List(uint8, 64), 4)),)
+
+    baz = Baz(values=(long_value, short_value))
+    assert baz.hash_tree_root == Baz.get_hash_tree_root(baz, cache=False)
+
+
+def test_keys_do_not_cache_serializations():
+    class Qux(Serializable):
+        fields = (("foo", Foo), ("other_foo", Foo))
+
+    foos = (Foo(field1=1, field2=b"\x12" * 32), Foo(field1=2, field2=b"\x34" * 32))
+    qux = Qux(*foos)
+    # the roots of the fields are cached under their keys
+    assert qux.hash_tree_root == Qux.get_hash_tree_root(qux, cache=False)
+    assert all(foo._serialize_cache is None for foo in foos)
+
+    # a serialization that is cached already is reused
+    ssz.encode(foos[0])
+    assert foos[0]._serialize_cache is not None
+    assert foos[0].get_key() == f"Foo{get_digest_key(ssz.encode(foos[0]))}"
+
+
+def test_nested_cache_sanity():
+    foo = Foo(field1=10, field2=b"\x12" * 32)
+    bar = Bar(foos=(foo, foo.copy(field1=11)), values=tuple(range(64)))
+    assert bar.hash_tree_root == Bar.get_hash_tree_root(bar, cache=False)
+    assert foo.get_key() == f"Foo{get_digest_key(ssz.encode(foo))}"
+
+
+def test_merkle_cache_budget():
+    cache = MerkleCache(max_bytes=MERKLE_NODE_ENTRY_SIZE * 8)
+    assert cache.budget == MERKLE_NODE_ENTRY_SIZE * 8
+
+    chunks = tuple(i.to_bytes(32, "little") for i in range(64))
+    root, _ = merkleize_with_cache(chunks, cache=cache)
+    assert root == merkleize(chunks)
+    assert len(cache) == 8
+
+    cache = MerkleCache()
+    merkleize_with_cache(chunks, cache=cache)
+    # all nodes but the 32 parents of pairs of chunks
+    assert len(cache) == 63 - 32
+    cache.reserve(2**30)
+    assert cache.budget > DEFAULT_MERKLE_CACHE_MAX_BYTES - MERKLE_NODE_ENTRY_SIZE
+
+
+def test_merkle_cache_admission_and_stats():
+    cache = MerkleCache(min_height=3)
+    chunks = tuple(i.to_bytes(32, "little") for i in range(64))
+    root, _ = merkleize_with_cache(chunks, cache=cache, limit=256)
+    assert root == merkleize(chunks, limit=256)
+    # nodes at heights 3 to 8
+    assert len(cache) == 8 + 4 + 2 + 1 + 1 + 1
+    assert cache.hits == 0
+
+    updated_chunks = (b"\xff" * 32,) + chunks[1:]
+    root, _ = merkleize_with_cache(updated_chunks, cache=cache, limit=256)
+    assert root == merkleize(updated_chunks, limit=256)
+    # the unchanged nodes at heights 3 to 5
+    assert cache.hits == 7 + 3 + 1
+
+    cache.clear()
+    assert len(cache) == 0
+
+
+def test_merkle_cache_skips_leaf_pairs_by_default():
+    cache = MerkleCache()
+    assert cache.min_height == DEFAULT_MERKLE_CACHE_MIN_HEIGHT == 2
+
+    chunks = tuple(i.to_bytes(32, "little") for i in range(8))
+    root, _ = merkleize_with_cache(chunks, cache=cache)
+    assert root == merkleize(chunks)
+    leaf_pairs = tuple(
+        chunks[index] + chunks[index + 1] for index in range(0, len(chunks), 2)
+    )
+    assert not any(leaf_pair in cache for leaf_pair in leaf_pairs)
+    # the nodes at heights 2 and 3
+    assert len(cache) == 2 + 1
+
+
+@pytest.mark.parametrize(
+    ("max_bytes", "min_height"),
+    ((MERKLE_NODE_ENTRY_SIZE - 1, 1), (2**20, 0)),
+)
+def test_invalid_merkle_cache(max_bytes, min_height):
+    with pytest.raises(ValueError):
+        MerkleCache(max_bytes=max_bytes, min_height=min_height)
+
+
+def test_serializable_uses_merkle_cache():
+    foo = Foo(field1=10, field2=b"\x12" * 32)
+    # the cache is only allocated by the first hash
+    assert foo.cache is None
+    assert foo.hash_tree_root == Foo.get_hash_tree_root(foo, cache=False)
+    assert isinstance(foo.cache, MerkleCache)
+
+    unpickled_foo = pickle.loads(pickle.dumps(foo))
+    assert unpickled_foo == foo
+    assert isinstance(unpickled_foo.cache, MerkleCache)
+
+
+def test_shared_merkle_cache():
+    shared_cache = MerkleCache()
+    own_cache = MerkleCache()
+    foo = Foo(field1=10, field2=b"\x12" * 32)
+    foo_with_cache = Foo(field1=10, field2=b"\x12" * 32, cache=own_cache)
+    bar = Bar(foos=(foo,), values=(1, 2))
+
+    set_shared_merkle_cache(shared_cache)
+    try:
+        assert get_shared_merkle_cache() is shared_cache
+        assert foo.hash_tree_root == Foo.get_hash_tree_root(foo, cache=False)
+        assert bar.hash_tree_root == Bar.get_hash_tree_root(bar, cache=False)
+        assert foo_with_cache.hash_tree_root == foo.hash_tree_root
+        bar.reset_cache()
+    finally:
+        set_shared_merkle_cache(None)
+
+    assert foo.cache is None and bar.cache is None
+    assert foo_with_cache.cache is own_cache
+    assert len(shared_cache) > 0 and len(own_cache) > 0
+    assert get_shared_merkle_cache() is None
+
+
+def make_counting_memo(max_bytes, max_entry_bytes):
+    calls = []
+
+    def double(data):
+        calls.append(data)
+        return data * 2
+
+    memo = BoundedMemo(double, len, len, max_bytes, max_entry_bytes)
+    return memo, calls
+
+
+def test_bounded_memo_budget():
+    memo, calls = make_counting_memo(max_bytes=100, max_entry_bytes=30)
+
+    assert memo(b"a" * 10) == b"a" * 20
+    assert memo(b"a" * 10) == b"a" * 20
+    assert len(calls) == 1
+    assert memo.stats.hits == 1
+    assert memo.stats.size == 30
+
+    # arguments too large for an entry are neither looked up nor stored
+    memo(b"b" * 31)
+    memo(b"b" * 31)
+    assert len(calls) == 3
+    assert memo.stats.bypasses == 2
+    # entries of up to 30 bytes, the least recently used is evicted
+    memo(b"c" * 10)
+    memo(b"d" * 10)
+    memo(b"a" * 10)
+    memo(b"e" * 10)
+    assert memo.stats.evictions == 1
+    assert memo.stats.size == 90
+    memo(b"c" * 10)
+    assert calls[-1] == b"c" * 10
+
+
+def test_bounded_memo_configuration():
+    memo, calls = make_counting_memo(max_bytes=100, max_entry_bytes=30)
+    memo(b"a" * 10)
+    memo(b"b" * 10)
+
+    memo.resize(40)
+    assert memo.stats.entries == 1
+    assert memo.stats.max_size == 40
+
+    memo.disable()
+    assert not memo.enabled
+    assert memo.stats.entries == 0
+    memo(b"a" * 10)
+    memo(b"a" * 10)
+    assert memo.stats.entries == 0
+    assert len(calls) == 4
+
+    memo.enable()
+    memo(b"a" * 10)
+    assert memo.stats.entries == 1
+    memo.clear()
+    assert memo.stats.entries == 0
+    assert memo.stats.size == 0
+
+    with pytest.raises(ValueError):
+        memo.resize(-1)
+    with pytest.raises(ValueError):
+        memo.resize(10, 20)
+
+
+def test_bounded_memo_from_threads():
+    memo, _ = make_counting_memo(max_bytes=300, max_entry_bytes=30)
+    args = tuple(bytes([i % 50]) * 10 for i in range(10000))
+
+    with ThreadPoolExecutor(max_workers=8) as executor:
+        results = tuple(executor.map(memo, args))
+
+    assert results == tuple(arg * 2 for arg in args)
+    # the bookkeeping is consistent with the entries that are left
+    assert memo.stats.size == 30 * memo.stats.entries <= 300
+    assert memo.stats.hits + memo.stats.misses == len(args)
+
+
+def test_large_payloads_bypass_memos():
+    bypasses = pack_bytes.stats.bypasses
+    pack_bytes(b"\x01" * 2**20)
+    assert pack_bytes.stats.bypasses == bypasses + 1
+
+    pack_bytes(b"\x02" * 64)
+    assert pack_bytes.stats.size >= 64 + OBJECT_OVERHEAD
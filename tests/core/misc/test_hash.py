@@ -0,0 +1,76 @@
+import pytest
+import hashlib
+
+from hypothesis import (
+    given,
+    strategies as st,
+)
+
+import ssz.hash
+from ssz.hash import (
+    DEFAULT_HASH_BACKEND,
+    get_hash_backend,
+    get_hash_backends,
+    hash_eth2,
+    hash_pairs,
+    hashlib_hash_pairs,
+    register_hash_backend,
+    set_hash_backend,
+)
+
+
+@pytest.fixture
+def reset_hash_backend(monkeypatch):
+    # backends registered by a test are dropped again with this copy of the registry
+    monkeypatch.setattr(ssz.hash, "_hash_backends", dict(ssz.hash._hash_backends))
+    yield
+    set_hash_backend(DEFAULT_HASH_BACKEND)
+
+
+@given(st.lists(st.binary(min_size=64, max_size=64)))
+def test_hash_pairs(pairs):
+    expected = b"".join(hash_eth2(pair) for pair in pairs)
+    assert hash_pairs(b"".join(pairs)) == expected
+
+
+@pytest.mark.parametrize("length", (1, 32, 63, 65, 96))
+def test_hash_pairs_invalid_length(length):
+    with pytest.raises(ValueError):
+        hash_pairs(b"\x00" * length)
+
+
+def test_default_hash_backend():
+    assert get_hash_backend() == DEFAULT_HASH_BACKEND
+    assert DEFAULT_HASH_BACKEND in get_hash_backends()
+
+
+def test_set_hash_backend(reset_hash_backend):
+    calls = []
+
+    def counting_hash_pairs(data):
+        calls.append(len(data))
+        return hashlib_hash_pairs(data)
+
+    register_hash_backend("counting", counting_hash_pairs)
+    set_hash_backend("counting")
+    assert get_hash_backend() == "counting"
+
+    data = b"\x01" * 128
+    assert hash_pairs(data) == hashlib.sha256(data[:64]).digest() * 2
+    assert calls == [128]
+
+    with pytest.raises(ValueError):
+        register_hash_backend("counting", counting_hash_pairs)
+
+
+def test_registered_hash_backends_are_reset(reset_hash_backend):
+    # the backend registered by test_set_hash_backend is not kept, so it can be
+    # registered again
+    assert "counting" not in get_hash_backends()
+    register_hash_backend("counting", hashlib_hash_pairs)
+
+
+def test_set_unknown_hash_backend():
+    with pytest.raises(ValueError):
+        set_hash_backend("unknown")
+    assert get_hash_backend() == DEFAULT_HASH_BACKEND
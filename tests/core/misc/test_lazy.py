@@ -0,0 +1,136 @@
+import pytest
+
+from eth_utils import (
+    decode_hex,
+)
+
+import ssz
+from ssz.exceptions import (
+    DeserializationError,
+)
+from ssz.hashable_container import (
+    HashableContainer,
+)
+from ssz.lazy import (
+    LazyContainer,
+    LazySequence,
+)
+from ssz.sedes import (
+    ByteList,
+    Container,
+    List,
+    Serializable,
+    Vector,
+    bytes32,
+    uint8,
+    uint64,
+)
+
+
+class Header(Serializable):
+    fields = (("slot", uint64), ("parent_root", bytes32))
+
+
+class Block(Serializable):
+    fields = (
+        ("header", Header),
+        ("values", List(uint64, 8)),
+        ("nested", List(List(uint8, 4), 4)),
+        ("headers", Vector(Header, 2)),
+    )
+
+
+class HashableBlock(HashableContainer):
+    fields = (("slot", uint64), ("nested", List(List(uint8, 4), 4)))
+
+
+def make_block():
+    return Block(
+        header=Header(1, b"\x01" * 32),
+        values=(2, 3),
+        nested=((4,), (), (5, 6)),
+        headers=(Header(7, b"\x07" * 32), Header(8, b"\x08" * 32)),
+    )
+
+
+@pytest.mark.parametrize("hashable", (True, False))
+def test_lazy_serializable(hashable):
+    block = make_block()
+    lazy_block = ssz.decode_lazy(ssz.encode(block), Block, hashable=hashable)
+
+    assert isinstance(lazy_block, LazyContainer)
+    assert isinstance(lazy_block.header, LazyContainer)
+    assert isinstance(lazy_block.nested, LazySequence)
+    assert lazy_block.header is lazy_block["header"] is lazy_block[0]
+    assert lazy_block.header.slot == 1
+    assert lazy_block.header.parent_root == b"\x01" * 32
+    assert tuple(lazy_block.values) == (2, 3)
+    assert [tuple(element) for element in lazy_block.nested] == [(4,), (), (5, 6)]
+    assert lazy_block.headers[-1].slot == 8
+    assert lazy_block.field_names == Block._meta.field_names
+
+    assert lazy_block.to_bytes() == ssz.encode(block)
+    assert lazy_block.decode() == block
+    assert lazy_block.hash_tree_root == block.hash_tree_root
+
+    with pytest.raises(AttributeError):
+        lazy_block.unknown
+    with pytest.raises(KeyError):
+        lazy_block["unknown"]
+    with pytest.raises(IndexError):
+        lazy_block[4]
+
+
+def test_lazy_hashable_container():
+    value = HashableBlock.create(slot=3, nested=((1, 2), (3,)))
+    lazy_value = ssz.decode_lazy(ssz.encode(value, HashableBlock), HashableBlock)
+
+    assert lazy_value.slot == 3
+    assert tuple(lazy_value.nested[0]) == (1, 2)
+    assert lazy_value.hash_tree_root == value.hash_tree_root
+
+
+def test_lazy_plain_sedes():
+    sedes = Container((uint8, List(Container((uint8, uint64)), 4)))
+    value = (1, ((2, 3), (4, 5)))
+    lazy_value = ssz.decode_lazy(ssz.encode(value, sedes), sedes)
+
+    assert lazy_value.field_names is None
+    assert lazy_value[1][1][1] == 5
+    assert lazy_value[:1] == (1,)
+    assert ssz.decode_lazy(ssz.encode(3, uint8), uint8) == 3
+
+
+@pytest.mark.parametrize(
+    ("sedes", "serialized"),
+    (
+        # truncated fixed size section
+        (Block, "0x" "00"),
+        # too many list elements
+        (List(Header, 1), "0x" + "00" * 80),
+        (List(List(uint8, 4), 1), "0x" "08000000" "08000000"),
+        # wrong number of vector elements
+        (Vector(Header, 2), "0x" + "00" * 40),
+        # first offset is not a positive multiple of the offset size
+        (List(List(uint8, 4), 4), "0x" "00000000"),
+        (List(List(uint8, 4), 4), "0x" "05000000" "aa"),
+        # first offset points past the end of the data
+        (List(List(uint8, 4), 4), "0x" "08000000"),
+        (List(ByteList(10), 2**40), "0x" "00000004"),
+        (List(ByteList(10), 2**40), "0x" "fcffffff"),
+    ),
+)
+def test_lazy_decode_invalid_data(sedes, serialized):
+    with pytest.raises(DeserializationError):
+        ssz.decode_lazy(decode_hex(serialized), sedes)
+
+
+def test_lazy_decode_invalid_elements():
+    sedes = List(List(uint8, 4), 4)
+    # the offset of the second element points before the one of the first
+    lazy_value = ssz.decode_lazy(decode_hex("0x" "08000000" "07000000" "aa"), sedes)
+
+    with pytest.raises(DeserializationError):
+        lazy_value[0]
+    with pytest.raises(DeserializationError):
+        lazy_value[1]
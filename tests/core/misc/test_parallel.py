@@ -0,0 +1,133 @@
+import pytest
+from concurrent.futures import (
+    ProcessPoolExecutor,
+    ThreadPoolExecutor,
+)
+
+from ssz.constants import (
+    CHUNK_SIZE,
+)
+from ssz.hashable_container import (
+    HashableContainer,
+)
+from ssz.parallel import (
+    get_executor,
+    set_executor,
+)
+from ssz.sedes import (
+    ByteList,
+    Container,
+    List,
+    Serializable,
+    Vector,
+    bytes32,
+    uint8,
+    uint64,
+)
+from ssz.utils import (
+    merkleize,
+    merkleize_subtrees,
+    pack,
+)
+
+
+class Point(Serializable):
+    fields = (("x", uint64), ("y", uint64), ("label", List(uint8, 8)))
+
+
+class HashablePoint(HashableContainer):
+    fields = (("x", uint64), ("y", uint64), ("label", List(uint8, 8)))
+
+
+class Shape(Serializable):
+    fields = (("points", List(Point, 128)), ("root", bytes32))
+
+
+POINTS = tuple(Point(x=i, y=2 * i, label=(i % 256,) * (i % 8)) for i in range(100))
+
+
+@pytest.fixture
+def thread_pool():
+    with ThreadPoolExecutor(2) as executor:
+        yield executor
+    set_executor(None)
+
+
+@pytest.mark.parametrize(
+    ("sedes", "value"),
+    (
+        (List(Point, 128), POINTS),
+        (Vector(Point, 100), POINTS),
+        (
+            List(HashablePoint, 128),
+            tuple(HashablePoint.create(**point.as_dict()) for point in POINTS),
+        ),
+        (
+            List(Container((uint8, List(uint8, 8))), 128),
+            tuple((i, (i,) * (i % 8)) for i in range(100)),
+        ),
+    ),
+)
+def test_parallel_hash_tree_root(sedes, value):
+    expected_root = sedes.get_hash_tree_root(value)
+    with ProcessPoolExecutor(2) as executor:
+        assert sedes.get_hash_tree_root(value, executor=executor) == expected_root
+
+
+def test_configured_executor(thread_pool):
+    sedes = List(Point, 128)
+    expected_roots = tuple(
+        sedes.get_hash_tree_root(points) for points in (POINTS, POINTS[:10])
+    )
+    shape = Shape(points=POINTS + POINTS[:10], root=b"\x00" * 32)
+    expected_shape_root = Shape.get_hash_tree_root(shape, cache=False)
+
+    set_executor(thread_pool, min_elements=64)
+    assert get_executor() is thread_pool
+    assert sedes.get_hash_tree_root(POINTS) == expected_roots[0]
+    assert sedes.get_hash_tree_root(POINTS[:10]) == expected_roots[1]
+    # roots of missing elements of serializable values are computed in the pool
+    assert shape.hash_tree_root == expected_shape_root
+
+    set_executor(None)
+    assert get_executor() is None
+
+
+def test_invalid_min_elements(thread_pool):
+    with pytest.raises(ValueError):
+        set_executor(thread_pool, min_elements=0)
+
+
+@pytest.mark.parametrize("chunk_count", (1, 2, 3, 8, 9, 100))
+@pytest.mark.parametrize("limit", (None, 128, 2**20))
+@pytest.mark.parametrize("subtree_depth", (0, 1, 3))
+def test_merkleize_subtrees(thread_pool, chunk_count, limit, subtree_depth):
+    chunks = tuple(i.to_bytes(CHUNK_SIZE, "little") for i in range(chunk_count))
+    expected_root = merkleize(chunks, limit=limit)
+    max_depth = (max(chunk_count, limit or chunk_count) - 1).bit_length()
+
+    assert merkleize(chunks, limit=limit, executor=thread_pool) == expected_root
+    assert (
+        merkleize_subtrees(chunks, max_depth, thread_pool, subtree_depth)
+        == expected_root
+    )
+
+
+def test_parallel_merkleization():
+    balances = tuple(range(2**10))
+    payload = bytes(range(256)) * 2**6
+    with ProcessPoolExecutor(2) as executor:
+        assert List(uint64, 2**40).get_hash_tree_root(
+            balances, executor=executor
+        ) == List(uint64, 2**40).get_hash_tree_root(balances)
+        assert ByteList(2**20).get_hash_tree_root(
+            payload, executor=executor
+        ) == ByteList(2**20).get_hash_tree_root(payload)
+
+        set_executor(executor, min_chunks=2**4)
+        try:
+            assert Vector(uint64, 2**10).get_hash_tree_root(balances) == merkleize(
+                pack(tuple(uint64.serialize(b) for b in balances))
+            )
+        finally:
+            set_executor(None)
@@ -1,9 +1,19 @@
 import pytest
 
+from eth_utils import (
+    decode_hex,
+)
+
 import ssz
+from ssz.exceptions import (
+    DeserializationError,
+)
 from ssz.sedes import (
+    Container,
     List,
+    bytes32,
     uint8,
+    uint64,
 )
 
 
@@ -128,3 +138,115 @@ class Foo(ssz.Serializable):
 )
 def test_get_sedes_id(sedes, id):
     assert sedes.get_sedes_id() == id
+
+
+def test_deserialize_without_hash_trees():
+    class Inner(ssz.Serializable):
+        fields = (("values", List(uint8, 4)),)
+
+    class Outer(ssz.Serializable):
+        fields = (("inners", List(Inner, 4)), ("values", List(uint8, 4)))
+
+    value = Outer(inners=(Inner(values=(1, 2)),), values=(3,))
+    serialized = ssz.encode(value)
+
+    decoded = ssz.decode(serialized, Outer, hashable=False)
+    assert type(decoded.values) is tuple
+    assert type(decoded.inners) is tuple
+    assert type(decoded.inners[0].values) is tuple
+    assert decoded == value
+    assert decoded.hash_tree_root == value.hash_tree_root
+
+
+def test_read_field():
+    class Header(ssz.Serializable):
+        fields = (("slot", uint64), ("parent_root", bytes32))
+
+    class Block(ssz.Serializable):
+        fields = (
+            ("header", Header),
+            ("first", List(uint8, 4)),
+            ("flag", uint8),
+            ("second", List(uint8, 4)),
+            ("third", List(uint8, 4)),
+        )
+
+    header = Header(slot=5, parent_root=b"\x01" * 32)
+    block = Block(header, (1, 2), 3, (), (4,))
+    serialized = ssz.encode(block)
+
+    assert Block.read_field(serialized, "header") == header
+    assert Header.read_field(Header.serialize(header), "slot") == 5
+    assert Header.read_field(Header.serialize(header), 1) == b"\x01" * 32
+    for index, name in enumerate(Block._meta.field_names):
+        assert Block.read_field(serialized, name, hashable=False) == block[index]
+        field = Block.read_field(serialized, index)
+        sedes = Block._meta.container_sedes.field_sedes[index]
+        assert ssz.encode(field, sedes) == ssz.encode(block[index], sedes)
+
+    with pytest.raises(ValueError):
+        Block.read_field(serialized, "unknown")
+    with pytest.raises(IndexError):
+        Block.read_field(serialized, 5)
+    with pytest.raises(DeserializationError):
+        Header.read_field(Header.serialize(header) + b"\x00", "slot")
+
+
+@pytest.mark.parametrize(
+    ("serialized", "index"),
+    (
+        # first offset does not point to the end of the fixed size section
+        ("0x" "0a000000" "aa" "0d000000" "0e000000" "01020304", 2),
+        # offsets out of order
+        ("0x" "0d000000" "aa" "0f000000" "0e000000" "01020304", 2),
+        ("0x" "0d000000" "aa" "0f000000" "0e000000" "01020304", 3),
+        # offset points past the end of the data
+        ("0x" "0d000000" "aa" "0e000000" "12000000" "01020304", 3),
+        # truncated fixed size section
+        ("0x" "0d000000" "aa", 1),
+    ),
+)
+def test_read_field_from_invalid_data(serialized, index):
+    sedes = Container((List(uint8, 4), uint8, List(uint8, 4), List(uint8, 4)))
+    with pytest.raises(DeserializationError):
+        sedes.read_field(decode_hex(serialized), index)
+
+
+@pytest.mark.parametrize(
+    "field_names", (("field1", "field2"), ("list", "isinstance"), ("class", "def"))
+)
+def test_generated_init(field_names):
+    Test = type(
+        "Test",
+        (ssz.Serializable,),
+        {"fields": tuple((field_name, List(uint8, 4)) for field_name in field_names)},
+    )
+
+    first, second = field_names
+    test = Test([1, 2], **{second: (3,)})
+    assert getattr(test, first) == (1, 2)
+    assert getattr(test, second) == (3,)
+    assert Test.deserialize(Test.serialize(test)) == test
+
+    with pytest.raises(TypeError):
+        Test([1, 2], **{first: (3,)})
+    with pytest.raises(TypeError):
+        Test([1, 2])
+
+
+def test_init_of_subclasses():
+    class Test(ssz.Serializable):
+        fields = (("field1", uint8), ("field2", uint8))
+
+    class TestWithDefault(Test):
+        def __init__(self, field1, field2=2, **kwargs):
+            super().__init__(field1, field2, **kwargs)
+
+    class TestWithAttributeClash(TestWithDefault):
+        _field1 = None
+
+    for cls in (TestWithDefault, TestWithAttributeClash):
+        test = cls(1)
+        assert test.field1 == 1
+        assert test.field2 == 2
+        assert cls.deserialize(cls.serialize(test)).field2 == 2
@@ -15,6 +15,7 @@ from ssz.hash import (
 )
 from ssz.utils import (
     merkleize,
+    merkleize_with_cache,
     mix_in_length,
     pack,
     pack_bytes,
@@ -78,6 +79,16 @@ def test_merkleize(chunks, root):
     assert merkleize(chunks) == root
 
 
+@given(
+    st.lists(st.binary(min_size=CHUNK_SIZE, max_size=CHUNK_SIZE), max_size=33),
+    st.integers(min_value=0, max_value=64),
+)
+def test_merkleize_matches_cached_merkleization(chunks, extra_limit):
+    limit = len(chunks) + extra_limit
+    root, _ = merkleize_with_cache(chunks, {}, limit)
+    assert merkleize(chunks, limit) == root
+
+
 @pytest.mark.parametrize(
     ("limit", "success"),
     ((2**MAX_ZERO_HASHES_LAYER, True), (2**MAX_ZERO_HASHES_LAYER + 1, False)),
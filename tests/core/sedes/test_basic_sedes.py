@@ -1,4 +1,5 @@
 import pytest
+import array
 
 from eth_utils import (
     decode_hex,
@@ -6,6 +7,10 @@ from eth_utils import (
 )
 
 import ssz
+from ssz.exceptions import (
+    DeserializationError,
+    SerializationError,
+)
 from ssz.sedes import (
     Boolean,
     Byte,
@@ -89,3 +94,55 @@ def test_bool_eq(sedes1, sedes2):
 def test_bool_neq(sedes1, sedes2):
     assert sedes1 != sedes2
     assert hash(sedes1) != hash(sedes2)
+
+
+@pytest.mark.parametrize("bit_length", (8, 16, 32, 64, 128, 256))
+@pytest.mark.parametrize(
+    "values", ((), (0,), (1, 2, 3), (0, 255, 7, 1, 255, 0, 3, 9, 1, 2, 3))
+)
+def test_uint_sequence(bit_length, values):
+    sedes = UInt(bit_length)
+    serialized = b"".join(sedes.serialize(value) for value in values)
+    assert sedes.serialize_sequence(values) == serialized
+    assert sedes.serialize_sequence(list(values)) == serialized
+    assert sedes.deserialize_sequence(serialized) == values
+
+    if sedes.array_typecode is not None:
+        values_array = sedes.deserialize_array(serialized)
+        assert values_array.typecode == sedes.array_typecode
+        assert tuple(values_array) == values
+        assert sedes.serialize_sequence(values_array) == serialized
+        assert sedes.serialize_sequence(memoryview(values_array)) == serialized
+
+
+@pytest.mark.parametrize(
+    ("sedes", "values"),
+    (
+        (uint8, (256,)),
+        (uint8, (-1,)),
+        (UInt(64), (1, 2**64)),
+        (UInt(64), array.array("q", (-1,))),
+        (UInt(256), (2**256,)),
+    ),
+)
+def test_invalid_uint_sequence(sedes, values):
+    with pytest.raises(SerializationError):
+        sedes.serialize_sequence(values)
+
+
+def test_uint_sequence_from_other_buffers():
+    # signed or narrower buffers are converted element by element
+    assert UInt(64).serialize_sequence(array.array("q", (1, 2))) == (
+        b"\x01" + b"\x00" * 7 + b"\x02" + b"\x00" * 7
+    )
+    assert UInt(16).serialize_sequence(b"\x01\x02") == b"\x01\x00\x02\x00"
+    assert UInt(16).serialize_sequence(array.array("B", (1, 2))) == (
+        b"\x01\x00\x02\x00"
+    )
+
+
+def test_invalid_deserialize_array():
+    with pytest.raises(DeserializationError):
+        UInt(64).deserialize_array(b"\x00" * 9)
+    with pytest.raises(TypeError):
+        UInt(256).deserialize_array(b"\x00" * 32)
@@ -9,6 +9,7 @@ from eth_utils import (
 import ssz
 from ssz.exceptions import (
     DeserializationError,
+    SerializationError,
 )
 from ssz.hashable_list import (
     HashableList,
@@ -25,8 +26,12 @@ from ssz.sedes import (
     List,
     UInt,
     Vector,
+    boolean,
+    bytes4,
     bytes32,
     uint8,
+    uint16,
+    uint64,
     uint256,
 )
 
@@ -104,6 +109,43 @@ def test_container_of_static_sized_fields(value, serialized):
     assert ssz.decode(decode_hex(serialized), sedes) == value
 
 
+@pytest.mark.parametrize("hashable", (True, False))
+def test_container_of_mixed_fixed_size_fields(hashable):
+    sedes = Container(
+        (uint16, bytes4, boolean, uint256, Container((uint8, uint64)), Vector(uint8, 2))
+    )
+    value = (0x0102, b"\xaa\xbb\xcc\xdd", True, 3, (4, 5), (6, 7))
+    serialized = (
+        "0x" "0201" "aabbccdd" "01" "03" + "00" * 31 + "04" "0500000000000000" "0607"
+    )
+
+    assert encode_hex(ssz.encode(value, sedes)) == serialized
+    assert encode_hex(ssz.encode(list(value), sedes)) == serialized
+    assert sedes.get_serialized_size(value) == len(decode_hex(serialized))
+
+    decoded = ssz.decode(decode_hex(serialized), sedes, hashable=hashable)
+    assert decoded[:5] == value[:5]
+    assert tuple(decoded[5]) == value[5]
+    assert isinstance(decoded[5], HashableVector) is hashable
+
+
+@pytest.mark.parametrize(
+    ("value", "error"),
+    (
+        ((2**16, b"\x00" * 4, True), SerializationError),
+        ((-1, b"\x00" * 4, True), SerializationError),
+        ((0, b"\x00" * 3, True), SerializationError),
+        ((0, bytearray(4), 1), TypeError),
+        ((0, b"\x00" * 4), SerializationError),
+        ((0, b"\x00" * 4, True, True), SerializationError),
+    ),
+)
+def test_invalid_fixed_size_container_values(value, error):
+    sedes = Container((uint16, bytes4, boolean))
+    with pytest.raises(error):
+        ssz.encode(value, sedes)
+
+
 @pytest.mark.parametrize(
     ("fields", "value", "serialized"),
     (
@@ -138,6 +180,76 @@ def test_container_of_dynamic_sized_fields(fields, value, serialized):
     assert pure_decoded == value
 
 
+@pytest.mark.parametrize(
+    ("sedes", "value"),
+    (
+        (List(uint8, 2**32), (0xAA, 0xBB)),
+        (Vector(uint8, 2), (0xAA, 0xBB)),
+        (Vector(List(uint8, 2**32), 2), ((0xAA,), (0xBB, 0xCC))),
+        (List(Vector(uint8, 2), 2**32), ((0xAA, 0xBB), (0xCC, 0xDD))),
+        (Container((uint8, List(uint8, 2**32))), (0xAA, (0xBB, 0xCC))),
+        (Container((List(Container((uint8,)), 4),)), (((0xAA,), (0xBB,)),)),
+    ),
+)
+def test_decode_without_hash_trees(sedes, value):
+    serialized = ssz.encode(value, sedes)
+    decoded = ssz.decode(serialized, sedes, hashable=False)
+
+    assert decoded == value
+    assert type(decoded) is tuple
+    assert ssz.encode(decoded, sedes) == serialized
+    assert ssz.get_hash_tree_root(decoded, sedes) == ssz.get_hash_tree_root(
+        ssz.decode(serialized, sedes), sedes
+    )
+
+
+@pytest.mark.parametrize("hashable", (True, False))
+def test_decode_from_memoryview(hashable):
+    sedes = Container((ByteVector(2), List(ByteList(4), 4), Vector(Bitlist(8), 2)))
+    value = (b"\xaa\xbb", (b"\xcc", b"\xdd\xee"), ((True,), (False, True)))
+    serialized = ssz.encode(value, sedes)
+
+    for data in (serialized, bytearray(serialized), memoryview(serialized)):
+        decoded = ssz.decode(data, sedes, hashable=hashable)
+        assert type(decoded[0]) is bytes
+        assert all(type(element) is bytes for element in decoded[1])
+        assert ssz.encode(decoded, sedes) == serialized
+
+
+@pytest.mark.parametrize(
+    ("sedes", "serialized"),
+    (
+        # first offset does not point to end of fixed size section
+        (Container((uint8, List(uint8, 4))), "0x" "aa" "04000000"),
+        (Vector(List(uint8, 4), 2), "0x" "0c000000" "08000000"),
+        # offsets not in ascending order
+        (List(List(uint8, 4), 4), "0x" "08000000" "07000000" "aa"),
+        # offset points past the end of the data
+        (Container((List(uint8, 4), List(uint8, 4))), "0x" "08000000" "0a000000"),
+        # first offset is not a positive multiple of the offset size
+        (List(List(uint8, 4), 4), "0x" "00000000"),
+        (List(List(uint8, 4), 4), "0x" "05000000" "aa"),
+        # truncated and superfluous data
+        (Container((uint8, uint8)), "0x" "aa"),
+        (Container((uint8, uint8)), "0x" "aabbcc"),
+        # too many list elements
+        (List(uint8, 2), "0x" "aabbccdd"),
+        (List(List(uint8, 2), 1), "0x" "08000000" "09000000" "aa" "bb"),
+        (
+            Container((bytes32, List(uint8, 4))),
+            "0x" + "00" * 32 + "24000000" + "aa" * 5,
+        ),
+        # invalid field of fixed size container
+        (Container((uint8, boolean)), "0x" "aa" "02"),
+        (Vector(uint8, 2), "0x" "aabbcc"),
+    ),
+)
+def test_decode_invalid_data(sedes, serialized):
+    for hashable in (True, False):
+        with pytest.raises(DeserializationError):
+            ssz.decode(decode_hex(serialized), sedes, hashable=hashable)
+
+
 @pytest.mark.parametrize(
     ("sedes", "id"),
     (
@@ -238,3 +350,34 @@ def test_bitfield_length_boundary(sedes_type, length, is_valid):
     else:
         with pytest.raises(ValueError):
             sedes_type(length)
+
+
+@pytest.mark.parametrize(
+    "sedes", (List(uint8, 16), List(UInt(64), 16), Vector(UInt(32), 3))
+)
+def test_packed_sequences_from_arrays(sedes):
+    values = (1, 2, 3)
+    serialized = ssz.encode(values, sedes)
+    values_array = sedes.deserialize_array(serialized)
+    assert tuple(values_array) == values
+
+    assert ssz.encode(values_array, sedes) == serialized
+    assert sedes.get_hash_tree_root(values_array) == sedes.get_hash_tree_root(values)
+    assert sedes.get_serialized_size(values_array) == len(serialized)
+
+
+@pytest.mark.parametrize(
+    ("sedes", "serialized"),
+    (
+        (List(UInt(64), 16), b"\x00" * 9),
+        (Vector(UInt(32), 3), b"\x00" * 8),
+    ),
+)
+def test_invalid_deserialize_array(sedes, serialized):
+    with pytest.raises(DeserializationError):
+        sedes.deserialize_array(serialized)
+
+
+def test_deserialize_array_of_non_integers():
+    with pytest.raises(TypeError):
+        List(bytes32, 4).deserialize_array(b"")
@@ -0,0 +1,152 @@
+import pytest
+import io
+
+from hypothesis import (
+    given,
+    strategies as st,
+)
+
+import ssz
+from ssz.sedes import (
+    Bitlist,
+    Bitvector,
+    ByteList,
+    Container,
+    List,
+    Serializable,
+    Vector,
+    boolean,
+    bytes32,
+    uint8,
+    uint64,
+)
+from tests.core.hashable.hashable_strategies import (
+    composite_sedes_and_values_st,
+    to_hashable_value,
+    to_serializable_value,
+)
+
+
+class Inner(Serializable):
+    fields = (("value", uint64), ("values", List(uint8, 4)))
+
+
+class Outer(Serializable):
+    fields = (
+        ("root", bytes32),
+        ("inners", List(Inner, 4)),
+        ("data", ByteList(8)),
+        ("bits", Bitlist(8)),
+    )
+
+
+OUTER = Outer(
+    root=b"\x01" * 32,
+    inners=(Inner(value=1, values=(2, 3)), Inner(value=4, values=())),
+    data=b"\x05\x06",
+    bits=(True, False, True),
+)
+
+
+@given(st.data(), composite_sedes_and_values_st())
+def test_encode_into_and_to(data, sedes_and_values):
+    sedes, values = sedes_and_values
+    value = data.draw(values)
+    offset = data.draw(st.integers(min_value=0, max_value=3))
+
+    for encodable_value in (
+        to_serializable_value(value, sedes),
+        to_hashable_value(value, sedes),
+    ):
+        encoded = ssz.encode(encodable_value, sedes)
+        assert sedes.get_serialized_size(encodable_value) == len(encoded)
+
+        buffer = bytearray(b"\xff" * (offset + len(encoded) + 1))
+        assert ssz.encode_into(encodable_value, sedes, buffer, offset) == len(encoded)
+        assert buffer[:offset] == b"\xff" * offset
+        assert buffer[offset:-1] == encoded
+        assert buffer[-1:] == b"\xff"
+
+        stream = io.BytesIO()
+        assert ssz.encode_to(encodable_value, sedes, stream) == len(encoded)
+        assert stream.getvalue() == encoded
+
+
+def test_encode_serializable_into_buffer():
+    encoded = ssz.encode(OUTER)
+    assert Outer.get_serialized_size(OUTER) == len(encoded)
+
+    buffer = bytearray(len(encoded))
+    assert ssz.encode_into(OUTER, None, buffer) == len(encoded)
+    assert buffer == encoded
+
+    stream = io.BytesIO()
+    ssz.encode_to(OUTER, Outer, stream)
+    assert stream.getvalue() == encoded
+
+    sedes = Container((uint8, List(Outer, 2)))
+    value = (1, (OUTER, OUTER))
+    buffer = bytearray(sedes.get_serialized_size(value))
+    ssz.encode_into(value, sedes, memoryview(buffer))
+    assert buffer == ssz.encode(value, sedes)
+
+
+@pytest.mark.parametrize(
+    ("buffer", "offset", "error"),
+    (
+        (bytearray(3), 0, ValueError),
+        (bytearray(8), 1, ValueError),
+        (bytearray(8), -1, ValueError),
+        (bytes(8), 0, TypeError),
+    ),
+)
+def test_encode_into_invalid_buffer(buffer, offset, error):
+    with pytest.raises(error):
+        ssz.encode_into(1, uint64, buffer, offset)
+
+
+@pytest.mark.parametrize(
+    ("sedes", "value"),
+    (
+        (uint8, 1),
+        (uint64, 1),
+        (boolean, True),
+        (bytes32, b"\x00" * 32),
+        (ByteList(8), b"\x01\x02"),
+        (Bitlist(16), (True,) * 9),
+        (Bitvector(9), (True,) * 9),
+        (List(uint64, 8), (1, 2, 3)),
+        (Vector(List(uint8, 4), 2), ((1,), (2, 3))),
+        (Container((uint8, List(uint8, 4), ByteList(4))), (1, (2,), b"\x03")),
+        (Outer, OUTER),
+    ),
+)
+def test_get_serialized_size(sedes, value):
+    assert sedes.get_serialized_size(value) == len(ssz.encode(value, sedes))
+
+
+def test_serialized_size_memoization():
+    sedes = List(List(uint8, 4), 4)
+    value = ssz.decode(ssz.encode(((1, 2), (3,)), sedes), sedes)
+    assert value._serialized_size_cache is None
+    assert sedes.get_serialized_size(value) == 11
+    assert value._serialized_size_cache == 11
+    assert value[0]._serialized_size_cache == 2
+
+    updated_value = value.append((4, 5, 6))
+    assert updated_value._serialized_size_cache is None
+    assert sedes.get_serialized_size(updated_value) == 18
+
+    serializable_value = OUTER.copy()
+    size = Outer.get_serialized_size(serializable_value)
+    assert serializable_value._serialized_size_cache == size
+    serializable_value.reset_cache()
+    assert serializable_value._serialized_size_cache is None
+    assert Outer.get_serialized_size(serializable_value) == size
+
+
+def test_get_serialized_size_of_invalid_value():
+    with pytest.raises(ssz.SerializationError):
+        Vector(List(uint8, 2), 2).get_serialized_size(((1,),))
+    with pytest.raises(ssz.SerializationError):
+        Bitlist(2).get_serialized_size((True,) * 3)